@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Landmark Augmentation
+Vectorized random rotation, scale, translation, mirroring and jitter of (N, 21, 3) landmark batches
+"""
+
+import math
+import numpy as np
+from typing import Iterator, Optional, Tuple
+
+from landmarks import FEATURE_SIZE, NUM_LANDMARKS
+
+# Rows of precomputed Gaussian jitter; drawing fresh normals would cost ~5x the rest of augment()
+JITTER_POOL_SIZE = 16384
+
+# Landmark the in-plane transform pivots around (middle finger MCP)
+PIVOT_LANDMARK = 9
+
+class LandmarkAugmenter:
+    """Random geometric augmentation applied to whole landmark batches at once
+
+    Every sample gets its own in-plane rotation, scale and optional mirroring about the palm
+    center plus a translation; z is scaled with the hand and every joint gets Gaussian jitter,
+    gathered as random rows of a precomputed noise table.
+    """
+
+    def __init__(self, rotation_degrees: float = 15.0, scale_range: Tuple[float, float] = (0.9, 1.1),
+                 translation: float = 0.05, mirror_probability: float = 0.5, jitter: float = 0.005,
+                 seed: Optional[int] = None):
+        self.rotation = math.radians(rotation_degrees)
+        self.scale_range = scale_range
+        self.translation = translation
+        self.mirror_probability = mirror_probability
+        self.jitter = jitter
+        self.rng = np.random.default_rng(seed)
+        self._jitter_pool = self.rng.standard_normal((JITTER_POOL_SIZE, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._jitter_pool *= np.float32(jitter)
+
+    def augment(self, landmarks: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Augment a (N, 63) or (N, 21, 3) float32 batch, returning the same shape"""
+        shape = landmarks.shape
+        points = np.asarray(landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+        n = len(points)
+        if out is None:
+            out = np.empty(shape, dtype=np.float32)
+        result = out.reshape(n, NUM_LANDMARKS, 3)
+
+        rng = self.rng
+        angle = rng.uniform(-self.rotation, self.rotation, n).astype(np.float32)
+        scale = rng.uniform(*self.scale_range, n).astype(np.float32)
+        mirror = np.where(rng.random(n, dtype=np.float32) < self.mirror_probability,
+                          np.float32(-1.0), np.float32(1.0))
+        cos = np.cos(angle) * scale
+        sin = np.sin(angle) * scale
+
+        # Row-vector transform p @ M: x' = cos*m*x - sin*y, y' = sin*m*x + cos*y, z' = scale*z
+        transform = np.zeros((n, 3, 3), dtype=np.float32)
+        transform[:, 0, 0] = cos * mirror
+        transform[:, 1, 0] = -sin
+        transform[:, 0, 1] = sin * mirror
+        transform[:, 1, 1] = cos
+        transform[:, 2, 2] = scale
+
+        # Rotate about the middle finger MCP (palm center) so the hand stays in place
+        pivot = points[:, PIVOT_LANDMARK, :2]
+        offset = np.zeros((n, 1, 3), dtype=np.float32)
+        offset[:, 0, :2] = pivot - np.matmul(pivot[:, None, :], transform[:, :2, :2])[:, 0]
+        offset[:, 0, :2] += rng.uniform(-self.translation, self.translation, (n, 2)).astype(np.float32)
+
+        # One batched 3x3 matmul moves every joint of every sample
+        np.matmul(points, transform, out=result)
+        result += offset
+
+        if self.jitter > 0:
+            result += self._jitter_pool[rng.integers(0, JITTER_POOL_SIZE, n)]
+
+        return out
+
+    def __call__(self, landmarks: np.ndarray) -> np.ndarray:
+        return self.augment(landmarks)
+
+def augmented_batches(X: np.ndarray, y: np.ndarray, batch_size: int, augmenter: LandmarkAugmenter,
+                      shuffle: bool = True, block_size: int = 8192) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Endless (features, labels) batches with fresh augmentation every epoch, for model.fit
+
+    Samples are augmented a block of several batches at a time so per-call overhead stays
+    negligible at small batch sizes. Use steps_per_epoch=batches_per_epoch(len(X), batch_size).
+    """
+    X = np.asarray(X, dtype=np.float32).reshape(-1, FEATURE_SIZE)
+    y = np.asarray(y)
+    block_size = max(1, block_size // batch_size) * batch_size
+    while True:
+        order = augmenter.rng.permutation(len(X)) if shuffle else np.arange(len(X))
+        for block_start in range(0, len(X), block_size):
+            indices = order[block_start:block_start + block_size]
+            # A fresh block per iteration: Keras may still hold earlier batches in its prefetch queue
+            features = augmenter.augment(X[indices])
+            labels = y[indices]
+            for start in range(0, len(indices), batch_size):
+                yield features[start:start + batch_size], labels[start:start + batch_size]
+
+def batches_per_epoch(num_samples: int, batch_size: int) -> int:
+    """Generator steps covering every sample once"""
+    return (num_samples + batch_size - 1) // batch_size
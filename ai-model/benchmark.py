@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet AI Model Benchmarks
+Microbenchmarks for the hot paths of the training and prediction scripts
+"""
+
+import os
+import sys
+import json
+import argparse
+import platform
+import itertools
+import time
+from datetime import datetime
+import numpy as np
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Stages timed by the suite, in pipeline order
+SUITE_STAGES = ("extract_hand_landmarks", "predict_sign", "smooth_predictions", "process_frame", "end_to_end")
+
+# Latency fields compared against a baseline
+REGRESSION_METRICS = ("p50_us", "p95_us", "p99_us")
+
+# Runs in a fresh interpreter so every import and load is cold
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from predict import SignLanguagePredictor
+imported = time.perf_counter()
+predictor = SignLanguagePredictor(model_dir=sys.argv[1], backend=sys.argv[2])
+constructed = time.perf_counter()
+predictor.warmup(detector=sys.argv[3] == "1")
+warmed = time.perf_counter()
+predictor.predict_sign(__import__("numpy").zeros(predictor.num_features, dtype="float32"))
+first = time.perf_counter()
+report = {
+    "import_predict": imported - start,
+    "construct": constructed - imported,
+    "warmup": warmed - constructed,
+    "first_prediction": first - warmed,
+    "phases": predictor.startup_timings,
+    "modules": [m for m in ("cv2", "mediapipe", "tensorflow", "sklearn") if m in sys.modules],
+}
+print("STARTUP_JSON " + json.dumps(report))
+"""
+
+def time_calls(fn, iterations=500, warmup=20):
+    """Call fn repeatedly and return per-call latencies in seconds"""
+    for _ in range(warmup):
+        fn()
+
+    samples = np.empty(iterations, dtype=np.float64)
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples[i] = time.perf_counter() - start
+
+    return samples
+
+def summarize(name, samples):
+    """Print mean and median latency for a benchmark"""
+    mean_us = samples.mean() * 1e6
+    p50_us = np.percentile(samples, 50) * 1e6
+    print(f"{name:<40} mean {mean_us:10.1f} us   p50 {p50_us:10.1f} us")
+    return {'name': name, 'mean_us': mean_us, 'p50_us': p50_us}
+
+def bench_predict(model_dir="./models", iterations=500, batch_size=64):
+    """Compare Keras predict() against the compiled predict_sign/predict_batch path"""
+    from predict import SignLanguagePredictor
+
+    # The Keras backend is needed to time model.predict() as the baseline
+    predictor = SignLanguagePredictor(model_dir=model_dir, backend="keras")
+    if predictor.model is None:
+        print("❌ Model not loaded. Please train a model first.")
+        return 1
+
+    rng = np.random.default_rng(0)
+    frame = rng.random(predictor.num_features, dtype=np.float32)
+    batch = rng.random((batch_size, predictor.num_features), dtype=np.float32)
+
+    def keras_predict():
+        prediction = predictor.model.predict(frame.reshape(1, -1), verbose=0)
+        idx = np.argmax(prediction[0])
+        predictor.label_encoder.inverse_transform([idx])
+
+    print(f"\nPer-call latency over {iterations} iterations:")
+    before = summarize("model.predict + inverse_transform", time_calls(keras_predict, iterations))
+    after = summarize("predict_sign (compiled)", time_calls(lambda: predictor.predict_sign(frame), iterations))
+    batched = summarize(f"predict_batch (N={batch_size})", time_calls(lambda: predictor.predict_batch(batch), iterations))
+
+    print(f"\npredict_sign speedup: {before['mean_us'] / after['mean_us']:.1f}x")
+    print(f"predict_batch per frame: {batched['mean_us'] / batch_size:.1f} us")
+
+    numpy_predictor = SignLanguagePredictor(model_dir=model_dir, backend="numpy")
+    if numpy_predictor.model is not None:
+        summarize("predict_sign (numpy backend)", time_calls(lambda: numpy_predictor.predict_sign(frame), iterations))
+        summarize(f"predict_batch (numpy, N={batch_size})", time_calls(lambda: numpy_predictor.predict_batch(batch), iterations))
+    return 0
+
+class _FakeLandmark:
+    """Stand-in for a MediaPipe NormalizedLandmark"""
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+class _FakeHand:
+    """Stand-in for a MediaPipe NormalizedLandmarkList"""
+
+    def __init__(self, rng):
+        self.landmark = [_FakeLandmark(*map(float, rng.random(3))) for _ in range(21)]
+
+def bench_flatten(iterations=20000):
+    """Compare list-based landmark flattening against writing into a preallocated buffer"""
+    from landmarks import allocate_features, flatten_landmarks
+
+    hand = _FakeHand(np.random.default_rng(0))
+    batch = allocate_features(64)
+
+    def list_extend():
+        landmarks = []
+        for landmark in hand.landmark:
+            landmarks.extend([landmark.x, landmark.y, landmark.z])
+        return np.array(landmarks)
+
+    print(f"\nPer-frame landmark flattening over {iterations} iterations:")
+    before = summarize("list.extend + np.array (float64)", time_calls(list_extend, iterations))
+    summarize("flatten_landmarks (new float32)", time_calls(lambda: flatten_landmarks(hand), iterations))
+    after = summarize("flatten_landmarks (into batch row)", time_calls(lambda: flatten_landmarks(hand, batch[7]), iterations))
+
+    print(f"\nSaving per frame: {before['mean_us'] - after['mean_us']:.2f} us "
+          f"({before['mean_us'] / after['mean_us']:.1f}x)")
+    return 0
+
+def bench_augment(batch_size=8192, iterations=200):
+    """Landmark augmentation throughput on one core"""
+    from augment import LandmarkAugmenter
+
+    rng = np.random.default_rng(0)
+    batch = rng.random((batch_size, 63), dtype=np.float32)
+    out = np.empty_like(batch)
+    augmenter = LandmarkAugmenter(seed=0)
+
+    print(f"\nLandmark augmentation over {iterations} batches of {batch_size}:")
+    result = summarize(f"augment (N={batch_size})", time_calls(lambda: augmenter.augment(batch, out), iterations))
+    print(f"\nThroughput: {batch_size / result['mean_us']:.2f} M samples/sec")
+    return 0
+
+def bench_sequence(model_dir="./models", iterations=3000, fps=30.0):
+    """Per-frame cost of streaming sequence inference against recomputing the whole window"""
+    from sequence_model import DILATIONS, FILTERS, KERNEL_SIZE, WINDOW, SequenceModel, load_latest_sequence_model
+
+    model = load_latest_sequence_model(model_dir)
+    if model is None:
+        # Cost depends only on the architecture, so random weights stand in for an untrained model
+        print("No sequence model found; timing the default architecture with random weights")
+        rng = np.random.default_rng(0)
+        conv_layers = []
+        channels = 63
+        for dilation in DILATIONS:
+            conv_layers.append((rng.standard_normal((KERNEL_SIZE, channels, FILTERS), dtype=np.float32) * 0.1,
+                                np.zeros(FILTERS, dtype=np.float32), dilation))
+            channels = FILTERS
+        dense = (rng.standard_normal((FILTERS, 3), dtype=np.float32), np.zeros(3, dtype=np.float32))
+        model = SequenceModel(conv_layers, dense, np.array(["J", "Z", "none"]), WINDOW)
+
+    rng = np.random.default_rng(1)
+    frames = rng.random((256, model.num_features), dtype=np.float32)
+    stream = model.stream()
+    counter = itertools.count()
+
+    print(f"\nSequence model ({model.input_length} frame window, dilations {model.dilations}) "
+          f"over {iterations} frames:")
+    streaming = summarize("SequenceStream.update (incremental)",
+                          time_calls(lambda: stream.update(frames[next(counter) % len(frames)]), iterations))
+    window = stream.window.view()[None]
+    full = summarize("predict_proba (whole window)", time_calls(lambda: model.predict_proba(window), iterations))
+
+    print(f"\nIncremental speedup: {full['mean_us'] / streaming['mean_us']:.1f}x")
+    print(f"Streams per core at {fps:g} FPS: {1e6 / (streaming['mean_us'] * fps):.0f}")
+    return 0
+
+def bench_knn(index_path=None, sizes=(10000, 100000), iterations=1000, k=5):
+    """Single-query k-NN latency of a saved index, or of synthetic indexes of the given sizes
+
+    Synthetic landmarks are clustered per class like real hand shapes; each size is timed with a
+    full scan and, when partitioned, with the default probes plus their top-1 agreement.
+    """
+    from knn_index import BRUTE_FORCE_LIMIT, LandmarkIndex, build_index
+
+    rng = np.random.default_rng(0)
+    if index_path is not None:
+        indexes = [(index_path, LandmarkIndex.load(index_path))]
+    else:
+        prototypes = rng.random((26, 63), dtype=np.float32)
+        indexes = []
+        for size in sizes:
+            classes = rng.integers(0, len(prototypes), size)
+            landmarks = prototypes[classes] + rng.normal(0, 0.02, (size, 63)).astype(np.float32)
+            indexes.append((f"synthetic {size}", build_index(landmarks, [chr(65 + c) for c in classes], k=k)))
+
+    for name, index in indexes:
+        stored = np.asarray(index.vectors[rng.integers(0, len(index), iterations)])
+        queries = stored + rng.normal(0, 0.01, stored.shape).astype(np.float32)
+        counter = itertools.count()
+
+        def query():
+            index.search(queries[next(counter) % iterations], k, normalized=True)
+
+        print(f"\n{name}: {len(index)} vectors, {len(index.centroids)} partitions "
+              f"(full scan up to {BRUTE_FORCE_LIMIT}):")
+        probed = summarize(f"search, nprobe {index.nprobe}" if index.partitioned else "search, full scan",
+                           time_calls(query, iterations))
+        if index.partitioned:
+            nprobe = index.nprobe
+            approximate = index.search(queries, 1, normalized=True)[1]
+            index.nprobe = len(index.centroids)
+            exact = index.search(queries, 1, normalized=True)[1]
+            summarize("search, full scan", time_calls(query, min(iterations, 100)))
+            index.nprobe = nprobe
+            print(f"Top-1 agreement with full scan: {np.mean(approximate == exact):.3f}")
+        print(f"Queries per core per second: {1e6 / probed['mean_us']:.0f}")
+
+    return 0
+
+def reset_peak_rss():
+    """Reset the kernel's peak RSS counter so the next reading covers one stage (Linux only)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def peak_rss_mb():
+    """Peak resident set size in MiB (since the last reset where supported)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # ru_maxrss is KiB on Linux and bytes on macOS, and cannot be reset
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_stage(fn, iterations, warmup=10):
+    """Time one stage and report latency percentiles, throughput and peak RSS"""
+    resettable = reset_peak_rss()
+    samples = time_calls(fn, iterations, warmup)
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99]) * 1e6
+    return {
+        'iterations': int(iterations),
+        'mean_us': float(samples.mean() * 1e6),
+        'p50_us': float(p50),
+        'p95_us': float(p95),
+        'p99_us': float(p99),
+        'max_us': float(samples.max() * 1e6),
+        'fps': float(1.0 / samples.mean()),
+        'peak_rss_mb': peak_rss_mb(),
+        'peak_rss_per_stage': resettable,
+    }
+
+def synthetic_frames(count=8, width=640, height=480, seed=0):
+    """Smooth random BGR frames; MediaPipe finds no hand in them, so they time the no-hand path"""
+    import cv2
+
+    rng = np.random.default_rng(seed)
+    frames = []
+    for _ in range(count):
+        small = rng.integers(0, 256, (height // 16, width // 16, 3), dtype=np.uint8)
+        frames.append(cv2.resize(small, (width, height), interpolation=cv2.INTER_LINEAR))
+    return frames
+
+def load_image_frames(image_dir, limit=64):
+    """Up to limit (decoded frame, encoded bytes) pairs from a directory tree of sample images"""
+    import cv2
+
+    paths = []
+    for root, _, files in os.walk(image_dir):
+        paths.extend(os.path.join(root, f) for f in files if f.lower().endswith(IMAGE_EXTENSIONS))
+
+    frames, encoded = [], []
+    for path in sorted(paths)[:limit]:
+        with open(path, 'rb') as f:
+            data = np.frombuffer(f.read(), dtype=np.uint8)
+        frame = cv2.imdecode(data, cv2.IMREAD_COLOR)
+        if frame is not None:
+            frames.append(frame)
+            encoded.append(data)
+    return frames, encoded
+
+def bench_stages(predictor, frames, encoded, iterations):
+    """Time every suite stage over one set of frames"""
+    import cv2
+
+    rng = np.random.default_rng(0)
+    landmark_pool = rng.random((256, predictor.num_features), dtype=np.float32)
+
+    # Classify real landmarks where the frames contain hands
+    detected = [lm.copy() for lm in map(predictor.extract_hand_landmarks, frames) if lm is not None]
+    if detected:
+        landmark_pool = np.stack(detected)
+
+    labels = [str(label) for label in predictor.class_labels]
+    next_frame = itertools.cycle(frames).__next__
+    next_encoded = itertools.cycle(encoded).__next__
+    next_landmarks = itertools.cycle(landmark_pool).__next__
+    next_vote = itertools.cycle([(labels[i], float(c)) for i, c in zip(
+        rng.integers(0, len(labels), 1024), rng.random(1024))]).__next__
+
+    stages = {
+        "extract_hand_landmarks": lambda: predictor.extract_hand_landmarks(next_frame()),
+        "predict_sign": lambda: predictor.predict_sign(next_landmarks()),
+        "smooth_predictions": lambda: predictor.smooth_predictions(*next_vote()),
+        # process_frame draws landmarks in place; a copy keeps the cycled frames pristine for
+        # the other stages (the copy is timed, like the decode in end_to_end)
+        "process_frame": lambda: predictor.process_frame(next_frame().copy()),
+        # Decode from compressed bytes, as frames arrive from a camera or client
+        "end_to_end": lambda: predictor.process_frame(cv2.imdecode(next_encoded(), cv2.IMREAD_COLOR)),
+    }
+
+    results = {}
+    for name in SUITE_STAGES:
+        results[name] = run_stage(stages[name], iterations)
+        results[name]['hand_rate'] = len(detected) / len(frames)
+        print(f"  {name:<24} p50 {results[name]['p50_us']:10.1f} us   p95 {results[name]['p95_us']:10.1f} us   "
+              f"p99 {results[name]['p99_us']:10.1f} us   {results[name]['fps']:10.1f} fps")
+    return results
+
+def compare_to_baseline(results, baseline, tolerance=0.10):
+    """List (suite/stage, metric, baseline, current) entries that got slower by more than tolerance"""
+    regressions = []
+    for suite, stages in results['suites'].items():
+        for stage, current in stages.items():
+            previous = baseline.get('suites', {}).get(suite, {}).get(stage)
+            if previous is None:
+                continue
+            for metric in REGRESSION_METRICS:
+                if current[metric] > previous[metric] * (1 + tolerance):
+                    regressions.append({
+                        'stage': f"{suite}/{stage}",
+                        'metric': metric,
+                        'baseline': previous[metric],
+                        'current': current[metric],
+                        'change': current[metric] / previous[metric] - 1,
+                    })
+    return regressions
+
+def bench_suite(model_dir="./models", backend="auto", image_dir=None, iterations=300, width=640, height=480,
+                output=None, baseline=None, tolerance=0.10, headless=False):
+    """Per-stage and end-to-end latency, FPS and peak RSS, as JSON with optional baseline comparison"""
+    import cv2
+    from predict import SignLanguagePredictor
+
+    predictor = SignLanguagePredictor(model_dir=model_dir, backend=backend, headless=headless)
+    if predictor.model is None:
+        print("❌ Model not loaded. Please train a model first.")
+        return 1
+
+    frames = synthetic_frames(width=width, height=height)
+    sources = {"synthetic": (frames, [cv2.imencode(".jpg", f)[1] for f in frames])}
+    if image_dir:
+        image_frames, encoded = load_image_frames(image_dir)
+        if not image_frames:
+            print(f"❌ No images found in {image_dir}")
+            return 1
+        sources["images"] = (image_frames, encoded)
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'opencv': cv2.__version__,
+            'backend': predictor.current_model.backend,
+            'model_version': predictor.current_model.version,
+            'iterations': iterations,
+            'frame_size': [width, height],
+            'image_dir': image_dir,
+            'headless': headless,
+        },
+        'suites': {},
+    }
+
+    for name, (source_frames, encoded) in sources.items():
+        print(f"\n{name} ({len(source_frames)} frames, {iterations} iterations per stage):")
+        # Fresh smoothing state so runs are comparable
+        predictor.smoother = predictor.create_smoother()
+        results['suites'][name] = bench_stages(predictor, source_frames, encoded, iterations)
+
+    exit_code = 0
+    if baseline:
+        with open(baseline, 'r') as f:
+            regressions = compare_to_baseline(results, json.load(f), tolerance)
+        results['baseline'] = {'path': baseline, 'tolerance': tolerance, 'regressions': regressions}
+
+        if regressions:
+            exit_code = 1
+            print(f"\n❌ {len(regressions)} regression(s) over {tolerance:.0%} against {baseline}:")
+            for r in regressions:
+                print(f"  {r['stage']:<40} {r['metric']:<7} {r['baseline']:10.1f} -> {r['current']:10.1f} us "
+                      f"({r['change']:+.0%})")
+        else:
+            print(f"\n✅ No regressions over {tolerance:.0%} against {baseline}")
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to: {output}")
+    else:
+        print(json.dumps(results, indent=2))
+
+    return exit_code
+
+def bench_startup(model_dir="./models", backend="auto", runs=3, detector=True):
+    """Cold-start breakdown measured in fresh interpreters: imports, model load, warmup, first prediction"""
+    import subprocess
+
+    reports = []
+    here = os.path.dirname(os.path.abspath(__file__))
+    for run in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT, model_dir, backend, "1" if detector else "0"],
+            cwd=here, capture_output=True, text=True
+        )
+        wall = time.perf_counter() - start
+
+        lines = [line for line in completed.stdout.splitlines() if line.startswith("STARTUP_JSON ")]
+        if completed.returncode != 0 or not lines:
+            print(f"❌ Startup run {run + 1} failed:\n{completed.stderr or completed.stdout}")
+            return 1
+
+        report = json.loads(lines[-1][len("STARTUP_JSON "):])
+        report["process_wall"] = wall
+        reports.append(report)
+
+    def median(values):
+        return float(np.median(values)) * 1000
+
+    print(f"\nCold start over {runs} fresh process(es) (backend {backend}, median ms):")
+    for key in ("import_predict", "construct", "warmup", "first_prediction", "process_wall"):
+        print(f"  {key:<22} {median([r[key] for r in reports]):9.1f}")
+    for phase in reports[0]["phases"]:
+        print(f"    {phase:<20} {median([r['phases'].get(phase, 0.0) for r in reports]):9.1f}")
+    print(f"  heavy modules loaded:  {', '.join(reports[0]['modules']) or 'none'}")
+    return 0
+
+def bench_motion_gate(video_path, model_dir="./models", threshold=6.0, refresh_interval=10, max_frames=None):
+    """Replay a video with and without skip-detection and report skip ratio, speed and agreement"""
+    from predict import SignLanguagePredictor
+    from transcribe import iter_video_frames
+
+    baseline = SignLanguagePredictor(model_dir=model_dir)
+    gated = SignLanguagePredictor(model_dir=model_dir, motion_threshold=threshold,
+                                  refresh_interval=refresh_interval)
+    if baseline.model is None:
+        print("❌ Model not loaded. Please train a model first.")
+        return 1
+
+    frames = 0
+    agree = 0
+    baseline_time = 0.0
+    gated_time = 0.0
+    for _, _, frame in iter_video_frames(video_path):
+        start = time.perf_counter()
+        expected = baseline.recognize(frame)[0]
+        middle = time.perf_counter()
+        actual = gated.recognize(frame)[0]
+        gated_time += time.perf_counter() - middle
+        baseline_time += middle - start
+
+        frames += 1
+        agree += expected == actual
+        if max_frames and frames >= max_frames:
+            break
+
+    if not frames:
+        print(f"❌ No frames read from {video_path}")
+        return 1
+
+    print(f"\nSkip-detection on {video_path} ({frames} frames, threshold {threshold}, refresh every {refresh_interval}):")
+    print(f"  skip ratio:            {gated.motion_gate.skip_ratio:.1%}")
+    print(f"  time per frame:        {baseline_time / frames * 1000:.2f} ms -> {gated_time / frames * 1000:.2f} ms")
+    print(f"  agreement w/ baseline: {agree / frames:.1%}")
+    return 0
+
+def main(argv=None):
+    """Main function to run benchmarks"""
+    parser = argparse.ArgumentParser(description="SignSync Meet AI model benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    predict_parser = subparsers.add_parser("predict", help="Single-frame and batched prediction latency")
+    predict_parser.add_argument("--model-dir", default="./models")
+    predict_parser.add_argument("--iterations", type=int, default=500)
+    predict_parser.add_argument("--batch-size", type=int, default=64)
+
+    flatten_parser = subparsers.add_parser("flatten", help="Landmark flattening cost per frame")
+    flatten_parser.add_argument("--iterations", type=int, default=20000)
+
+    augment_parser = subparsers.add_parser("augment", help="Landmark augmentation throughput")
+    augment_parser.add_argument("--batch-size", type=int, default=8192)
+    augment_parser.add_argument("--iterations", type=int, default=200)
+
+    suite_parser = subparsers.add_parser("suite", help="Per-stage latency percentiles, FPS and peak RSS as JSON")
+    suite_parser.add_argument("--model-dir", default="./models")
+    suite_parser.add_argument("--backend", choices=("auto", "numpy", "keras"), default="auto")
+    suite_parser.add_argument("--image-dir", default=None, help="Also run every stage on these sample images")
+    suite_parser.add_argument("--iterations", type=int, default=300)
+    suite_parser.add_argument("--width", type=int, default=640, help="Synthetic frame width")
+    suite_parser.add_argument("--height", type=int, default=480, help="Synthetic frame height")
+    suite_parser.add_argument("--output", default=None, help="Write JSON results here (default: stdout)")
+    suite_parser.add_argument("--baseline", default=None, help="Earlier --output file to check for regressions")
+    suite_parser.add_argument("--tolerance", type=float, default=0.10,
+                              help="Allowed latency increase before a stage is flagged (0.10 = 10%%)")
+    suite_parser.add_argument("--headless", action="store_true", help="Benchmark process_frame without drawing")
+
+    startup_parser = subparsers.add_parser("startup", help="Cold-start time breakdown in fresh processes")
+    startup_parser.add_argument("--model-dir", default="./models")
+    startup_parser.add_argument("--backend", choices=("auto", "numpy", "keras"), default="auto")
+    startup_parser.add_argument("--runs", type=int, default=3)
+    startup_parser.add_argument("--no-detector", action="store_true", help="Skip MediaPipe initialization")
+
+    sequence_parser = subparsers.add_parser("sequence", help="Per-frame cost of streaming sequence inference")
+    sequence_parser.add_argument("--model-dir", default="./models")
+    sequence_parser.add_argument("--iterations", type=int, default=3000)
+    sequence_parser.add_argument("--fps", type=float, default=30.0, help="Frame rate of each stream")
+
+    knn_parser = subparsers.add_parser("knn", help="Nearest-neighbour landmark index query latency")
+    knn_parser.add_argument("--index", default=None, help="Saved index directory (default: synthetic indexes)")
+    knn_parser.add_argument("--sizes", default="10000,100000", help="Comma-separated synthetic index sizes")
+    knn_parser.add_argument("--iterations", type=int, default=1000)
+    knn_parser.add_argument("--k", type=int, default=5)
+
+    motion_parser = subparsers.add_parser("motion-gate", help="Skip ratio and accuracy impact of skip-detection")
+    motion_parser.add_argument("video")
+    motion_parser.add_argument("--model-dir", default="./models")
+    motion_parser.add_argument("--threshold", type=float, default=6.0)
+    motion_parser.add_argument("--refresh-interval", type=int, default=10)
+    motion_parser.add_argument("--max-frames", type=int, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.benchmark == "predict":
+        return bench_predict(args.model_dir, args.iterations, args.batch_size)
+    if args.benchmark == "flatten":
+        return bench_flatten(args.iterations)
+    if args.benchmark == "augment":
+        return bench_augment(args.batch_size, args.iterations)
+    if args.benchmark == "suite":
+        return bench_suite(args.model_dir, args.backend, args.image_dir, args.iterations, args.width, args.height,
+                           args.output, args.baseline, args.tolerance, args.headless)
+    if args.benchmark == "startup":
+        return bench_startup(os.path.abspath(args.model_dir), args.backend, args.runs, not args.no_detector)
+    if args.benchmark == "sequence":
+        return bench_sequence(args.model_dir, args.iterations, args.fps)
+    if args.benchmark == "knn":
+        return bench_knn(args.index, [int(size) for size in args.sizes.split(',') if size], args.iterations, args.k)
+    if args.benchmark == "motion-gate":
+        return bench_motion_gate(args.video, args.model_dir, args.threshold, args.refresh_interval, args.max_frames)
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Landmark Drawing
+Draws flat landmark vectors straight onto frames with OpenCV, using MediaPipe's hand styles cached once
+"""
+
+import cv2
+import numpy as np
+import mediapipe as mp
+from typing import Dict, List, Tuple
+
+from landmarks import NUM_LANDMARKS
+
+WHITE = (224, 224, 224)
+
+class HandDrawer:
+    """In-place hand skeleton renderer matching mp.solutions.drawing_utils.draw_landmarks
+
+    Styles and connection indices are resolved once; each draw only scales 21 points and
+    issues one polylines call per connection style plus the landmark circles.
+    Scratch buffers are reused between calls, so use one drawer per drawing thread.
+    """
+
+    def __init__(self):
+        styles = mp.solutions.drawing_styles
+        landmark_style = styles.get_default_hand_landmarks_style()
+        connection_style = styles.get_default_hand_connections_style()
+
+        # (color, thickness, radius, border radius) per landmark index
+        self.landmark_specs: List[Tuple[tuple, int, int, int]] = []
+        for index in range(NUM_LANDMARKS):
+            spec = landmark_style[mp.solutions.hands.HandLandmark(index)]
+            border = max(spec.circle_radius + 1, int(spec.circle_radius * 1.2))
+            self.landmark_specs.append((tuple(spec.color), spec.thickness, spec.circle_radius, border))
+
+        # Connections grouped by (color, thickness) as (K, 2) index arrays
+        groups: Dict[Tuple[tuple, int], List[Tuple[int, int]]] = {}
+        for connection in sorted(mp.solutions.hands.HAND_CONNECTIONS):
+            spec = connection_style[connection]
+            groups.setdefault((tuple(spec.color), spec.thickness), []).append(connection)
+        self.connection_groups = [(style, np.array(pairs, dtype=np.intp)) for style, pairs in groups.items()]
+
+        self._scaled = np.empty((NUM_LANDMARKS, 2), dtype=np.float32)
+        self._pixels = np.empty((NUM_LANDMARKS, 2), dtype=np.int32)
+        self._visible = np.empty(NUM_LANDMARKS, dtype=bool)
+
+    def draw(self, frame: np.ndarray, landmarks: np.ndarray) -> np.ndarray:
+        """Draw one hand (63 normalized values) onto frame in place and return it"""
+        h, w = frame.shape[:2]
+        xy = landmarks.reshape(-1, 3)[:, :2]
+
+        # Like MediaPipe, points outside the frame are not drawn
+        np.logical_and((xy >= 0.0).all(axis=1), (xy <= 1.0).all(axis=1), out=self._visible)
+        np.multiply(xy, (w, h), out=self._scaled)
+        np.minimum(self._scaled, (w - 1, h - 1), out=self._scaled)
+        np.copyto(self._pixels, self._scaled, casting='unsafe')
+
+        visible = self._visible
+        pixels = self._pixels
+        for (color, thickness), pairs in self.connection_groups:
+            shown = pairs[visible[pairs].all(axis=1)]
+            if len(shown):
+                cv2.polylines(frame, pixels[shown], False, color, thickness)
+
+        for index, (color, thickness, radius, border) in enumerate(self.landmark_specs):
+            if visible[index]:
+                center = (int(pixels[index, 0]), int(pixels[index, 1]))
+                cv2.circle(frame, center, border, WHITE, thickness)
+                cv2.circle(frame, center, radius, color, thickness)
+
+        return frame
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Gesture Library
+Resolves text to playlists of gesture clips and serves the clips with HTTP range requests from memory maps
+"""
+
+import os
+import re
+import sys
+import json
+import mmap
+import struct
+import argparse
+import threading
+from functools import lru_cache, partial
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+CLIP_EXTENSION = ".mp4"
+DEFAULT_CLIP = "default"
+
+# Per-letter clips live in this subdirectory (a.mp4 ... z.mp4); single-letter files at the top level also count
+LETTERS_DIR = "letters"
+
+# Trie node key marking the end of a phrase
+_END = ""
+
+# Bytes per socket write when streaming a range; the slices are views of the memory map
+CHUNK_SIZE = 256 * 1024
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Lowercase words of text; apostrophes are dropped so "don't" matches dont.mp4"""
+    return tuple(re.findall(r"[a-z0-9]+", text.lower().replace("'", "")))
+
+def read_mp4_info(path: str) -> Dict:
+    """Duration and top-level moov/mdat byte ranges of an MP4 file, read from box headers only
+
+    Missing or malformed boxes leave their fields as None, so placeholder files still index.
+    """
+    info = {"duration": None, "moov": None, "mdat": None}
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        offset = 0
+        while offset + 8 <= size:
+            f.seek(offset)
+            box_size, box_type = struct.unpack(">I4s", f.read(8))
+            header = 8
+            if box_size == 1:
+                box_size = struct.unpack(">Q", f.read(8))[0]
+                header = 16
+            elif box_size == 0:
+                box_size = size - offset
+            if box_size < header:
+                break
+
+            if box_type == b"moov":
+                info["moov"] = (offset, box_size)
+                info["duration"] = _read_mvhd_duration(f, offset + header, offset + box_size)
+            elif box_type == b"mdat":
+                info["mdat"] = (offset, box_size)
+            offset += box_size
+
+    return info
+
+def _read_mvhd_duration(f, start: int, end: int) -> Optional[float]:
+    """Seconds from the mvhd box among moov's children"""
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        box_size, box_type = struct.unpack(">I4s", f.read(8))
+        if box_size < 8:
+            return None
+        if box_type == b"mvhd":
+            version = f.read(4)[0]
+            if version == 1:
+                _, _, timescale, duration = struct.unpack(">QQIQ", f.read(28))
+            else:
+                _, _, timescale, duration = struct.unpack(">IIII", f.read(16))
+            return duration / timescale if timescale else None
+        offset += box_size
+    return None
+
+class Clip:
+    """One indexed gesture clip"""
+
+    def __init__(self, name: str, path: str):
+        stat = os.stat(path)
+        self.name = name
+        self.path = path
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        try:
+            info = read_mp4_info(path)
+        except (OSError, struct.error, IndexError):
+            info = {"duration": None, "moov": None, "mdat": None}
+        self.duration = info["duration"]
+        self.moov = info["moov"]
+        self.mdat = info["mdat"]
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "size": self.size,
+            "duration": self.duration,
+            "moov": self.moov,
+            "mdat": self.mdat,
+            # moov before mdat lets players start before the whole file arrives
+            "faststart": bool(self.moov and self.mdat and self.moov[0] < self.mdat[0]),
+        }
+
+class GestureLibrary:
+    """Index of gesture clips with a phrase trie and a cached sentence -> playlist lookup
+
+    Clip names map to phrases by their file name ("thank_you.mp4" -> "thank you"). Sentences are
+    matched longest phrase first; unknown words are spelled from letter clips, and letters
+    without a clip fall back to the default clip.
+    """
+
+    def __init__(self, root: str = "../gesture-videos", url_prefix: str = "/clips/", cache_size: int = 4096):
+        self.root = root
+        self.url_prefix = url_prefix
+        self.clips: Dict[str, Clip] = {}
+        self.letters: Dict[str, Clip] = {}
+        self.trie: Dict = {}
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Rescan root, re-reading headers only of new or changed files; returns the clip count"""
+        clips: Dict[str, Clip] = {}
+        letters: Dict[str, Clip] = {}
+        for directory, is_letters in ((self.root, False), (os.path.join(self.root, LETTERS_DIR), True)):
+            if not os.path.isdir(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                if not filename.lower().endswith(CLIP_EXTENSION):
+                    continue
+                stem = filename[:-len(CLIP_EXTENSION)].lower()
+                name = f"{LETTERS_DIR}/{stem}" if is_letters else stem
+                path = os.path.join(directory, filename)
+
+                clip = self.clips.get(name)
+                stat = os.stat(path)
+                if clip is None or clip.path != path or clip.size != stat.st_size or clip.mtime != stat.st_mtime:
+                    clip = Clip(name, path)
+
+                clips[name] = clip
+                if len(stem) == 1 and stem.isalnum() and (is_letters or stem not in letters):
+                    letters[stem] = clip
+
+        trie: Dict = {}
+        for name, clip in clips.items():
+            if name.startswith(LETTERS_DIR + "/") or name == DEFAULT_CLIP:
+                continue
+            node = trie
+            for word in tokenize(name.replace("_", " ").replace("-", " ")):
+                node = node.setdefault(word, {})
+            node[_END] = clip
+
+        # Each index gets its own cache, bound to it, so a lookup still running against the old
+        # index can only ever fill the old cache
+        resolve_tokens = lru_cache(maxsize=self.cache_size)(
+            partial(self._build_playlist, trie, letters, clips.get(DEFAULT_CLIP))
+        )
+        with self._lock:
+            self.clips, self.letters, self.trie = clips, letters, trie
+            self._resolve_tokens = resolve_tokens
+        return len(clips)
+
+    def clip(self, name: str) -> Optional[Clip]:
+        """Indexed clip by name ("hello", "letters/a")"""
+        return self.clips.get(name)
+
+    def resolve(self, text: str) -> List[Dict]:
+        """Playlist of clips signing text (copies, so callers cannot alter cached entries)"""
+        return [dict(entry) for entry in self._resolve_tokens(tokenize(text))]
+
+    def _entry(self, clip: Optional[Clip], text: str, kind: str) -> Dict:
+        return {
+            "text": text,
+            "type": kind,
+            "clip": clip.name if clip else None,
+            "url": self.url_prefix + clip.name + CLIP_EXTENSION if clip else None,
+            "duration": clip.duration if clip else None,
+        }
+
+    def _build_playlist(self, trie: Dict, letters: Dict[str, Clip], default: Optional[Clip],
+                        tokens: Tuple[str, ...]) -> Tuple[Dict, ...]:
+        """Longest-match phrases, spelling whatever no phrase covers"""
+        playlist = []
+        position = 0
+        while position < len(tokens):
+            # Walk the trie as far as the tokens allow, remembering the last complete phrase
+            node, match, end = trie, None, position
+            for index in range(position, len(tokens)):
+                node = node.get(tokens[index])
+                if node is None:
+                    break
+                if _END in node:
+                    match, end = node[_END], index + 1
+
+            if match is not None:
+                playlist.append(self._entry(match, " ".join(tokens[position:end]), "phrase"))
+                position = end
+                continue
+
+            word = tokens[position]
+            if letters:
+                for letter in word:
+                    clip = letters.get(letter)
+                    playlist.append(self._entry(clip or default, letter, "letter" if clip else "fallback"))
+            else:
+                playlist.append(self._entry(default, word, "fallback"))
+            position += 1
+
+        return tuple(playlist)
+
+    def to_dict(self) -> Dict:
+        """The whole index, for GET /api/gestures"""
+        return {
+            "clips": [clip.to_dict() for clip in self.clips.values()],
+            "phrases": sorted(name for name in self.clips if not name.startswith(LETTERS_DIR + "/")),
+            "letters": sorted(self.letters),
+        }
+
+class ClipMaps:
+    """Read-only memory maps of clip files shared by every request thread
+
+    A map is reopened only when the file changes; requests keep the map they started with,
+    so replacing a clip never disturbs an in-flight download.
+    """
+
+    def __init__(self):
+        self._maps: Dict[str, Tuple[str, mmap.mmap]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, clip: Clip) -> Optional[mmap.mmap]:
+        """Map of the clip's current contents, or None for an empty file"""
+        if clip.size == 0:
+            return None
+        with self._lock:
+            cached = self._maps.get(clip.path)
+            if cached is not None and cached[0] == clip.etag:
+                return cached[1]
+
+            with open(clip.path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[clip.path] = (clip.etag, mapped)
+            return mapped
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """(start, end exclusive) of a single "bytes=" range; None for no/unsupported range
+
+    Raises ValueError for an unsatisfiable range.
+    """
+    if not header:
+        return None
+    match = _RANGE_PATTERN.match(header.strip())
+    if match is None:
+        # Multiple ranges or other units: serve the whole file, as RFC 9110 allows
+        return None
+
+    first, last = match.groups()
+    if not first:
+        if not last or int(last) == 0:
+            raise ValueError(header)
+        return max(0, size - int(last)), size
+
+    start = int(first)
+    end = min(int(last) + 1, size) if last else size
+    if start >= size or start >= end:
+        raise ValueError(header)
+    return start, end
+
+class GestureRequestHandler(BaseHTTPRequestHandler):
+    """GET/HEAD /clips/<name>.mp4 with Range support, GET /api/gestures, POST /api/text-to-sign"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "SignSyncGestures/1.0"
+
+    @property
+    def library(self) -> GestureLibrary:
+        return self.server.library
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, payload, status: int = 200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, HEAD, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, Range")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path.startswith(self.library.url_prefix):
+            self.send_clip(path, body=True)
+        elif path == "/api/gestures":
+            self.send_json(self.library.to_dict())
+        elif path == "/api/health":
+            self.send_json({"status": "ok", "clips": len(self.library.clips)})
+        else:
+            self.send_json({"error": "not found"}, 404)
+
+    def do_HEAD(self):
+        path = self.path.split("?", 1)[0]
+        if path.startswith(self.library.url_prefix):
+            self.send_clip(path, body=False)
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def do_POST(self):
+        if self.path.split("?", 1)[0] != "/api/text-to-sign":
+            self.send_json({"error": "not found"}, 404)
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            text = request["text"]
+            if not isinstance(text, str):
+                raise TypeError("text must be a string")
+        except (ValueError, KeyError, TypeError) as e:
+            self.send_json({"error": f"invalid request: {e}"}, 400)
+            return
+
+        playlist = self.library.resolve(text)
+        self.send_json({
+            "text": text,
+            "playlist": playlist,
+            "duration": sum(entry["duration"] or 0.0 for entry in playlist),
+        })
+
+    def send_clip(self, path: str, body: bool):
+        """Stream a clip, or the requested byte range of it, straight out of its memory map"""
+        name = unquote(path[len(self.library.url_prefix):])
+        if name.endswith(CLIP_EXTENSION):
+            name = name[:-len(CLIP_EXTENSION)]
+        clip = self.library.clip(name)
+        if clip is None:
+            self.send_json({"error": f"unknown clip '{name}'"}, 404)
+            return
+
+        size = clip.size
+        try:
+            byte_range = parse_range(self.headers.get("Range"), size)
+            # A stale If-Range validator means the client's partial copy is outdated
+            if_range = self.headers.get("If-Range")
+            if byte_range is not None and if_range and if_range != clip.etag:
+                byte_range = None
+        except ValueError:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if byte_range is None and self.headers.get("If-None-Match") == clip.etag:
+            self.send_response(304)
+            self.send_header("ETag", clip.etag)
+            self.end_headers()
+            return
+
+        start, end = byte_range or (0, size)
+        self.send_response(206 if byte_range else 200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start))
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+        self.send_header("ETag", clip.etag)
+        self.send_header("Last-Modified", formatdate(clip.mtime, usegmt=True))
+        self.send_header("Cache-Control", "public, max-age=3600")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        mapped = self.server.maps.get(clip)
+        if not body or mapped is None:
+            return
+
+        # Slices of a memoryview over the map go to the socket without copying into Python memory
+        view = memoryview(mapped)
+        try:
+            for offset in range(start, end, CHUNK_SIZE):
+                self.wfile.write(view[offset:min(offset + CHUNK_SIZE, end)])
+        except (BrokenPipeError, ConnectionResetError):
+            # Players routinely abandon ranges while seeking
+            pass
+        finally:
+            view.release()
+
+class GestureServer(ThreadingHTTPServer):
+    """Thread-per-connection HTTP server sharing one library and one set of clip maps"""
+
+    daemon_threads = True
+
+    def __init__(self, address, library: GestureLibrary, verbose: bool = False):
+        super().__init__(address, GestureRequestHandler)
+        self.library = library
+        self.maps = ClipMaps()
+        self.verbose = verbose
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="SignSync Meet gesture clip library")
+    parser.add_argument("--root", default="../gesture-videos", help="Directory of per-word MP4 clips")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("index", help="Print the clip index as JSON")
+
+    resolve_parser = subparsers.add_parser("resolve", help="Print the playlist for a sentence")
+    resolve_parser.add_argument("text", nargs="+")
+
+    serve_parser = subparsers.add_parser("serve", help="Serve clips and POST /api/text-to-sign over HTTP")
+    serve_parser.add_argument("--host", default="0.0.0.0")
+    serve_parser.add_argument("--port", type=int, default=5001)
+    serve_parser.add_argument("--verbose", action="store_true", help="Log every request")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function for the gesture library"""
+    args = parse_args(argv)
+
+    if not os.path.isdir(args.root):
+        print(f"❌ Gesture directory not found: {args.root}")
+        return 1
+
+    library = GestureLibrary(args.root)
+
+    if args.command == "index":
+        json.dump(library.to_dict(), sys.stdout, indent=2)
+        print()
+        return 0
+
+    if args.command == "resolve":
+        for entry in library.resolve(" ".join(args.text)):
+            duration = f"{entry['duration']:.2f}s" if entry["duration"] else "?"
+            print(f"{entry['text']:<20} {entry['type']:<9} {entry['clip'] or '-':<20} {duration}")
+        return 0
+
+    server = GestureServer((args.host, args.port), library, verbose=args.verbose)
+    print(f"🚀 Gesture library serving {len(library.clips)} clips on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Hand Tracking
+Keeps a stable identity for every hand across frames so each one has its own smoothing history
+"""
+
+import itertools
+import numpy as np
+from typing import Callable, List, Optional, Sequence
+
+from smoothing import VoteSmoother
+
+class HandTrack:
+    """One tracked hand: identity, handedness, last wrist position and per-hand history"""
+
+    def __init__(self, track_id: int, handedness: str, wrist: np.ndarray,
+                 smoother: Optional[VoteSmoother] = None, sequence=None):
+        self.id = track_id
+        self.handedness = handedness
+        self.wrist = wrist.copy()
+        self.smoother = smoother
+        self.sequence = sequence
+        self.missed = 0
+        self.age = 0
+
+class HandTracker:
+    """Greedy nearest-wrist association of detected hands with existing tracks
+
+    Detections are matched to the closest track of the same handedness within max_distance
+    (in normalized image units), closest pairs first. Unmatched detections start new tracks;
+    tracks unseen for more than max_missed frames are dropped.
+    """
+
+    def __init__(self, create_smoother: Callable[[], Optional[VoteSmoother]] = lambda: None,
+                 create_sequence: Callable[[], object] = lambda: None,
+                 max_distance: float = 0.2, max_missed: int = 5):
+        self.create_smoother = create_smoother
+        self.create_sequence = create_sequence
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.tracks: List[HandTrack] = []
+        self._ids = itertools.count()
+
+    def update(self, landmarks: np.ndarray, handedness: Sequence[str]) -> List[HandTrack]:
+        """Associate this frame's (N, 63) hands with tracks; returns the track of each row"""
+        wrists = landmarks[:, :2]
+        assigned: List[Optional[HandTrack]] = [None] * len(landmarks)
+        taken = set()
+
+        if self.tracks and len(landmarks):
+            previous = np.stack([track.wrist for track in self.tracks])
+            distances = np.linalg.norm(wrists[:, None, :] - previous[None, :, :], axis=2)
+
+            # Closest (detection, track) pairs first
+            for row, index in zip(*np.unravel_index(np.argsort(distances, axis=None), distances.shape)):
+                if distances[row, index] > self.max_distance:
+                    break
+                if assigned[row] is not None or index in taken or self.tracks[index].handedness != handedness[row]:
+                    continue
+                assigned[row] = self.tracks[index]
+                taken.add(index)
+
+        survivors = []
+        for index, track in enumerate(self.tracks):
+            if index in taken:
+                track.missed = 0
+            else:
+                track.missed += 1
+                # A motion sign must be seen without interruption
+                if track.sequence is not None:
+                    track.sequence.reset()
+            if track.missed <= self.max_missed:
+                survivors.append(track)
+        self.tracks = survivors
+
+        for row, track in enumerate(assigned):
+            if track is None:
+                track = HandTrack(next(self._ids), handedness[row], wrists[row],
+                                  self.create_smoother(), self.create_sequence())
+                self.tracks.append(track)
+                assigned[row] = track
+            track.wrist[:] = wrists[row]
+            track.age += 1
+
+        return assigned
+
+    def reset(self):
+        """Forget every track"""
+        self.tracks = []
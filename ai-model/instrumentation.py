@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Instrumentation
+Per-stage timers and counters for the predictor, exported in windows to log, Prometheus or callback sinks
+"""
+
+import os
+import time
+import threading
+from typing import Callable, Dict, Iterable, Optional
+
+from metrics import LATENCY_BUCKETS_MS, Histogram
+
+# Stages timed inside SignLanguagePredictor
+STAGES = ("color_convert", "detect", "classify", "sequence", "smooth", "draw", "total")
+
+# frames: recognized frames, skipped: frames reused by the motion gate
+COUNTERS = ("frames", "hands", "no_hand", "skipped", "errors")
+
+Sink = Callable[[Dict], None]
+
+class Instrumentation:
+    """Rolling per-stage latency histograms and counters
+
+    observe() and count() are called from the hot path; every export_interval seconds the
+    current window is handed to each sink and cleared. Taking a window reads and clears every
+    histogram and counter atomically, so no observation is dropped or exported twice. The predictor skips all timing when
+    it has no Instrumentation, so turning it off costs one None check per stage.
+    """
+
+    def __init__(self, sinks: Iterable[Sink] = (), export_interval: float = 10.0, buckets=LATENCY_BUCKETS_MS):
+        self.sinks = list(sinks)
+        self.export_interval = export_interval
+        self.histograms = {stage: Histogram(buckets) for stage in STAGES}
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        # Guards counters and the window bounds
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._next_export = self._window_start + export_interval
+
+    def observe(self, stage: str, seconds: float):
+        """Record one stage duration"""
+        self.histograms[stage].observe(seconds * 1000.0)
+
+    def count(self, name: str, amount: int = 1):
+        """Increment a counter"""
+        with self._lock:
+            self.counters[name] += amount
+
+    def snapshot(self) -> Dict:
+        """Current window: counters, no-hand rate and per-stage latency summaries in milliseconds"""
+        with self._lock:
+            return self._window(reset=False)
+
+    def reset(self):
+        """Start a new window"""
+        with self._lock:
+            self._window(reset=True)
+
+    def _window(self, reset: bool) -> Dict:
+        # Called with self._lock held; each histogram is read and cleared under its own lock
+        now = time.monotonic()
+        counters = dict(self.counters)
+        stages = {stage: histogram.snapshot(reset=reset) for stage, histogram in self.histograms.items()}
+        window_seconds = now - self._window_start
+        if reset:
+            self.counters = dict.fromkeys(self.counters, 0)
+            self._window_start = now
+            self._next_export = now + self.export_interval
+
+        frames = counters["frames"] - counters["skipped"]
+        return {
+            "window_seconds": window_seconds,
+            "counters": counters,
+            "no_hand_rate": counters["no_hand"] / frames if frames > 0 else 0.0,
+            "stages": stages,
+        }
+
+    def maybe_export(self):
+        """Export the window if export_interval has elapsed"""
+        # Checking and taking the window under one lock lets exactly one caller export it
+        with self._lock:
+            if time.monotonic() < self._next_export:
+                return
+            snapshot = self._window(reset=True)
+        self._send(snapshot)
+
+    def export(self) -> Dict:
+        """Send the current window to every sink and start a new one"""
+        with self._lock:
+            snapshot = self._window(reset=True)
+        self._send(snapshot)
+        return snapshot
+
+    def _send(self, snapshot: Dict):
+        for sink in self.sinks:
+            try:
+                sink(snapshot)
+            except Exception as e:
+                # A broken sink must never take down recognition
+                print(f"Error exporting metrics: {e}")
+
+class LogSink:
+    """Writes one summary line per window"""
+
+    def __init__(self, write: Callable[[str], None] = print, stages: Iterable[str] = STAGES):
+        self.write = write
+        self.stages = tuple(stages)
+
+    def __call__(self, snapshot: Dict):
+        counters = snapshot["counters"]
+        parts = [
+            f"frames={counters['frames']}",
+            f"no_hand={snapshot['no_hand_rate']:.1%}",
+            f"skipped={counters['skipped']}",
+            f"errors={counters['errors']}",
+        ]
+        for stage in self.stages:
+            summary = snapshot["stages"][stage]
+            if summary["count"]:
+                parts.append(f"{stage}={summary['mean']:.2f}ms(p95<={summary['p95']:g})")
+        self.write("📈 " + " ".join(parts))
+
+class PrometheusSink:
+    """Accumulates windows into monotonic Prometheus counters and histograms
+
+    The text exposition is kept in `text` and, when path is given, written atomically
+    for the node_exporter textfile collector.
+    """
+
+    def __init__(self, path: Optional[str] = None, prefix: str = "signsync"):
+        self.path = path
+        self.prefix = prefix
+        self.text = ""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self._histograms: Dict[str, Dict] = {}
+
+    def __call__(self, snapshot: Dict):
+        with self._lock:
+            for name, value in snapshot["counters"].items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+            for stage, summary in snapshot["stages"].items():
+                total = self._histograms.setdefault(stage, {"count": 0, "sum": 0.0, "buckets": {}})
+                total["count"] += summary["count"]
+                total["sum"] += summary["sum"]
+                for bound, count in summary["buckets"].items():
+                    total["buckets"][bound] = total["buckets"].get(bound, 0) + count
+
+            self.text = self.render()
+
+        if self.path:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(self.text)
+            os.replace(tmp_path, self.path)
+
+    def render(self) -> str:
+        """Prometheus text format of the accumulated metrics (latencies in seconds)"""
+        prefix = self.prefix
+        lines = []
+        for name, value in self._counters.items():
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        metric = f"{prefix}_stage_duration_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        for stage, total in self._histograms.items():
+            for bound, count in total["buckets"].items():
+                le = bound if bound == "+Inf" else f"{float(bound) / 1000.0:g}"
+                lines.append(f'{metric}_bucket{{stage="{stage}",le="{le}"}} {count}')
+            lines.append(f'{metric}_sum{{stage="{stage}"}} {total["sum"] / 1000.0:.6f}')
+            lines.append(f'{metric}_count{{stage="{stage}"}} {total["count"]}')
+        return "\n".join(lines) + "\n"
+
+def create_instrumentation(mode: str, interval: float = 10.0, path: Optional[str] = None,
+                           callback: Optional[Sink] = None) -> Optional[Instrumentation]:
+    """Instrumentation for a --metrics mode ("off", "log" or "prometheus"), or None when off"""
+    sinks = []
+    if mode == "log":
+        sinks.append(LogSink())
+    elif mode == "prometheus":
+        sinks.append(PrometheusSink(path))
+    elif mode != "off":
+        raise ValueError(f"Unknown metrics mode '{mode}'")
+
+    if callback is not None:
+        sinks.append(callback)
+    if not sinks:
+        return None
+    return Instrumentation(sinks, export_interval=interval)
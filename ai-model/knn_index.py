@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Nearest-Neighbour Index
+Partitioned (IVF) k-NN classifier over normalized landmarks that learns new examples without retraining
+"""
+
+import os
+import json
+import argparse
+import threading
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+from landmarks import FEATURE_SIZE, NUM_LANDMARKS
+
+# Palm size reference: wrist to middle finger MCP
+SCALE_LANDMARK = 9
+
+# Below this many vectors a full scan is faster than probing partitions
+BRUTE_FORCE_LIMIT = 20000
+
+# Vectors added since the last partitioning are scanned in full; rebuild once they pass this share
+REBUILD_FRACTION = 0.1
+
+INDEX_FILE = "index.json"
+ARRAYS = ("vectors", "labels", "centroids", "offsets")
+
+def normalize_landmarks(landmarks: np.ndarray) -> np.ndarray:
+    """Wrist-relative, palm-size-scaled copies of (N, 63) landmark vectors
+
+    Position and distance from the camera drop out, so neighbours are found by hand shape.
+    """
+    points = np.asarray(landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+    points = points - points[:, :1]
+    scale = np.linalg.norm(points[:, SCALE_LANDMARK], axis=1)
+    np.maximum(scale, 1e-6, out=scale)
+    points /= scale[:, None, None]
+    return points.reshape(-1, FEATURE_SIZE)
+
+def kmeans(X: np.ndarray, clusters: int, iterations: int = 10, sample_size: int = 50000,
+           seed: int = 0) -> np.ndarray:
+    """Lloyd's k-means on a random sample, seeded with k-means++; returns (clusters, features) centroids"""
+    rng = np.random.default_rng(seed)
+    if len(X) > sample_size:
+        X = X[rng.choice(len(X), sample_size, replace=False)]
+    X = np.asarray(X, dtype=np.float32)
+    squared = np.einsum('ij,ij->i', X, X)
+
+    # k-means++ seeding
+    centroids = np.empty((clusters, X.shape[1]), dtype=np.float32)
+    centroids[0] = X[rng.integers(len(X))]
+    closest = np.maximum(squared - 2 * X @ centroids[0] + centroids[0] @ centroids[0], 0.0)
+    for i in range(1, clusters):
+        total = closest.sum()
+        index = rng.choice(len(X), p=closest / total) if total > 0 else rng.integers(len(X))
+        centroids[i] = X[index]
+        np.minimum(closest, np.maximum(squared - 2 * X @ centroids[i] + centroids[i] @ centroids[i], 0.0),
+                   out=closest)
+
+    for _ in range(iterations):
+        assignment = assign(X, centroids)
+        counts = np.bincount(assignment, minlength=clusters)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, X)
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+
+    return centroids
+
+def assign(X: np.ndarray, centroids: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+    """Index of the nearest centroid for every row of X"""
+    centroid_norms = np.einsum('ij,ij->i', centroids, centroids)
+    result = np.empty(len(X), dtype=np.int64)
+    for start in range(0, len(X), chunk_size):
+        chunk = np.asarray(X[start:start + chunk_size], dtype=np.float32)
+        result[start:start + chunk_size] = (centroid_norms - 2 * chunk @ centroids.T).argmin(axis=1)
+    return result
+
+class LandmarkIndex:
+    """k-NN classifier over normalized landmark vectors
+
+    Vectors are stored grouped by k-means partition so each partition is one contiguous slice;
+    a query scans the nprobe partitions nearest to it plus everything added since the last
+    rebuild. Small indexes skip partitioning and scan everything. Saved indexes load as
+    memory maps and are copied into memory only when examples are added.
+    """
+
+    def __init__(self, classes: Sequence[str] = (), k: int = 5, nprobe: int = 8):
+        self.k = k
+        self.nprobe = nprobe
+        self.classes: List[str] = [str(c) for c in classes]
+        self.class_index = {label: i for i, label in enumerate(self.classes)}
+
+        self.vectors = np.empty((0, FEATURE_SIZE), dtype=np.float32)
+        self.labels = np.empty(0, dtype=np.int32)
+        self.squared_norms = np.empty(0, dtype=np.float32)
+        self.count = 0
+
+        # Partition layout of the first `partitioned` vectors
+        self.centroids = np.empty((0, FEATURE_SIZE), dtype=np.float32)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.partitioned = 0
+
+        # Guards the arrays; notified when a rebuild finishes
+        self._lock = threading.Condition()
+        self._rebuilding = False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _label_ids(self, labels: Sequence[str]) -> np.ndarray:
+        """Class indices of labels, registering unseen labels as new classes"""
+        ids = np.empty(len(labels), dtype=np.int32)
+        for i, label in enumerate(labels):
+            label = str(label)
+            if label not in self.class_index:
+                self.class_index[label] = len(self.classes)
+                self.classes.append(label)
+            ids[i] = self.class_index[label]
+        return ids
+
+    def add(self, landmarks: np.ndarray, labels: Sequence[str], normalized: bool = False, rebuild: bool = True):
+        """Append raw (or already normalized) landmark vectors with their labels
+
+        Unless rebuild is False, a background rebuild starts once the unpartitioned tail grows too large.
+        """
+        vectors = np.asarray(landmarks, dtype=np.float32).reshape(-1, FEATURE_SIZE)
+        if not normalized:
+            vectors = normalize_landmarks(vectors)
+        if isinstance(labels, str):
+            labels = [labels] * len(vectors)
+        if len(labels) != len(vectors):
+            raise ValueError(f"Got {len(vectors)} vectors but {len(labels)} labels")
+
+        with self._lock:
+            ids = self._label_ids(labels)
+            end = self.count + len(vectors)
+
+            # Grow geometrically; memory-mapped storage is copied into memory here
+            if end > len(self.vectors) or not self.vectors.flags.writeable:
+                capacity = max(end, 2 * len(self.vectors), 1024)
+                self.vectors = self._grow(self.vectors, capacity)
+                self.labels = self._grow(self.labels, capacity)
+                self.squared_norms = self._grow(self.squared_norms, capacity)
+
+            self.vectors[self.count:end] = vectors
+            self.labels[self.count:end] = ids
+            self.squared_norms[self.count:end] = np.einsum('ij,ij->i', vectors, vectors)
+            self.count = end
+
+            rebuild = rebuild and end > BRUTE_FORCE_LIMIT and end - self.partitioned > REBUILD_FRACTION * end
+        if rebuild:
+            # Clustering takes seconds at this size; searches keep scanning the tail meanwhile
+            self.rebuild(background=True)
+
+    def _grow(self, array: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[:self.count] = array[:self.count]
+        return grown
+
+    def rebuild(self, partitions: Optional[int] = None, background: bool = False) -> Optional[threading.Thread]:
+        """Re-cluster and regroup every vector so partitions are contiguous slices
+
+        Clustering runs outside the lock, so searches and adds continue meanwhile; rows added
+        during the rebuild are carried over as the unpartitioned tail. Only one rebuild runs at
+        a time: a background request made during another is skipped, a blocking one waits for it.
+        With background=True the rebuild runs in a daemon thread, which is returned.
+        """
+        with self._lock:
+            if self._rebuilding:
+                if background:
+                    return None
+                self._lock.wait_for(lambda: not self._rebuilding)
+            self._rebuilding = True
+
+        if background:
+            thread = threading.Thread(target=self._rebuild, args=(partitions,), name="knn-rebuild", daemon=True)
+            thread.start()
+            return thread
+
+        self._rebuild(partitions)
+        return None
+
+    def _rebuild(self, partitions: Optional[int]):
+        """Cluster a snapshot and swap in the regrouped arrays; clears the rebuilding flag"""
+        try:
+            vectors, labels, squared_norms, count = self._snapshot()[:4]
+            if count <= BRUTE_FORCE_LIMIT:
+                with self._lock:
+                    self.centroids = np.empty((0, FEATURE_SIZE), dtype=np.float32)
+                    self.offsets = np.zeros(1, dtype=np.int64)
+                    self.partitioned = 0
+                return
+
+            partitions = partitions or int(np.sqrt(count))
+            centroids = kmeans(vectors, partitions)
+            assignment = assign(vectors, centroids)
+            order = np.argsort(assignment, kind='stable')
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=partitions))])
+
+            # Swap in the regrouped rows; rows added since the snapshot stay as the tail
+            with self._lock:
+                tail = slice(count, self.count)
+                self.vectors = np.concatenate([vectors[order], self.vectors[tail]])
+                self.labels = np.concatenate([labels[order], self.labels[tail]])
+                self.squared_norms = np.concatenate([squared_norms[order], self.squared_norms[tail]])
+                self.centroids = centroids
+                self.offsets = offsets
+                self.partitioned = count
+
+        except Exception as e:
+            # Searches stay correct on the old layout; a later add retries
+            if threading.current_thread().name != "knn-rebuild":
+                raise
+            print(f"Error rebuilding nearest-neighbour index: {e}")
+
+        finally:
+            with self._lock:
+                self._rebuilding = False
+                self._lock.notify_all()
+
+    def _snapshot(self):
+        """Consistent (vectors, labels, norms, count, centroids, offsets, partitioned) for one search
+
+        Adds only write rows past `count` or swap in new arrays, so the snapshot stays valid unlocked.
+        """
+        with self._lock:
+            return (self.vectors[:self.count], self.labels[:self.count], self.squared_norms[:self.count],
+                    self.count, self.centroids, self.offsets, self.partitioned)
+
+    def search(self, landmarks: np.ndarray, k: Optional[int] = None,
+               normalized: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """(N, k) class indices and squared distances of the nearest stored vectors (-1/inf padded)"""
+        queries = np.asarray(landmarks, dtype=np.float32).reshape(-1, FEATURE_SIZE)
+        if not normalized:
+            queries = normalize_landmarks(queries)
+        k = k or self.k
+        vectors, stored_labels, squared_norms, count, centroids, offsets, partitioned = self._snapshot()
+
+        labels = np.full((len(queries), k), -1, dtype=np.int32)
+        distances = np.full((len(queries), k), np.inf, dtype=np.float32)
+        if count == 0:
+            return labels, distances
+
+        if not partitioned:
+            # ||q - x||^2 = ||q||^2 - 2 q.x + ||x||^2, one matmul for the whole batch
+            scores = squared_norms - 2 * queries @ vectors.T
+            found = min(k, count)
+            nearest = np.argpartition(scores, found - 1, axis=1)[:, :found]
+            nearest_scores = np.take_along_axis(scores, nearest, axis=1)
+            order = np.argsort(nearest_scores, axis=1)
+            nearest = np.take_along_axis(nearest, order, axis=1)
+            query_norms = np.einsum('ij,ij->i', queries, queries)[:, None]
+            labels[:, :found] = stored_labels[nearest]
+            distances[:, :found] = np.maximum(np.take_along_axis(nearest_scores, order, axis=1) + query_norms, 0.0)
+            return labels, distances
+
+        centroid_norms = np.einsum('ij,ij->i', centroids, centroids)
+        nprobe = min(self.nprobe, len(centroids))
+        probes = np.argpartition(centroid_norms - 2 * queries @ centroids.T, nprobe - 1, axis=1)[:, :nprobe]
+        for row, query in enumerate(queries):
+            # The probed partitions plus the tail added since the last rebuild, each a contiguous slice
+            slices = [slice(offsets[p], offsets[p + 1]) for p in probes[row]]
+            slices.append(slice(partitioned, count))
+            scores = np.concatenate([squared_norms[s] - 2 * (vectors[s] @ query) for s in slices])
+            found = min(k, len(scores))
+            if found == 0:
+                continue
+            nearest = np.argpartition(scores, found - 1)[:found]
+            nearest = nearest[np.argsort(scores[nearest])]
+            labels[row, :found] = np.concatenate([stored_labels[s] for s in slices])[nearest]
+            distances[row, :found] = np.maximum(scores[nearest] + query @ query, 0.0)
+        return labels, distances
+
+    def vote(self, landmarks: np.ndarray, k: Optional[int] = None, normalized: bool = False) -> np.ndarray:
+        """(N, classes) inverse-distance-weighted vote shares of the k nearest neighbours"""
+        labels, distances = self.search(landmarks, k, normalized)
+        weights = 1.0 / (np.sqrt(distances) + 1e-3)
+        weights[labels < 0] = 0.0
+
+        shares = np.zeros((len(labels), len(self.classes)), dtype=np.float32)
+        rows = np.repeat(np.arange(len(labels)), labels.shape[1])
+        valid = labels.reshape(-1) >= 0
+        np.add.at(shares, (rows[valid], labels.reshape(-1)[valid]), weights.reshape(-1)[valid])
+        totals = shares.sum(axis=1, keepdims=True)
+        np.divide(shares, totals, out=shares, where=totals > 0)
+        return shares
+
+    def predict(self, landmarks: np.ndarray, k: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Labels and vote-share confidences for (N, 63) raw landmark vectors ("" and 0.0 when empty)"""
+        shares = self.vote(landmarks, k)
+        if shares.shape[1] == 0:
+            return np.full(len(shares), "", dtype=str), np.zeros(len(shares), dtype=np.float32)
+        best = shares.argmax(axis=1)
+        return np.asarray(self.classes)[best], shares[np.arange(len(best)), best]
+
+    def save(self, path: str):
+        """Write the index as .npy arrays (memory-mappable) plus index.json, replacing files atomically"""
+        os.makedirs(path, exist_ok=True)
+        with self._lock:
+            arrays = {
+                "vectors": self.vectors[:self.count],
+                "labels": self.labels[:self.count],
+                "centroids": self.centroids,
+                "offsets": self.offsets,
+            }
+            meta = {
+                "classes": list(self.classes),
+                "count": self.count,
+                "partitioned": self.partitioned,
+                "k": self.k,
+                "nprobe": self.nprobe,
+            }
+
+        for name, array in arrays.items():
+            tmp_path = os.path.join(path, f"{name}.tmp.npy")
+            np.save(tmp_path, np.ascontiguousarray(array))
+            os.replace(tmp_path, os.path.join(path, f"{name}.npy"))
+
+        # Written last, so a reader never sees metadata newer than the arrays
+        tmp_path = os.path.join(path, INDEX_FILE + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, os.path.join(path, INDEX_FILE))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "LandmarkIndex":
+        """Open a saved index; arrays are memory-mapped unless mmap is False"""
+        with open(os.path.join(path, INDEX_FILE), 'r') as f:
+            meta = json.load(f)
+
+        index = cls(meta["classes"], k=meta.get("k", 5), nprobe=meta.get("nprobe", 8))
+        mode = 'r' if mmap else None
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode) for name in ARRAYS}
+        index.count = int(meta["count"])
+        index.vectors = arrays["vectors"]
+        index.labels = arrays["labels"]
+        index.centroids = np.asarray(arrays["centroids"])
+        index.offsets = np.asarray(arrays["offsets"])
+        index.partitioned = int(meta["partitioned"])
+        # Norms are cheap to recompute and keep the file format to what was stored
+        index.squared_norms = np.einsum('ij,ij->i', index.vectors, index.vectors).astype(np.float32)
+        return index
+
+def build_index(landmarks: np.ndarray, labels: Sequence[str], k: int = 5, nprobe: int = 8) -> LandmarkIndex:
+    """Index raw (N, 63) landmark vectors, partitioning them when there are enough"""
+    index = LandmarkIndex(sorted(set(str(label) for label in labels)), k=k, nprobe=nprobe)
+    index.add(landmarks, [str(label) for label in labels], rebuild=False)
+    index.rebuild()
+    return index
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="SignSync Meet nearest-neighbour landmark index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Index every landmark of the training dataset")
+    build_parser.add_argument("--data-path", default="./data", help="Directory of images organized by letter")
+    build_parser.add_argument("--index", default="./models/knn_index", help="Index directory to write")
+    build_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                              help="Processes used for landmark extraction (1 = serial)")
+    build_parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the landmark cache")
+
+    add_parser = subparsers.add_parser("add", help="Add the hand in each image as an example of a label")
+    add_parser.add_argument("label")
+    add_parser.add_argument("images", nargs="+")
+    add_parser.add_argument("--index", default="./models/knn_index")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function for the landmark index"""
+    args = parse_args(argv)
+
+    try:
+        if args.command == "build":
+            from train_model import SignLanguageTrainer
+
+            trainer = SignLanguageTrainer(data_path=args.data_path)
+            X, y = trainer.load_dataset(num_workers=args.workers, use_cache=not args.no_cache)
+            index = build_index(X, y)
+            index.save(args.index)
+            print(f"✅ Indexed {len(index)} examples of {len(index.classes)} classes in {args.index}")
+            return 0
+
+        # add: detect the hand in each image, as training does
+        from train_model import create_static_hands, extract_features_with
+
+        index = LandmarkIndex.load(args.index)
+        hands = create_static_hands()
+        added = 0
+        for image_path in args.images:
+            landmarks = extract_features_with(hands, image_path)
+            if landmarks is None:
+                print(f"❌ No hand found in {image_path}")
+                continue
+            index.add(landmarks, args.label)
+            added += 1
+        index.save(args.index)
+        print(f"✅ Added {added} example(s) of '{args.label}' ({len(index)} total)")
+        return 0 if added else 1
+
+    except Exception as e:
+        print(f"\n❌ Index command failed: {e}")
+        return 1
+
+if __name__ == "__main__":
+    exit(main())
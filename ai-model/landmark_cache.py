@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Landmark Cache
+On-disk cache of extracted hand landmarks so training only re-processes new or changed images
+"""
+
+import os
+import json
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from landmarks import FEATURE_SIZE
+
+# Row value used in the index for images where no hand was detected
+NO_HAND = -1
+
+class LandmarkCache:
+    """Landmark cache keyed by file path, mtime and size, backed by a memory-mapped .npy array"""
+
+    def __init__(self, cache_dir: str, feature_size: int = FEATURE_SIZE):
+        self.cache_dir = cache_dir
+        self.feature_size = feature_size
+        self.array_path = os.path.join(cache_dir, "landmarks.npy")
+        self.index_path = os.path.join(cache_dir, "landmarks_index.json")
+
+        # path -> [row, mtime_ns, size]
+        self.index: Dict[str, List[int]] = {}
+        self.features: Optional[np.ndarray] = None
+
+        self.load()
+
+    @staticmethod
+    def file_key(path: str) -> Tuple[int, int]:
+        """Return the (mtime_ns, size) pair used to detect changed files"""
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self):
+        """Open the cache index and memory-map the landmark array"""
+        if not (os.path.exists(self.index_path) and os.path.exists(self.array_path)):
+            return
+
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+
+            features = np.load(self.array_path, mmap_mode='r')
+            if features.ndim != 2 or features.shape[1] != self.feature_size:
+                print(f"Ignoring landmark cache with unexpected shape {features.shape}")
+                return
+
+            self.index = index
+            self.features = features
+
+        except Exception as e:
+            print(f"Error loading landmark cache: {e}")
+            self.index = {}
+            self.features = None
+
+    def lookup(self, path: str, key: Tuple[int, int]) -> Tuple[bool, Optional[np.ndarray]]:
+        """Return (hit, landmarks) for a path; landmarks is None for cached no-hand images"""
+        entry = self.index.get(path)
+        if entry is None:
+            return False, None
+
+        row, mtime_ns, size = entry
+        if (mtime_ns, size) != key:
+            return False, None
+
+        if row == NO_HAND:
+            return True, None
+
+        return True, self.features[row]
+
+    def save(self, records: List[Tuple[str, Tuple[int, int], Optional[np.ndarray]]]):
+        """Rewrite the cache from (path, key, landmarks) records, dropping files no longer present"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        index = {}
+        rows = []
+        for path, (mtime_ns, size), landmarks in records:
+            if landmarks is None:
+                index[path] = [NO_HAND, mtime_ns, size]
+            else:
+                index[path] = [len(rows), mtime_ns, size]
+                rows.append(landmarks)
+
+        if rows:
+            features = np.stack(rows).astype(np.float32, copy=False)
+        else:
+            features = np.empty((0, self.feature_size), dtype=np.float32)
+
+        # Release the old mapping before replacing the file (required on Windows, where callers
+        # must also drop row views returned by lookup(); see gather_landmarks)
+        self.features = None
+
+        tmp_array_path = self.array_path + ".tmp.npy"
+        tmp_index_path = self.index_path + ".tmp"
+        np.save(tmp_array_path, features)
+        with open(tmp_index_path, 'w') as f:
+            json.dump(index, f)
+
+        os.replace(tmp_array_path, self.array_path)
+        os.replace(tmp_index_path, self.index_path)
+
+        self.index = index
+        self.features = np.load(self.array_path, mmap_mode='r')
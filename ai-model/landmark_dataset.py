@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Landmark Dataset
+Sharded on-disk landmark records and the tf.data pipeline that streams them into training
+"""
+
+import os
+import json
+import glob
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MANIFEST_NAME = "manifest.json"
+SHARD_SUFFIX = ".bin"
+
+def stratified_split(labels: np.ndarray, test_size: float = 0.2, seed: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (train, validation) index arrays holding out test_size of every class"""
+    rng = np.random.default_rng(seed)
+    train, validation = [], []
+    for label in np.unique(labels):
+        indices = np.flatnonzero(labels == label)
+        rng.shuffle(indices)
+        # Keep at least one training sample per class, as train_test_split does
+        held_out = min(len(indices) - 1, int(round(len(indices) * test_size)))
+        validation.append(indices[:held_out])
+        train.append(indices[held_out:])
+
+    train = np.concatenate(train)
+    validation = np.concatenate(validation)
+    rng.shuffle(train)
+    rng.shuffle(validation)
+    return train, validation
+
+def _write_split(shard_dir: str, split: str, features: Sequence[np.ndarray], labels: np.ndarray,
+                 indices: np.ndarray, num_features: int, shard_size: int) -> List[str]:
+    """Write one split as fixed-length float32 records: num_features values followed by the label"""
+    paths = []
+    for shard, start in enumerate(range(0, len(indices), shard_size)):
+        chunk = indices[start:start + shard_size]
+        records = np.empty((len(chunk), num_features + 1), dtype='<f4')
+        for row, i in enumerate(chunk):
+            records[row, :num_features] = features[i]
+        records[:, num_features] = labels[chunk]
+
+        path = os.path.join(shard_dir, f"{split}-{shard:05d}{SHARD_SUFFIX}")
+        records.tofile(path)
+        paths.append(path)
+    return paths
+
+def write_shards(shard_dir: str, features: Sequence[np.ndarray], labels: np.ndarray, classes: Sequence[str],
+                 test_size: float = 0.2, shard_size: int = 65536, seed: int = 42) -> Dict:
+    """Split landmarks into stratified train/validation shards and write their manifest
+
+    features may be any sequence of 1-D rows (e.g. memory-mapped cache rows); only one
+    shard is materialized at a time. labels are encoded class indices.
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    labels = np.asarray(labels)
+    num_features = int(len(features[0]))
+
+    # Remove shards of a previous run so stale files are never streamed
+    for path in glob.glob(os.path.join(shard_dir, f"*{SHARD_SUFFIX}")):
+        os.remove(path)
+
+    train, validation = stratified_split(labels, test_size, seed)
+    manifest = {
+        'num_features': num_features,
+        'classes': [str(c) for c in classes],
+        'splits': {},
+    }
+    for split, indices in (('train', train), ('validation', validation)):
+        paths = _write_split(shard_dir, split, features, labels, indices, num_features, shard_size)
+        manifest['splits'][split] = {
+            'records': int(len(indices)),
+            'shards': [os.path.basename(p) for p in paths],
+        }
+
+    # The manifest is written last, so a complete manifest always describes complete shards
+    manifest_path = os.path.join(shard_dir, MANIFEST_NAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+def read_manifest(shard_dir: str) -> Dict:
+    """Load the manifest written by write_shards"""
+    with open(os.path.join(shard_dir, MANIFEST_NAME), 'r') as f:
+        return json.load(f)
+
+def read_split(shard_dir: str, split: str, limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Read up to limit records of a split into NumPy (features, encoded labels) without TensorFlow"""
+    manifest = read_manifest(shard_dir)
+    width = manifest['num_features'] + 1
+    chunks = []
+    remaining = manifest['splits'][split]['records'] if limit is None else limit
+    for name in manifest['splits'][split]['shards']:
+        if remaining <= 0:
+            break
+        records = np.fromfile(os.path.join(shard_dir, name), dtype='<f4', count=remaining * width)
+        records = records.reshape(-1, width)
+        chunks.append(records)
+        remaining -= len(records)
+
+    records = np.concatenate(chunks) if chunks else np.empty((0, width), dtype=np.float32)
+    return records[:, :-1].astype(np.float32), records[:, -1].astype(np.int64)
+
+def make_dataset(shard_dir: str, split: str, batch_size: int = 32, training: bool = True,
+                 shuffle_buffer: int = 16384, cache: bool = False, seed: int = 42, augmenter=None):
+    """Stream a split as a tf.data pipeline of (features, labels) batches
+
+    Shards are read in parallel with interleave, shuffled through a buffer when training,
+    batched before decoding so each batch is decoded with one vectorized op, and prefetched.
+    cache=True keeps the records in memory after the first epoch for data that fits in RAM.
+    An augment.LandmarkAugmenter, if given, is applied to each decoded batch.
+    """
+    import tensorflow as tf
+
+    manifest = read_manifest(shard_dir)
+    num_features = manifest['num_features']
+    record_bytes = (num_features + 1) * 4
+    files = [os.path.join(shard_dir, name) for name in manifest['splits'][split]['shards']]
+    if not files:
+        raise ValueError(f"No {split} shards found in {shard_dir}")
+
+    autotune = tf.data.AUTOTUNE
+    dataset = tf.data.Dataset.from_tensor_slices(files)
+    if training:
+        dataset = dataset.shuffle(len(files), seed=seed, reshuffle_each_iteration=True)
+
+    dataset = dataset.interleave(
+        lambda path: tf.data.FixedLengthRecordDataset(path, record_bytes, buffer_size=1 << 20),
+        cycle_length=min(len(files), os.cpu_count() or 1),
+        num_parallel_calls=autotune,
+        deterministic=not training
+    )
+
+    if cache:
+        # Raw records are cached before the shuffle, so every epoch is still reshuffled
+        dataset = dataset.cache()
+    if training:
+        dataset = dataset.shuffle(shuffle_buffer, seed=seed, reshuffle_each_iteration=True)
+
+    def decode(records):
+        values = tf.io.decode_raw(records, tf.float32)
+        return values[:, :num_features], tf.cast(values[:, num_features], tf.int32)
+
+    dataset = dataset.batch(batch_size).map(decode, num_parallel_calls=autotune)
+
+    if augmenter is not None:
+        def augment(features, labels):
+            features = tf.numpy_function(augmenter.augment, [features], tf.float32)
+            return tf.ensure_shape(features, [None, num_features]), labels
+
+        # The augmenter's generator is not thread-safe, so batches are augmented one at a time
+        dataset = dataset.map(augment)
+    return dataset.prefetch(autotune)
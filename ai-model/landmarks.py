@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Landmark Extraction
+Flattens MediaPipe hand landmarks straight into preallocated float32 buffers
+"""
+
+import numpy as np
+from typing import List, Optional
+
+# 21 hand landmarks with (x, y, z) coordinates each
+NUM_LANDMARKS = 21
+FEATURE_SIZE = NUM_LANDMARKS * 3
+
+def allocate_features(count: Optional[int] = None) -> np.ndarray:
+    """Allocate a float32 feature vector, or a (count, 63) batch of them"""
+    shape = FEATURE_SIZE if count is None else (count, FEATURE_SIZE)
+    return np.empty(shape, dtype=np.float32)
+
+def flatten_landmarks(hand_landmarks, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Write one hand's landmarks into out (a 63-float32 vector or batch row) without building lists"""
+    if out is None:
+        out = allocate_features()
+
+    # memoryview item assignment is markedly cheaper than NumPy scalar indexing
+    view = memoryview(out) if out.flags.c_contiguous else out
+    i = 0
+    for landmark in hand_landmarks.landmark:
+        view[i] = landmark.x
+        view[i + 1] = landmark.y
+        view[i + 2] = landmark.z
+        i += 3
+    return out
+
+def landmarks_from_results(results, out: Optional[np.ndarray] = None, hand_index: int = 0) -> Optional[np.ndarray]:
+    """Flatten a detected hand from MediaPipe Hands results, or return None when there is none"""
+    hands = results.multi_hand_landmarks
+    if not hands or hand_index >= len(hands):
+        return None
+    return flatten_landmarks(hands[hand_index], out)
+
+def hands_from_results(results, out: np.ndarray) -> List[str]:
+    """Flatten up to len(out) detected hands into rows of out and return their handedness ("Left"/"Right")"""
+    hands = results.multi_hand_landmarks or []
+    handedness = results.multi_handedness or []
+    labels = []
+    for i, hand in enumerate(hands[:len(out)]):
+        flatten_landmarks(hand, out[i])
+        labels.append(handedness[i].classification[0].label if i < len(handedness) else "Unknown")
+    return labels
+
+def mirror_left_hands(batch: np.ndarray, handedness: List[str], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Copy of a (N, 63) batch with left hands mirrored (x -> 1 - x) into right-hand orientation"""
+    if out is None:
+        out = batch.copy()
+    else:
+        np.copyto(out, batch)
+    left = np.fromiter((label == "Left" for label in handedness), dtype=bool, count=len(handedness))
+    if left.any():
+        out[left, 0::3] = 1.0 - out[left, 0::3]
+    return out
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Metrics
+Lightweight thread-safe histograms for latency and batch tuning
+"""
+
+import bisect
+import threading
+from typing import Dict, Sequence
+
+# Millisecond buckets covering sub-millisecond inference up to slow MediaPipe frames
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+def power_of_two_buckets(maximum: int) -> tuple:
+    """Buckets 1, 2, 4, ... up to and including maximum"""
+    buckets = []
+    value = 1
+    while value < maximum:
+        buckets.append(value)
+        value *= 2
+    buckets.append(maximum)
+    return tuple(buckets)
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, max and bucket-resolution percentiles"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets = sorted(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all observations"""
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        # One extra slot counts observations above the largest bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        """Record one observation"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (0-100)"""
+        with self._lock:
+            return self._percentile(q)
+
+    def _percentile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+
+        target = q / 100.0 * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target and count:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self, reset: bool = False) -> Dict:
+        """Return a JSON-serializable summary, clearing the histogram in the same step if reset"""
+        with self._lock:
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(self.buckets, self.counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            buckets["+Inf"] = self.count
+
+            summary = {
+                "count": self.count,
+                "sum": self.total,
+                "mean": self.total / self.count if self.count else 0.0,
+                "max": self.max,
+                "p50": self._percentile(50),
+                "p95": self._percentile(95),
+                "p99": self._percentile(99),
+                "buckets": buckets,
+            }
+            if reset:
+                self._clear()
+            return summary
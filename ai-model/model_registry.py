@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Model Registry
+Loads trained models by version, keeps several resident and hot-swaps in new ones from latest_model.json
+"""
+
+import os
+import json
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from numpy_model import NumpyDenseModel
+
+# Weight precisions; float16 and int8 are quantized exports run by the NumPy backend
+PRECISIONS = ("float32", "float16", "int8")
+
+class LoadedModel:
+    """One model version ready for inference: forward pass, label table and metadata"""
+
+    def __init__(self, version: str, backend: str, model, forward: Callable[[np.ndarray], np.ndarray],
+                 class_labels: np.ndarray, label_encoder=None, info: Optional[dict] = None):
+        self.version = version
+        self.backend = backend
+        self.model = model
+        self.forward = forward
+        self.class_labels = class_labels
+        self.label_encoder = label_encoder
+        self.info = info or {}
+        self.num_features = int(model.input_shape[-1])
+        self.label_index = {str(label): i for i, label in enumerate(class_labels)}
+
+        # Filled in by ModelRegistry.load for cold-start reports
+        self.load_seconds = 0.0
+        self.warmup_seconds = 0.0
+
+    def predict_proba(self, landmarks: np.ndarray) -> np.ndarray:
+        """Return class probabilities for landmark vectors of shape (N, features)"""
+        x = np.asarray(landmarks, dtype=np.float32).reshape(-1, self.num_features)
+        return self.forward(x)
+
+    def warmup(self, batch_size: int = 8):
+        """Run a dummy batch so graph tracing and allocations happen before real traffic"""
+        self.predict_proba(np.zeros((batch_size, self.num_features), dtype=np.float32))
+
+def load_numpy_model(numpy_path: str, version: str, info: Optional[dict] = None) -> LoadedModel:
+    """Load an exported .npz model for the NumPy backend"""
+    if not numpy_path:
+        raise ValueError("No NumPy export found. Run numpy_model.py to create one.")
+
+    print(f"Loading NumPy model from: {numpy_path}")
+    model = NumpyDenseModel.load(numpy_path)
+    return LoadedModel(version, "numpy", model, model, model.class_labels, info=info)
+
+def load_keras_model(model_path: str, encoder_path: str, version: str, info: Optional[dict] = None) -> LoadedModel:
+    """Load a Keras .h5 model and pickled label encoder"""
+    import tensorflow as tf
+
+    # Load model
+    print(f"Loading model from: {model_path}")
+    model = tf.keras.models.load_model(model_path)
+
+    # Load label encoder
+    print(f"Loading label encoder from: {encoder_path}")
+    with open(encoder_path, 'rb') as f:
+        label_encoder = pickle.load(f)
+
+    # A fixed input signature traces the graph once for every batch size
+    num_features = int(model.input_shape[-1])
+    compiled = tf.function(
+        lambda x: model(x, training=False),
+        input_signature=[tf.TensorSpec(shape=[None, num_features], dtype=tf.float32)]
+    )
+
+    return LoadedModel(
+        version, "keras", model,
+        lambda x: compiled(x).numpy(),
+        np.asarray(label_encoder.classes_),
+        label_encoder=label_encoder,
+        info=info
+    )
+
+def version_of(info: dict) -> str:
+    """Version identifier of a latest_model.json entry"""
+    return str(info.get('timestamp') or info['model'])
+
+def load_model_version(info: dict, backend: str = "auto", precision: str = "float32") -> LoadedModel:
+    """Load the model described by a latest_model.json entry with the requested backend and precision"""
+    version = version_of(info)
+    if precision != "float32":
+        if backend == "keras":
+            raise ValueError(f"{precision} models run on the NumPy backend only")
+        variant = info.get('quantized', {}).get(precision)
+        if variant is None:
+            raise ValueError(f"No {precision} export found. Train with --quantize to create one.")
+        return load_numpy_model(variant['path'], version, info)
+
+    numpy_path = info.get('numpy')
+    use_numpy = backend == "numpy" or (
+        backend == "auto" and numpy_path and os.path.exists(numpy_path)
+    )
+
+    if use_numpy:
+        return load_numpy_model(numpy_path, version, info)
+    return load_keras_model(info['model'], info['encoder'], version, info)
+
+class ModelRegistry:
+    """Version/LRU cache of loaded models with an atomically swapped current model"""
+
+    def __init__(self, model_dir: str = "./models", backend: str = "auto", capacity: int = 2,
+                 poll_interval: float = 2.0, on_swap: Optional[Callable[[LoadedModel], None]] = None,
+                 precision: str = "float32"):
+        self.model_dir = model_dir
+        self.backend = backend
+        self.precision = precision
+        self.capacity = max(1, capacity)
+        self.poll_interval = poll_interval
+        self.on_swap = on_swap
+        self.latest_model_file = os.path.join(model_dir, "latest_model.json")
+
+        # Readers take a reference to `current` once per call, so a swap never affects in-flight work
+        self.current: Optional[LoadedModel] = None
+        self._models: "OrderedDict[str, LoadedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._last_seen = None
+
+    def read_latest_info(self) -> Optional[dict]:
+        """Read latest_model.json, or None when no model has been trained"""
+        if not os.path.exists(self.latest_model_file):
+            return None
+
+        with open(self.latest_model_file, 'r') as f:
+            return json.load(f)
+
+    def _file_key(self):
+        """(mtime_ns, size) of latest_model.json, or None when missing"""
+        try:
+            stat = os.stat(self.latest_model_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self, info: dict, warmup: bool = True) -> LoadedModel:
+        """Load (or fetch from the cache) the model version described by info"""
+        cached = self.get(version_of(info))
+        if cached is not None:
+            return cached
+
+        start = time.perf_counter()
+        model = load_model_version(info, self.backend, self.precision)
+        model.load_seconds = time.perf_counter() - start
+        if warmup:
+            start = time.perf_counter()
+            model.warmup()
+            model.warmup_seconds = time.perf_counter() - start
+
+        with self._lock:
+            self._models[model.version] = model
+            self._models.move_to_end(model.version)
+            self._evict(keep=model.version)
+        return model
+
+    def _evict(self, keep: Optional[str] = None):
+        """Drop least recently used versions beyond capacity, never the current one or keep"""
+        protected = {keep, self.current.version if self.current else None}
+        while len(self._models) > self.capacity:
+            for version in self._models:
+                if version not in protected:
+                    del self._models[version]
+                    break
+            else:
+                break
+
+    def get(self, version: str) -> Optional[LoadedModel]:
+        """Return a resident model version, marking it as recently used"""
+        with self._lock:
+            model = self._models.get(version)
+            if model is not None:
+                self._models.move_to_end(version)
+            return model
+
+    def versions(self) -> List[str]:
+        """Resident versions, least recently used first"""
+        with self._lock:
+            return list(self._models)
+
+    def activate(self, model: LoadedModel):
+        """Atomically make model the current version"""
+        with self._lock:
+            self.current = model
+            self._models[model.version] = model
+            self._models.move_to_end(model.version)
+            self._evict()
+
+        if self.on_swap is not None:
+            self.on_swap(model)
+
+    def load_latest(self) -> Optional[LoadedModel]:
+        """Load the model named in latest_model.json and make it current"""
+        self._last_seen = self._file_key()
+        info = self.read_latest_info()
+        if info is None:
+            print("No trained model found. Please run training first.")
+            return None
+
+        model = self.load(info)
+        self.activate(model)
+        return model
+
+    def check_for_update(self) -> bool:
+        """Load and swap in a new model if latest_model.json changed since the last check"""
+        key = self._file_key()
+        if key is None or key == self._last_seen:
+            return False
+        self._last_seen = key
+
+        try:
+            info = self.read_latest_info()
+            if self.current is not None and version_of(info) == self.current.version:
+                return False
+
+            model = self.load(info)
+        except Exception:
+            # Retry on the next poll, e.g. when the file was caught mid-write
+            self._last_seen = None
+            raise
+
+        self.activate(model)
+        print(f"🔄 Swapped in model version {model.version} ({model.backend} backend)")
+        return True
+
+    def _watch(self):
+        """Background polling loop"""
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.check_for_update()
+            except Exception as e:
+                # Keep serving the current model if the new one is incomplete or broken
+                print(f"Error reloading model: {e}")
+
+    def start_watching(self):
+        """Watch latest_model.json in a background thread"""
+        if self._watch_thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._watch_thread = threading.Thread(target=self._watch, name="model-registry", daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self):
+        """Stop the background watcher"""
+        if self._watch_thread is None:
+            return
+
+        self._stop_event.set()
+        self._watch_thread.join()
+        self._watch_thread = None
+
+    def stats(self) -> Dict:
+        """Current and resident versions"""
+        return {
+            "current": self.current.version if self.current else None,
+            "resident": self.versions(),
+        }
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Motion Gate
+Skips MediaPipe detection while the hand region of the frame is not changing
+"""
+
+import cv2
+import numpy as np
+from typing import Optional, Tuple
+
+class MotionGate:
+    """Cheap frame-difference test inside the last hand bounding box, with a forced refresh every K frames"""
+
+    def __init__(self, threshold: float = 6.0, refresh_interval: int = 10,
+                 margin: float = 0.2, patch_size: int = 32):
+        self.threshold = threshold
+        self.refresh_interval = refresh_interval
+        self.margin = margin
+        self.patch_size = patch_size
+
+        self._bbox: Optional[Tuple[int, int, int, int]] = None
+        self._reference: Optional[np.ndarray] = None
+        self._patch = np.empty((patch_size, patch_size, 3), dtype=np.uint8)
+        self._frames_since_refresh = 0
+
+        # Statistics
+        self.frames = 0
+        self.skipped = 0
+        self.last_score = 0.0
+
+    def bbox_from_landmarks(self, landmarks: np.ndarray, shape) -> Optional[Tuple[int, int, int, int]]:
+        """Pixel bounding box (x0, y0, x1, y1) around normalized landmarks, padded by margin"""
+        h, w = shape[:2]
+        points = landmarks.reshape(-1, 3)
+        x_min, y_min = points[:, 0].min(), points[:, 1].min()
+        x_max, y_max = points[:, 0].max(), points[:, 1].max()
+
+        pad_x = (x_max - x_min) * self.margin
+        pad_y = (y_max - y_min) * self.margin
+        x0 = int(max(0.0, x_min - pad_x) * w)
+        y0 = int(max(0.0, y_min - pad_y) * h)
+        x1 = int(min(1.0, x_max + pad_x) * w)
+        y1 = int(min(1.0, y_max + pad_y) * h)
+
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        return x0, y0, x1, y1
+
+    def _sample(self, frame: np.ndarray) -> np.ndarray:
+        """Downscale the bounding box region into a small grayscale patch"""
+        x0, y0, x1, y1 = self._bbox
+        cv2.resize(frame[y0:y1, x0:x1], (self.patch_size, self.patch_size),
+                   dst=self._patch, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(self._patch, cv2.COLOR_BGR2GRAY)
+
+    def should_detect(self, frame: np.ndarray) -> bool:
+        """True when the frame needs full detection; False when the previous result can be reused"""
+        self.frames += 1
+
+        if self._reference is None or self._frames_since_refresh >= self.refresh_interval:
+            return True
+
+        # Mean absolute difference of the hand region against the last detected frame
+        self.last_score = float(cv2.absdiff(self._sample(frame), self._reference).mean())
+        if self.last_score > self.threshold:
+            return True
+
+        self._frames_since_refresh += 1
+        self.skipped += 1
+        return False
+
+    def update(self, frame: np.ndarray, landmarks: Optional[np.ndarray]):
+        """Record the result of a full detection"""
+        self._frames_since_refresh = 0
+
+        self._bbox = None if landmarks is None else self.bbox_from_landmarks(landmarks, frame.shape)
+        if self._bbox is None:
+            # Without a hand there is no region to watch, so every frame is detected
+            self._reference = None
+            return
+
+        self._reference = self._sample(frame)
+
+    @property
+    def skip_ratio(self) -> float:
+        """Fraction of frames that reused the previous result"""
+        return self.skipped / self.frames if self.frames else 0.0
+
+    def reset(self):
+        """Forget the watched region and statistics"""
+        self._bbox = None
+        self._reference = None
+        self._frames_since_refresh = 0
+        self.frames = 0
+        self.skipped = 0
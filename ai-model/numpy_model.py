@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet NumPy Inference Engine
+Runs the exported dense landmark classifier with NumPy only, so serving never imports TensorFlow
+"""
+
+import os
+import json
+import argparse
+import numpy as np
+from typing import List, Optional, Tuple
+
+def relu(x: np.ndarray) -> np.ndarray:
+    """In-place ReLU"""
+    return np.maximum(x, 0, out=x)
+
+def softmax(x: np.ndarray) -> np.ndarray:
+    """In-place, numerically stable softmax over the last axis"""
+    x -= x.max(axis=-1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=-1, keepdims=True)
+    return x
+
+def linear(x: np.ndarray) -> np.ndarray:
+    """Identity activation"""
+    return x
+
+ACTIVATIONS = {
+    'relu': relu,
+    'softmax': softmax,
+    'linear': linear,
+}
+
+def export_numpy_model(model, class_labels, path: str) -> str:
+    """Export the Dense layers of a Keras model and its label classes to a compact .npz file"""
+    layers = []
+
+    for layer in model.layers:
+        weights = layer.get_weights()
+
+        # Input and Dropout layers carry no weights and are no-ops at inference time
+        if not weights:
+            continue
+
+        if layer.__class__.__name__ != 'Dense':
+            raise ValueError(f"Unsupported layer for NumPy export: {layer.name} ({layer.__class__.__name__})")
+
+        activation = layer.get_config()['activation']
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Unsupported activation for NumPy export: {activation}")
+
+        kernel, bias = weights
+        layers.append((kernel.astype(np.float32), bias.astype(np.float32), activation))
+
+    return save_numpy_model(path, layers, class_labels)
+
+def save_numpy_model(path: str, layers: List[Tuple[np.ndarray, np.ndarray, str]], class_labels,
+                     scales: Optional[List[Optional[np.ndarray]]] = None, precision: str = "float32") -> str:
+    """Write kernels, biases, activations and classes in the .npz layout read by NumpyDenseModel.load"""
+    arrays = {
+        'classes': np.asarray(class_labels).astype(str),
+        'activations': np.array([activation for _, _, activation in layers]),
+        'precision': np.array(precision),
+    }
+    for index, (kernel, bias, _) in enumerate(layers):
+        arrays[f'kernel_{index}'] = kernel
+        arrays[f'bias_{index}'] = bias.astype(np.float32)
+        if scales is not None and scales[index] is not None:
+            arrays[f'scale_{index}'] = scales[index].astype(np.float32)
+
+    np.savez(path, **arrays)
+    return path
+
+class NumpyDenseModel:
+    """Forward pass of a stack of Dense layers using NumPy matrix multiplies
+
+    Kernels may be stored as float32, float16, or int8 with a per-output-channel float32 scale.
+    Quantized kernels are widened to float32 once at load, so quantization only shrinks the
+    export on disk; the forward pass is the same float32 matmul for every precision.
+    """
+
+    def __init__(self, layers: List[Tuple[np.ndarray, np.ndarray, str]], class_labels: np.ndarray,
+                 scales: Optional[List[Optional[np.ndarray]]] = None, precision: str = "float32"):
+        scales = scales if scales is not None else [None] * len(layers)
+        self.activations = [activation for _, _, activation in layers]
+        self.class_labels = class_labels
+
+        # Size as exported; NumPy has no low-precision matmul, and multiplying a float32 batch
+        # by a float16/int8 kernel converts the whole kernel on every call
+        self.nbytes = sum(kernel.nbytes + bias.nbytes + (scale.nbytes if scale is not None else 0)
+                          for (kernel, bias, _), scale in zip(layers, scales))
+
+        self.layers = []
+        for (kernel, bias, activation), scale in zip(layers, scales):
+            kernel = kernel.astype(np.float32)
+            if scale is not None:
+                kernel *= scale
+            self.layers.append((kernel, bias.astype(np.float32), ACTIVATIONS[activation]))
+        self.precision = precision
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyDenseModel":
+        """Load a model written by export_numpy_model or the quantized exporter"""
+        with np.load(path, allow_pickle=False) as data:
+            activations = [str(a) for a in data['activations']]
+            layers = [
+                (data[f'kernel_{i}'], data[f'bias_{i}'], activation)
+                for i, activation in enumerate(activations)
+            ]
+            scales = [data[f'scale_{i}'] if f'scale_{i}' in data else None for i in range(len(activations))]
+            class_labels = data['classes']
+            precision = str(data['precision']) if 'precision' in data else "float32"
+
+        return cls(layers, class_labels, scales, precision)
+
+    @property
+    def input_shape(self) -> Tuple[None, int]:
+        """Model input shape, mirroring the Keras attribute"""
+        return (None, self.layers[0][0].shape[0])
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """Return class probabilities for a float32 batch of shape (N, features)"""
+        h = x
+        for kernel, bias, activation in self.layers:
+            h = h @ kernel
+            h += bias
+            h = activation(h)
+        return h
+
+def main(argv=None):
+    """Export the latest trained Keras model to the NumPy format"""
+    parser = argparse.ArgumentParser(description="Export the latest model for the NumPy backend")
+    parser.add_argument("--model-dir", default="./models")
+    parser.add_argument("--tolerance", type=float, default=1e-4,
+                        help="Largest probability difference vs Keras allowed before the export is rejected")
+    args = parser.parse_args(argv)
+
+    latest_model_file = os.path.join(args.model_dir, "latest_model.json")
+    if not os.path.exists(latest_model_file):
+        print("❌ No trained model found. Please run training first.")
+        return 1
+
+    with open(latest_model_file, 'r') as f:
+        latest_info = json.load(f)
+
+    import pickle
+    import tensorflow as tf
+
+    model = tf.keras.models.load_model(latest_info['model'])
+    with open(latest_info['encoder'], 'rb') as f:
+        label_encoder = pickle.load(f)
+
+    # Export next to the final path, which may be the export currently in use
+    numpy_path = os.path.splitext(latest_info['model'])[0] + ".npz"
+    tmp_path = os.path.splitext(latest_info['model'])[0] + ".tmp.npz"
+    export_numpy_model(model, label_encoder.classes_, tmp_path)
+
+    # Check that both backends agree before publishing the export
+    x = np.random.default_rng(0).random((256, model.input_shape[-1]), dtype=np.float32)
+    max_diff = float(np.abs(model(x, training=False).numpy() - NumpyDenseModel.load(tmp_path)(x)).max())
+    print(f"Max probability difference vs Keras: {max_diff:.2e}")
+
+    if not max_diff <= args.tolerance:
+        os.remove(tmp_path)
+        print(f"❌ NumPy export differs from Keras by more than {args.tolerance:.0e}; not published")
+        return 1
+
+    os.replace(tmp_path, numpy_path)
+    latest_info['numpy'] = numpy_path
+    with open(latest_model_file, 'w') as f:
+        json.dump(latest_info, f, indent=2)
+
+    print(f"✅ NumPy model exported to: {numpy_path}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -5,259 +5,696 @@ Real-time sign language recognition using trained CNN model and MediaPipe Hands
 """
 
 import os
-import cv2
+import argparse
 import numpy as np
-import mediapipe as mp
-import tensorflow as tf
-import pickle
-import json
 from typing import Optional, Tuple, List
 import time
+import threading
+
+from model_registry import PRECISIONS, LoadedModel, ModelRegistry
+from smoothing import VoteSmoother
+from hand_tracking import HandTrack, HandTracker
+from landmarks import FEATURE_SIZE, allocate_features, hands_from_results, landmarks_from_results, mirror_left_hands
+from instrumentation import Instrumentation, create_instrumentation
+from sequence_model import NEGATIVE_CLASS, SequenceModel, SequenceStream, load_latest_sequence_model
+from knn_index import INDEX_FILE, LandmarkIndex
+
+# TensorFlow is imported lazily so the NumPy backend never loads it; cv2 and MediaPipe are
+# imported on first detection, so model-only workers start without them
+BACKENDS = ("auto", "numpy", "keras")
+
+# How the nearest-neighbour index joins the dense model: only below knn_threshold, or always blended
+KNN_MODES = ("fallback", "combine")
+
+NO_HAND = "No hand detected"
+
+# (track, prediction, confidence, landmarks) for each hand in a frame
+HandResult = Tuple[HandTrack, str, float, np.ndarray]
+
+def create_tracking_hands(max_num_hands=1):
+    """Create a MediaPipe Hands instance configured for video streams"""
+    import mediapipe as mp
+    
+    return mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=max_num_hands,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
 
 class SignLanguagePredictor:
-    def __init__(self, model_dir="./models"):
+    def __init__(self, model_dir="./models", backend="auto", smoothing_window=5, weighted_smoothing=False,
+                 motion_threshold=None, refresh_interval=10, hot_reload=False, model_cache_size=2,
+                 poll_interval=2.0, precision="float32", instrumentation: Optional[Instrumentation] = None,
+                 headless=False, sequence=False, sequence_threshold=0.8, max_hands=1, mirror_left=False,
+                 knn=None, knn_index=None, knn_k=5, knn_weight=0.5, knn_threshold=0.6):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+        if max_hands > 1 and motion_threshold is not None:
+            raise ValueError("Skip-detection watches a single hand region; use it with max_hands=1")
+        if knn is not None and knn not in KNN_MODES:
+            raise ValueError(f"Unknown knn mode '{knn}', expected one of {KNN_MODES}")
+        
         self.model_dir = model_dir
-        self.model = None
-        self.label_encoder = None
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
+        self.backend = backend
+        self.precision = precision
+        self.registry = ModelRegistry(
+            model_dir,
+            backend=backend,
+            capacity=model_cache_size,
+            poll_interval=poll_interval,
+            precision=precision
         )
+        self.smoothing_window = smoothing_window
+        self.weighted_smoothing = weighted_smoothing
+        self.instrumentation = instrumentation
+        
+        # Headless mode never annotates frames; draw_landmarks stays available on demand
+        self.headless = headless
+        self._drawer = None
+        
+        # Per-thread RGB buffers reused by cvtColor (streams may share one predictor across threads)
+        self._rgb_buffers = threading.local()
+        
+        # Landmark vector recognize() detects into and fully consumes; callers get a copy
+        self._landmark_buffer = allocate_features()
+        
+        # MediaPipe Hands is created on first use (or by warmup())
+        self._hands = None
+        self._hands_lock = threading.Lock()
+        
+        # Seconds spent in each cold-start phase, see startup_report()
+        self.startup_timings = {}
         
         # Load the latest trained model
         self.load_latest_model()
+        current = self.registry.current
+        if current is not None:
+            self.startup_timings["model_load"] = current.load_seconds
+            self.startup_timings["model_warmup"] = current.warmup_seconds
         
         # Prediction history for smoothing
-        self.prediction_history = []
-        self.history_size = 5
+        self.smoother = self.create_smoother()
+        
+        # Optional temporal model for motion letters (J, Z) and dynamic signs, with this stream's window
+        self.sequence_threshold = sequence_threshold
+        self.sequence_model: Optional[SequenceModel] = None
+        if sequence:
+            self.load_sequence_model()
+        self.sequence_stream = self.create_sequence_stream()
+        
+        # Optional nearest-neighbour index of normalized landmarks: answers when the dense model is
+        # unsure or missing ("fallback") or is blended with it ("combine"); add_example() teaches it live
+        self.knn = knn
+        self.knn_k = knn_k
+        self.knn_weight = knn_weight
+        self.knn_threshold = knn_threshold
+        self.knn_path = None
+        self.knn_index: Optional[LandmarkIndex] = None
+        self._knn_union = None
+        if knn is not None:
+            self.load_knn_index(knn_index)
+        
+        # Up to max_hands hands per frame, each tracked with its own smoothing history and window;
+        # mirror_left classifies left hands in right-hand orientation
+        self.max_hands = max_hands
+        self.mirror_left = mirror_left
+        self.tracker = self.create_hand_tracker()
+        self.last_hands: List[HandResult] = []
+        
+        # Optional skip-detection mode: reuse the last result while the hand region is static
+        self.motion_gate = None
+        if motion_threshold is not None:
+            from motion import MotionGate
+            self.motion_gate = MotionGate(threshold=motion_threshold, refresh_interval=refresh_interval)
+        self._last_result = (NO_HAND, 0.0, None)
+        
+        # Watch latest_model.json and swap in newly trained models without a restart
+        if hot_reload:
+            self.registry.start_watching()
         
         print("SignSync Meet AI Predictor initialized!")
     
+    @property
+    def hands(self):
+        """Shared tracking Hands instance, created on first use"""
+        if self._hands is None:
+            with self._hands_lock:
+                if self._hands is None:
+                    start = time.perf_counter()
+                    self._hands = create_tracking_hands(self.max_hands)
+                    self.startup_timings["detector_init"] = time.perf_counter() - start
+        return self._hands
+    
+    @property
+    def mp_hands(self):
+        """mediapipe.solutions.hands"""
+        import mediapipe as mp
+        return mp.solutions.hands
+    
+    @property
+    def current_model(self) -> Optional[LoadedModel]:
+        """The model version currently serving predictions"""
+        return self.registry.current
+    
+    @property
+    def model(self):
+        """Underlying Keras or NumPy model of the current version"""
+        current = self.registry.current
+        return current.model if current else None
+    
+    @property
+    def label_encoder(self):
+        """LabelEncoder of the current version (Keras backend only)"""
+        current = self.registry.current
+        return current.label_encoder if current else None
+    
+    @property
+    def class_labels(self) -> Optional[np.ndarray]:
+        """Index-to-letter lookup table of the current version"""
+        current = self.registry.current
+        return current.class_labels if current else None
+    
+    @property
+    def num_features(self) -> Optional[int]:
+        """Input feature count of the current version (raw landmarks when only the k-NN index serves)"""
+        current = self.registry.current
+        if current is not None:
+            return current.num_features
+        return FEATURE_SIZE if self.knn_index is not None else None
+    
     def load_latest_model(self):
         """Load the latest trained model and label encoder"""
         try:
-            # Check for latest model info
-            latest_model_file = os.path.join(self.model_dir, "latest_model.json")
-            
-            if not os.path.exists(latest_model_file):
-                print("No trained model found. Please run training first.")
-                return
-            
-            with open(latest_model_file, 'r') as f:
-                latest_info = json.load(f)
-            
-            model_path = latest_info['model']
-            encoder_path = latest_info['encoder']
-            
-            # Load model
-            print(f"Loading model from: {model_path}")
-            self.model = tf.keras.models.load_model(model_path)
-            
-            # Load label encoder
-            print(f"Loading label encoder from: {encoder_path}")
-            with open(encoder_path, 'rb') as f:
-                self.label_encoder = pickle.load(f)
-            
-            print("Model and encoder loaded successfully!")
+            if self.registry.load_latest() is not None:
+                print("Model and encoder loaded successfully!")
             
         except Exception as e:
             print(f"Error loading model: {e}")
-            self.model = None
-            self.label_encoder = None
     
-    def extract_hand_landmarks(self, image: np.ndarray) -> Optional[np.ndarray]:
-        """Extract hand landmarks from image using MediaPipe"""
+    def create_smoother(self) -> Optional[VoteSmoother]:
+        """Create a ring-buffer vote smoother for one stream, sharing this model's label table"""
+        current = self.registry.current
+        if current is None:
+            return None
+        
+        return VoteSmoother(
+            current.class_labels,
+            window=self.smoothing_window,
+            weighted=self.weighted_smoothing,
+            label_index=current.label_index
+        )
+    
+    def current_smoother(self, smoother: Optional[VoteSmoother]) -> Optional[VoteSmoother]:
+        """Return smoother, or a fresh one when a hot swap changed the label table since it was made"""
+        current = self.registry.current
+        if current is not None and (smoother is None or smoother.label_index is not current.label_index):
+            return self.create_smoother()
+        return smoother
+    
+    def load_sequence_model(self):
+        """Load the latest trained sequence model, if any"""
         try:
-            # Convert BGR to RGB
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Process image with MediaPipe
-            results = self.hands.process(image_rgb)
-            
-            if results.multi_hand_landmarks:
-                # Get landmarks for the first detected hand
-                hand_landmarks = results.multi_hand_landmarks[0]
-                
-                # Extract 21 landmark points (x, y, z coordinates)
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    landmarks.extend([landmark.x, landmark.y, landmark.z])
-                
-                return np.array(landmarks)
+            start = time.perf_counter()
+            self.sequence_model = load_latest_sequence_model(self.model_dir)
+            if self.sequence_model is None:
+                print("No sequence model found; motion signs are disabled")
+            elif not self.sequence_model.has_negative_class:
+                # Without a "no motion" class any held letter scores as J or Z
+                print(f"Sequence model has no '{NEGATIVE_CLASS}' class; retrain it. Motion signs are disabled")
+                self.sequence_model = None
             else:
-                return None
+                self.startup_timings["sequence_load"] = time.perf_counter() - start
+                
+        except Exception as e:
+            print(f"Error loading sequence model: {e}")
+    
+    def create_sequence_stream(self) -> Optional[SequenceStream]:
+        """Create the sliding-window state for one stream, or None without a sequence model"""
+        if self.sequence_model is None:
+            return None
+        return self.sequence_model.stream()
+    
+    def predict_motion(self, landmarks: np.ndarray, stream: Optional[SequenceStream] = None) -> Optional[Tuple[str, float]]:
+        """Add a frame to a stream's window; return the motion sign when the sequence model is confident"""
+        stream = stream or self.sequence_stream
+        if stream is None:
+            return None
+        
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = time.perf_counter()
+        
+        prediction, confidence = stream.predict(landmarks)
+        
+        if instrumentation is not None:
+            instrumentation.observe("sequence", time.perf_counter() - start)
+        
+        if prediction == NEGATIVE_CLASS or confidence < self.sequence_threshold:
+            return None
+        return prediction, confidence
+    
+    def load_knn_index(self, path: Optional[str] = None):
+        """Open the index named in latest_model.json (or at path), starting an empty one if none exists"""
+        if path is None:
+            info = self.registry.read_latest_info() or {}
+            path = info.get('knn') or os.path.join(self.model_dir, "knn_index")
+        self.knn_path = path
+        
+        try:
+            if os.path.exists(os.path.join(path, INDEX_FILE)):
+                start = time.perf_counter()
+                self.knn_index = LandmarkIndex.load(path)
+                self.startup_timings["knn_load"] = time.perf_counter() - start
+                print(f"Nearest-neighbour index loaded: {len(self.knn_index)} examples")
+                return
+            print(f"No nearest-neighbour index at {path}; starting empty")
+            
+        except Exception as e:
+            print(f"Error loading nearest-neighbour index: {e}")
+        
+        self.knn_index = LandmarkIndex()
+    
+    def add_example(self, landmarks: np.ndarray, label: str, save: bool = False) -> int:
+        """Add (N, 63) landmark vectors of a label to the nearest-neighbour index; returns its size"""
+        if self.knn_index is None:
+            raise RuntimeError("Nearest-neighbour index is disabled; enable it with knn")
+        
+        self.knn_index.add(landmarks, label)
+        if save:
+            self.knn_index.save(self.knn_path)
+        return len(self.knn_index)
+    
+    def has_classifier(self) -> bool:
+        """Whether predictions can be made: a dense model or a non-empty nearest-neighbour index"""
+        return self.registry.current is not None or (self.knn_index is not None and len(self.knn_index) > 0)
+    
+    def create_hand_tracker(self) -> HandTracker:
+        """Create the hand identity tracker for one stream"""
+        return HandTracker(create_smoother=self.create_smoother, create_sequence=self.create_sequence_stream)
+    
+    def resolve_model(self, version: Optional[str] = None) -> LoadedModel:
+        """Return the current model, or a specific resident version for A/B comparisons"""
+        model = self.registry.current if version is None else self.registry.get(version)
+        if model is None:
+            raise RuntimeError("Model not loaded" if version is None else f"Model version {version} is not resident")
+        return model
+    
+    def predict_proba(self, landmarks: np.ndarray, version: Optional[str] = None) -> np.ndarray:
+        """Return class probabilities for landmark vectors of shape (N, 63)"""
+        return self.resolve_model(version).predict_proba(landmarks)
+    
+    def predict_batch(self, landmarks: np.ndarray, version: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict signs for a batch of landmark vectors of shape (N, 63)"""
+        index = self.knn_index
+        use_knn = index is not None and len(index) > 0
+        
+        # Without a dense model the nearest-neighbour index answers alone
+        if use_knn and version is None and self.registry.current is None:
+            return index.predict(landmarks, self.knn_k)
+        
+        # Take one reference so a concurrent hot swap cannot mix versions within a batch
+        model = self.resolve_model(version)
+        probabilities = model.predict_proba(landmarks)
+        
+        if use_knn:
+            return self.predict_with_knn(model, index, landmarks, probabilities)
+        
+        # Get predicted classes and confidences
+        class_idx = probabilities.argmax(axis=1)
+        confidences = probabilities[np.arange(len(class_idx)), class_idx]
+        
+        return model.class_labels[class_idx], confidences
+    
+    def predict_with_knn(self, model: LoadedModel, index: LandmarkIndex, landmarks: np.ndarray,
+                         probabilities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Combine dense probabilities with the neighbours' vote, or fall back to it when unsure"""
+        shares = index.vote(landmarks, self.knn_k)
+        rows = np.arange(len(shares))
+        
+        # Nothing indexed yet: the dense model alone
+        if shares.shape[1] == 0:
+            class_idx = probabilities.argmax(axis=1)
+            return model.class_labels[class_idx], probabilities[rows, class_idx]
+        
+        if self.knn == "combine":
+            labels, dense_columns, knn_columns = self._knn_label_union(model, index.classes[:shares.shape[1]])
+            scores = np.zeros((len(shares), len(labels)), dtype=np.float32)
+            scores[:, dense_columns] = (1.0 - self.knn_weight) * probabilities
+            scores[:, knn_columns] += self.knn_weight * shares
+            best = scores.argmax(axis=1)
+            return labels[best], scores[rows, best]
+        
+        class_idx = probabilities.argmax(axis=1)
+        confidences = probabilities[rows, class_idx]
+        knn_idx = shares.argmax(axis=1)
+        knn_confidences = shares[rows, knn_idx]
+        
+        use = (confidences < self.knn_threshold) & (knn_confidences > confidences)
+        labels = np.where(use, np.asarray(index.classes)[knn_idx], model.class_labels[class_idx])
+        return labels, np.where(use, knn_confidences, confidences)
+    
+    def _knn_label_union(self, model: LoadedModel, knn_classes: List[str]):
+        """(labels, dense columns, index columns) of the union of both label sets, cached per version"""
+        key = (model.version, len(knn_classes))
+        cached = self._knn_union
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        labels = [str(label) for label in model.class_labels]
+        positions = {label: i for i, label in enumerate(labels)}
+        for label in knn_classes:
+            if label not in positions:
+                positions[label] = len(labels)
+                labels.append(label)
+        
+        union = (np.asarray(labels), np.arange(len(model.class_labels)),
+                 np.array([positions[label] for label in knn_classes], dtype=np.intp))
+        self._knn_union = (key, union)
+        return union
+    
+    def detect_hands(self, image: np.ndarray, hands=None):
+        """Run MediaPipe on a BGR image and return its raw results"""
+        import cv2
+        
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = time.perf_counter()
+        
+        # Convert BGR to RGB into this thread's reused buffer
+        image_rgb = self._rgb_buffer(image)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image_rgb)
+        
+        if instrumentation is not None:
+            converted = time.perf_counter()
+            instrumentation.observe("color_convert", converted - start)
+        
+        # Process image with MediaPipe
+        results = (hands or self.hands).process(image_rgb)
+        
+        if instrumentation is not None:
+            instrumentation.observe("detect", time.perf_counter() - converted)
+        
+        return results
+    
+    def extract_hand_landmarks(self, image: np.ndarray, hands=None,
+                               out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Extract hand landmarks from image using MediaPipe, optionally with a per-stream Hands instance and output buffer"""
+        try:
+            # Get the 21 (x, y, z) landmarks of the first detected hand
+            return landmarks_from_results(self.detect_hands(image, hands), out)
                 
         except Exception as e:
             print(f"Error extracting landmarks: {e}")
+            if self.instrumentation is not None:
+                self.instrumentation.count("errors")
             return None
     
+    def extract_all_hands(self, image: np.ndarray, hands=None,
+                          out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, List[str]]:
+        """Extract up to max_hands hands as ((N, 63) landmark rows, handedness labels)"""
+        if out is None:
+            out = allocate_features(self.max_hands)
+        try:
+            handedness = hands_from_results(self.detect_hands(image, hands), out)
+            return out[:len(handedness)], handedness
+            
+        except Exception as e:
+            print(f"Error extracting landmarks: {e}")
+            if self.instrumentation is not None:
+                self.instrumentation.count("errors")
+            return out[:0], []
+    
+    def _rgb_buffer(self, image: np.ndarray) -> np.ndarray:
+        """RGB conversion buffer for the calling thread, reallocated only when the frame size changes"""
+        buffer = getattr(self._rgb_buffers, "rgb", None)
+        if buffer is None or buffer.shape != image.shape:
+            # MediaPipe copies the image into its own packet, so the buffer is free once process() returns
+            buffer = np.empty(image.shape, dtype=np.uint8)
+            self._rgb_buffers.rgb = buffer
+        return buffer
+    
     def predict_sign(self, landmarks: np.ndarray) -> Tuple[str, float]:
         """Predict sign language from hand landmarks"""
-        if self.model is None or self.label_encoder is None:
+        if not self.has_classifier():
             return "Model not loaded", 0.0
         
+        instrumentation = self.instrumentation
         try:
-            # Reshape landmarks for model input
-            landmarks_reshaped = landmarks.reshape(1, -1)
-            
-            # Make prediction
-            prediction = self.model.predict(landmarks_reshaped, verbose=0)
+            if instrumentation is not None:
+                start = time.perf_counter()
             
-            # Get predicted class and confidence
-            predicted_class_idx = np.argmax(prediction[0])
-            confidence = float(prediction[0][predicted_class_idx])
+            labels, confidences = self.predict_batch(landmarks.reshape(1, -1))
             
-            # Decode class label
-            predicted_class = self.label_encoder.inverse_transform([predicted_class_idx])[0]
+            if instrumentation is not None:
+                instrumentation.observe("classify", time.perf_counter() - start)
             
-            return predicted_class, confidence
+            return str(labels[0]), float(confidences[0])
             
         except Exception as e:
             print(f"Error during prediction: {e}")
+            if instrumentation is not None:
+                instrumentation.count("errors")
             return "Error", 0.0
     
+    def hand_features(self, landmarks: np.ndarray, handedness: List[str]) -> np.ndarray:
+        """Classifier input for detected hands: left hands mirrored when mirror_left is set"""
+        if self.mirror_left:
+            return mirror_left_hands(landmarks, handedness)
+        return landmarks
+    
+    def classify_hands(self, features: np.ndarray, version: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Classify every hand of one or more frames in a single forward pass"""
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = time.perf_counter()
+        
+        labels, confidences = self.predict_batch(features, version)
+        
+        if instrumentation is not None:
+            instrumentation.observe("classify", time.perf_counter() - start)
+        
+        return labels, confidences
+    
     def smooth_predictions(self, prediction: str, confidence: float) -> Tuple[str, float]:
         """Smooth predictions using history to reduce jitter"""
-        # Add current prediction to history
-        self.prediction_history.append((prediction, confidence))
-        
-        # Keep only recent predictions
-        if len(self.prediction_history) > self.history_size:
-            self.prediction_history.pop(0)
-        
-        # If we have enough history, use majority voting
-        if len(self.prediction_history) >= 3:
-            # Get most common prediction
-            predictions = [p[0] for p in self.prediction_history]
-            from collections import Counter
-            most_common = Counter(predictions).most_common(1)[0]
+        # Start a fresh history when a hot swap changed the label table
+        self.smoother = self.current_smoother(self.smoother)
+        
+        if self.smoother is None:
+            return prediction, confidence
+        
+        return self.smoother.update_label(prediction, confidence)
+    
+    def recognize_hands(self, frame: np.ndarray, timings: Optional[dict] = None) -> List[HandResult]:
+        """Detect every hand, classify them in one batch and smooth each with its tracked history"""
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            instrumentation.count("frames")
+        
+        start = time.perf_counter()
+        landmarks, handedness = self.extract_all_hands(frame)
+        detected = time.perf_counter()
+        if timings is not None:
+            timings["detect"] = detected - start
+        
+        tracks = self.tracker.update(landmarks, handedness)
+        if not tracks:
+            if instrumentation is not None:
+                instrumentation.count("no_hand")
+            self.last_hands = []
+            return self.last_hands
+        
+        features = self.hand_features(landmarks, handedness)
+        if not self.has_classifier():
+            labels, confidences = ["Model not loaded"] * len(tracks), np.zeros(len(tracks))
+        else:
+            labels, confidences = self.classify_hands(features)
+        classified = time.perf_counter()
+        
+        results = []
+        for track, row, hand_features, label, confidence in zip(tracks, landmarks, features, labels, confidences):
+            prediction, confidence = str(label), float(confidence)
+            
+            # The sequence model sees the same features as the classifier
+            if track.sequence is not None:
+                motion = self.predict_motion(hand_features, track.sequence)
+                if motion is not None:
+                    prediction, confidence = motion
             
-            # Calculate average confidence for most common prediction
-            avg_confidence = np.mean([p[1] for p in self.prediction_history if p[0] == most_common[0]])
+            # Start a fresh history when a hot swap changed the label table
+            track.smoother = self.current_smoother(track.smoother)
+            if track.smoother is not None:
+                prediction, confidence = track.smoother.update_label(prediction, confidence)
             
-            return most_common[0], avg_confidence
+            results.append((track, prediction, confidence, row))
         
-        # Return current prediction if not enough history
-        return prediction, confidence
+        if timings is not None:
+            timings["classify"] = time.perf_counter() - detected
+        if instrumentation is not None:
+            instrumentation.observe("smooth", time.perf_counter() - classified)
+            instrumentation.count("hands", len(results))
+        
+        # Longest-tracked hand first, so the primary signer stays stable
+        results.sort(key=lambda result: (-result[0].age, result[0].id))
+        self.last_hands = results
+        return results
     
-    def process_frame(self, frame: np.ndarray) -> Tuple[str, float, np.ndarray]:
-        """Process a single frame and return prediction results"""
+    def recognize(self, frame: np.ndarray, timings: Optional[dict] = None) -> Tuple[str, float, Optional[np.ndarray]]:
+        """Detect, classify and smooth one frame, returning (prediction, confidence, landmarks)
+        
+        With max_hands > 1 this is the primary hand of recognize_hands(); all hands are in last_hands.
+        """
+        if self.max_hands > 1:
+            hands = self.recognize_hands(frame, timings)
+            if not hands:
+                return NO_HAND, 0.0, None
+            _, prediction, confidence, landmarks = hands[0]
+            return prediction, confidence, landmarks
+        
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            instrumentation.count("frames")
+        
+        # Reuse the previous landmarks and prediction while the hand region is unchanged
+        if self.motion_gate is not None and not self.motion_gate.should_detect(frame):
+            if instrumentation is not None:
+                instrumentation.count("skipped")
+            return self._last_result
+        
         # Extract hand landmarks
-        landmarks = self.extract_hand_landmarks(frame)
+        start = time.perf_counter()
+        landmarks = self.extract_hand_landmarks(frame, out=self._landmark_buffer)
+        detected = time.perf_counter()
         
         if landmarks is not None:
-            # Make prediction
+            # Make prediction; a confident motion sign over the recent window takes precedence
             prediction, confidence = self.predict_sign(landmarks)
+            motion = self.predict_motion(landmarks)
+            if motion is not None:
+                prediction, confidence = motion
+            classified = time.perf_counter()
             
             # Smooth predictions
-            smoothed_prediction, smoothed_confidence = self.smooth_predictions(prediction, confidence)
+            prediction, confidence = self.smooth_predictions(prediction, confidence)
             
-            # Draw hand landmarks on frame
-            annotated_frame = self.draw_landmarks(frame, landmarks)
-            
-            return smoothed_prediction, smoothed_confidence, annotated_frame
+            if timings is not None:
+                timings["classify"] = time.perf_counter() - detected
+            if instrumentation is not None:
+                instrumentation.observe("smooth", time.perf_counter() - classified)
+                instrumentation.count("hands")
         else:
-            # No hand detected
-            return "No hand detected", 0.0, frame
+            # No hand detected; a motion sign must be seen without interruption
+            prediction, confidence = NO_HAND, 0.0
+            if self.sequence_stream is not None:
+                self.sequence_stream.reset()
+            if instrumentation is not None:
+                instrumentation.count("no_hand")
+        
+        if timings is not None:
+            timings["detect"] = detected - start
+        
+        if self.motion_gate is not None:
+            self.motion_gate.update(frame, landmarks)
+        
+        # The result may be queued or kept by the caller, so it owns its landmarks
+        if landmarks is not None:
+            landmarks = landmarks.copy()
+        self._last_result = (prediction, confidence, landmarks)
+        return self._last_result
     
-    def draw_landmarks(self, frame: np.ndarray, landmarks: np.ndarray) -> np.ndarray:
-        """Draw hand landmarks on the frame"""
+    def process_frame(self, frame: np.ndarray) -> Tuple[str, float, np.ndarray]:
+        """Process a single frame and return prediction results
+        
+        Landmarks are drawn onto the frame in place; headless predictors return it untouched.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = time.perf_counter()
+        
+        prediction, confidence, landmarks = self.recognize(frame)
+        
+        if landmarks is not None and not self.headless:
+            # Draw hand landmarks on frame
+            if instrumentation is not None:
+                drawing = time.perf_counter()
+            if self.max_hands > 1:
+                for _, _, _, hand_landmarks in self.last_hands:
+                    frame = self.draw_landmarks(frame, hand_landmarks)
+            else:
+                frame = self.draw_landmarks(frame, landmarks)
+            if instrumentation is not None:
+                instrumentation.observe("draw", time.perf_counter() - drawing)
+        
+        if instrumentation is not None:
+            instrumentation.observe("total", time.perf_counter() - start)
+            instrumentation.maybe_export()
+        
+        return prediction, confidence, frame
+    
+    def draw_landmarks(self, frame: np.ndarray, landmarks: np.ndarray, copy: bool = False) -> np.ndarray:
+        """Draw hand landmarks onto the frame in place (or onto a copy) and return it"""
         try:
-            # Convert landmarks back to MediaPipe format for drawing
-            h, w, _ = frame.shape
+            if copy:
+                frame = frame.copy()
             
-            # Create MediaPipe drawing utilities
-            mp_drawing = mp.solutions.drawing_utils
-            mp_drawing_styles = mp.solutions.drawing_styles
+            # Styles are resolved once, on first use
+            if self._drawer is None:
+                from drawing import HandDrawer
+                self._drawer = HandDrawer()
             
-            # Convert landmarks to MediaPipe format
-            hand_landmarks = self.mp_hands.HandLandmark
-            landmarks_list = []
-            
-            for i in range(0, len(landmarks), 3):
-                x, y, z = landmarks[i:i+3]
-                # Convert normalized coordinates to pixel coordinates
-                px, py = int(x * w), int(y * h)
-                landmarks_list.append(mp_drawing.DrawingSpec(
-                    color=(0, 255, 0), thickness=2, circle_radius=2
-                ))
-            
-            # Draw landmarks
-            annotated_frame = frame.copy()
-            
-            # Draw hand connections
-            mp_drawing.draw_landmarks(
-                annotated_frame,
-                landmarks_list,
-                self.mp_hands.HAND_CONNECTIONS,
-                mp_drawing_styles.get_default_hand_landmarks_style(),
-                mp_drawing_styles.get_default_hand_connections_style()
-            )
-            
-            return annotated_frame
+            return self._drawer.draw(frame, landmarks)
             
         except Exception as e:
             print(f"Error drawing landmarks: {e}")
             return frame
     
-    def real_time_prediction(self, camera_index: int = 0):
+    def warmup(self, batch_size: int = 8, detector: bool = True, frame_shape=(480, 640, 3)):
+        """Pay one-off costs before the first real frame: model graph/allocations and MediaPipe's graph"""
+        current = self.registry.current
+        if current is not None:
+            start = time.perf_counter()
+            current.warmup(1)
+            current.warmup(batch_size)
+            self.startup_timings["model_warmup"] = (
+                self.startup_timings.get("model_warmup", 0.0) + time.perf_counter() - start
+            )
+        
+        if detector:
+            # The first process() call loads the TFLite models; a blank frame is enough
+            hands = self.hands
+            start = time.perf_counter()
+            self.extract_hand_landmarks(np.zeros(frame_shape, dtype=np.uint8), hands=hands)
+            self.startup_timings["detector_warmup"] = time.perf_counter() - start
+        
+        return self.startup_timings
+    
+    def startup_report(self) -> str:
+        """Cold-start time breakdown by phase"""
+        lines = ["Startup time breakdown:"]
+        for phase, seconds in self.startup_timings.items():
+            lines.append(f"  {phase:<16} {seconds * 1000:9.1f} ms")
+        lines.append(f"  {'total':<16} {sum(self.startup_timings.values()) * 1000:9.1f} ms")
+        return "\n".join(lines)
+    
+    def real_time_prediction(self, camera_index: int = 0, every_n: int = 1,
+                             target_fps: Optional[float] = None):
         """Run real-time prediction from camera feed"""
+        from realtime import RealtimePipeline
+        
         print("Starting real-time sign language prediction...")
         print("Press 'q' to quit, 's' to save current frame")
         
-        cap = cv2.VideoCapture(camera_index)
-        
-        if not cap.isOpened():
-            print("Error: Could not open camera")
-            return
-        
-        try:
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    print("Error: Could not read frame")
-                    break
-                
-                # Process frame
-                prediction, confidence, annotated_frame = self.process_frame(frame)
-                
-                # Add prediction text to frame
-                text = f"Prediction: {prediction} ({confidence:.2f})"
-                cv2.putText(annotated_frame, text, (10, 30), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                
-                # Add instructions
-                cv2.putText(annotated_frame, "Press 'q' to quit, 's' to save", 
-                           (10, annotated_frame.shape[0] - 20), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                
-                # Display frame
-                cv2.imshow('SignSync Meet - Sign Language Recognition', annotated_frame)
-                
-                # Handle key presses
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    break
-                elif key == ord('s'):
-                    # Save current frame
-                    timestamp = int(time.time())
-                    filename = f"captured_frame_{timestamp}.jpg"
-                    cv2.imwrite(filename, annotated_frame)
-                    print(f"Frame saved as: {filename}")
-                
-                # Small delay to reduce CPU usage
-                time.sleep(0.03)
-                
-        finally:
-            cap.release()
-            cv2.destroyAllWindows()
-            print("Real-time prediction stopped")
+        pipeline = RealtimePipeline(self, camera_index=camera_index, every_n=every_n, target_fps=target_fps)
+        pipeline.run()
+        print("Real-time prediction stopped")
     
     def predict_from_image(self, image_path: str) -> Tuple[str, float]:
         """Predict sign language from a single image"""
+        import cv2
+        
         try:
             # Load image
             image = cv2.imread(image_path)
@@ -272,29 +709,38 @@ class SignLanguagePredictor:
                 prediction, confidence = self.predict_sign(landmarks)
                 return prediction, confidence
             else:
-                return "No hand detected", 0.0
+                return NO_HAND, 0.0
                 
         except Exception as e:
             print(f"Error processing image {image_path}: {e}")
             return "Error", 0.0
-
-def main():
-    """Main function for testing the predictor"""
-    # Initialize predictor
-    predictor = SignLanguagePredictor()
-    
-    if predictor.model is None:
-        print("❌ Model not loaded. Please train a model first.")
-        return 1
     
+    def learn_from_image(self, image_path: str, label: str, save: bool = True) -> bool:
+        """Add the hand in an image to the nearest-neighbour index as an example of label"""
+        import cv2
+        
+        image = cv2.imread(image_path)
+        if image is None:
+            raise ValueError(f"Could not load image: {image_path}")
+        
+        landmarks = self.extract_hand_landmarks(image)
+        if landmarks is None:
+            return False
+        
+        self.add_example(landmarks, label, save=save)
+        return True
+
+def interactive_menu(predictor: SignLanguagePredictor) -> int:
+    """Interactive menu for testing the predictor"""
     print("\n🎯 SignSync Meet AI Predictor Ready!")
     print("Choose an option:")
     print("1. Real-time camera prediction")
     print("2. Predict from image file")
-    print("3. Exit")
+    print("3. Add an image as an example of a sign")
+    print("4. Exit")
     
     while True:
-        choice = input("\nEnter your choice (1-3): ").strip()
+        choice = input("\nEnter your choice (1-4): ").strip()
         
         if choice == '1':
             print("\nStarting real-time prediction...")
@@ -310,13 +756,165 @@ def main():
                 print("❌ Image file not found!")
                 
         elif choice == '3':
+            if predictor.knn_index is None:
+                print("❌ Start the predictor with --knn to add examples")
+                continue
+            image_path = input("Enter image path: ").strip()
+            label = input("Enter the sign it shows: ").strip()
+            if not os.path.exists(image_path) or not label:
+                print("❌ Image file not found or no sign given!")
+            elif predictor.learn_from_image(image_path, label):
+                print(f"✅ Added an example of '{label}' ({len(predictor.knn_index)} examples)")
+            else:
+                print("❌ No hand detected in the image")
+                
+        elif choice == '4':
             print("👋 Goodbye!")
             break
             
         else:
-            print("❌ Invalid choice. Please enter 1, 2, or 3.")
+            print("❌ Invalid choice. Please enter 1, 2, 3, or 4.")
     
     return 0
 
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="SignSync Meet sign language predictor")
+    parser.add_argument("--model-dir", default="./models")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto")
+    parser.add_argument("--precision", choices=PRECISIONS, default="float32",
+                        help="Weight precision; float16/int8 use the quantized NumPy exports")
+    parser.add_argument("--smoothing-window", type=int, default=5, help="Frames in the smoothing vote window")
+    parser.add_argument("--weighted-smoothing", action="store_true", help="Weight smoothing votes by confidence")
+    parser.add_argument("--motion-threshold", type=float, default=None,
+                        help="Skip detection while the hand region changes less than this (mean gray levels)")
+    parser.add_argument("--refresh-interval", type=int, default=10,
+                        help="Force a full detection at least every K frames in skip-detection mode")
+    parser.add_argument("--headless", action="store_true",
+                        help="Never annotate frames in process_frame (drawing stays available on demand)")
+    parser.add_argument("--metrics", choices=("off", "log", "prometheus"), default="off",
+                        help="Per-stage timing and counters: log lines or a Prometheus text file")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="Seconds per metrics window")
+    parser.add_argument("--metrics-file", default="signsync_metrics.prom",
+                        help="Prometheus text file written with --metrics prometheus")
+    parser.add_argument("--no-warmup", action="store_true",
+                        help="Skip warming up the model and MediaPipe before the first frame")
+    parser.add_argument("--startup-report", action="store_true", help="Print the cold-start time breakdown")
+    parser.add_argument("--sequence", action="store_true",
+                        help="Also recognize motion letters (J, Z) with the latest trained sequence model")
+    parser.add_argument("--sequence-threshold", type=float, default=0.8,
+                        help="Sequence model confidence needed to override the per-frame prediction")
+    parser.add_argument("--max-hands", type=int, default=1,
+                        help="Hands detected, tracked and classified per frame (two-handed signs, several signers)")
+    parser.add_argument("--mirror-left", action="store_true",
+                        help="Mirror left hands into right-hand orientation before classifying them")
+    parser.add_argument("--knn", choices=KNN_MODES, default=None,
+                        help="Use the nearest-neighbour landmark index when the model is unsure, or blend it in")
+    parser.add_argument("--knn-index", default=None,
+                        help="Index directory (default: the one in latest_model.json, else <model-dir>/knn_index)")
+    parser.add_argument("--knn-k", type=int, default=5, help="Neighbours voting on each prediction")
+    parser.add_argument("--knn-weight", type=float, default=0.5, help="Share of the neighbours' vote with --knn combine")
+    parser.add_argument("--knn-threshold", type=float, default=0.6,
+                        help="Model confidence below which --knn fallback consults the neighbours")
+    parser.add_argument("--hot-reload", action="store_true",
+                        help="Watch latest_model.json and swap in newly trained models")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    camera_parser = subparsers.add_parser("camera", help="Run pipelined real-time prediction from a camera")
+    camera_parser.add_argument("--camera-index", type=int, default=0)
+    camera_parser.add_argument("--every-n", type=int, default=1,
+                               help="Run detection on every Nth frame and reuse the last result in between")
+    camera_parser.add_argument("--target-fps", type=float, default=None,
+                               help="Display frame rate (defaults to the camera's)")
+    
+    serve_parser = subparsers.add_parser("serve", help="Run the multi-session Socket.IO recognition server")
+    serve_parser.add_argument("--host", default="0.0.0.0")
+    serve_parser.add_argument("--port", type=int, default=5000)
+    serve_parser.add_argument("--workers", type=int, default=4, help="Threads for decoding and MediaPipe")
+    serve_parser.add_argument("--max-batch-size", type=int, default=32)
+    serve_parser.add_argument("--max-wait-ms", type=float, default=5.0,
+                              help="Longest time a frame waits for its inference batch to fill")
+    
+    transcribe_parser = subparsers.add_parser("transcribe-video",
+                                              help="Transcribe video files into timestamped JSONL predictions")
+    transcribe_parser.add_argument("videos", nargs="+", help="Video files or directories")
+    transcribe_parser.add_argument("--output-dir", default="./transcripts")
+    transcribe_parser.add_argument("--workers", type=int, default=1, help="Videos processed in parallel")
+    transcribe_parser.add_argument("--batch-size", type=int, default=64)
+    transcribe_parser.add_argument("--stride", type=int, default=1, help="Process every Nth frame")
+    
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function for testing the predictor"""
+    args = parse_args(argv)
+    
+    if args.command == "transcribe-video":
+        # Each worker loads its own predictor
+        from transcribe import collect_videos, transcribe_files
+        summaries = transcribe_files(
+            collect_videos(args.videos),
+            args.output_dir,
+            model_dir=args.model_dir,
+            backend=args.backend,
+            precision=args.precision,
+            max_hands=args.max_hands,
+            mirror_left=args.mirror_left,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            stride=args.stride
+        )
+        return 1 if any("error" in summary for summary in summaries) else 0
+    
+    # Initialize predictor
+    predictor = SignLanguagePredictor(
+        model_dir=args.model_dir,
+        backend=args.backend,
+        precision=args.precision,
+        smoothing_window=args.smoothing_window,
+        weighted_smoothing=args.weighted_smoothing,
+        motion_threshold=args.motion_threshold,
+        refresh_interval=args.refresh_interval,
+        hot_reload=args.hot_reload,
+        headless=args.headless,
+        sequence=args.sequence,
+        sequence_threshold=args.sequence_threshold,
+        max_hands=args.max_hands,
+        mirror_left=args.mirror_left,
+        knn=args.knn,
+        knn_index=args.knn_index,
+        knn_k=args.knn_k,
+        knn_weight=args.knn_weight,
+        knn_threshold=args.knn_threshold,
+        instrumentation=create_instrumentation(args.metrics, args.metrics_interval, args.metrics_file)
+    )
+    
+    # A nearest-neighbour index can serve (and be taught) without a dense model
+    if predictor.model is None and predictor.knn_index is None:
+        print("❌ Model not loaded. Please train a model first.")
+        return 1
+    
+    if not args.no_warmup:
+        predictor.warmup()
+    if args.startup_report:
+        print(predictor.startup_report())
+    
+    if args.command == "camera":
+        predictor.real_time_prediction(args.camera_index, every_n=args.every_n, target_fps=args.target_fps)
+        return 0
+    
+    if args.command == "serve":
+        from server import run_server
+        return run_server(
+            predictor,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            max_batch_size=args.max_batch_size,
+            max_wait_ms=args.max_wait_ms
+        )
+    
+    return interactive_menu(predictor)
+
 if __name__ == "__main__":
     exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Model Quantization
+Post-training float16 and per-channel int8 exports of the NumPy model, gated on held-out accuracy
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from numpy_model import NumpyDenseModel, save_numpy_model
+
+PRECISIONS = ("float16", "int8")
+
+# Clipping percentiles of |W| tried per layer during int8 calibration (100 = plain max)
+CLIP_PERCENTILES = (100.0, 99.99, 99.9, 99.5)
+
+def quantize_int8_per_channel(kernel: np.ndarray, percentile: float = 100.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric int8 quantization with one scale per output channel (kernel column)"""
+    magnitude = np.abs(kernel)
+    if percentile >= 100.0:
+        clip = magnitude.max(axis=0)
+    else:
+        clip = np.percentile(magnitude, percentile, axis=0)
+
+    scale = (np.maximum(clip, 1e-12) / 127.0).astype(np.float32)
+    quantized = np.clip(np.rint(kernel / scale), -127, 127).astype(np.int8)
+    return quantized, scale
+
+def calibrate_int8_layers(model: NumpyDenseModel, X_cal: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray, float]]:
+    """Quantize every kernel, choosing the clip percentile that best reproduces the layer's
+    pre-activation outputs on the calibration slice"""
+    quantized_layers = []
+    h = np.asarray(X_cal, dtype=np.float32)
+
+    for kernel, bias, activation in model.layers:
+        reference = h @ kernel
+        best = None
+        for percentile in CLIP_PERCENTILES:
+            quantized, scale = quantize_int8_per_channel(kernel, percentile)
+            error = float(np.mean(((h @ quantized) * scale - reference) ** 2))
+            if best is None or error < best[0]:
+                best = (error, quantized, scale, percentile)
+
+        _, quantized, scale, percentile = best
+        quantized_layers.append((quantized, scale, percentile))
+
+        # Later layers are calibrated on the float model's activations
+        reference += bias
+        h = activation(reference)
+
+    return quantized_layers
+
+def accuracy(model: NumpyDenseModel, X: np.ndarray, y: np.ndarray) -> float:
+    """Top-1 accuracy against encoded class indices"""
+    predictions = model(np.asarray(X, dtype=np.float32)).argmax(axis=1)
+    return float(np.mean(predictions == y))
+
+def measure_latency(model: NumpyDenseModel, num_features: int, batch_size: int = 1,
+                    iterations: int = 200, warmup: int = 20) -> float:
+    """Median forward pass latency in microseconds"""
+    x = np.random.default_rng(0).random((batch_size, num_features), dtype=np.float32)
+    for _ in range(warmup):
+        model(x)
+
+    samples = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        model(x)
+        samples[i] = time.perf_counter() - start
+    return float(np.median(samples) * 1e6)
+
+def variant_path(float_path: str, precision: str) -> str:
+    """models/sign_language_model_<ts>.npz -> models/sign_language_model_<ts>_<precision>.npz"""
+    root, ext = os.path.splitext(float_path)
+    return f"{root}_{precision}{ext}"
+
+def describe(model: NumpyDenseModel, path: str, X_test: np.ndarray, y_test: np.ndarray) -> Dict:
+    """Size, accuracy and latency metadata recorded for one exported model"""
+    num_features = model.input_shape[-1]
+    return {
+        'path': path,
+        'size_bytes': os.path.getsize(path),
+        'weight_bytes': model.nbytes,
+        'accuracy': accuracy(model, X_test, y_test),
+        'latency_us': measure_latency(model, num_features),
+        'batch_latency_us': measure_latency(model, num_features, batch_size=32),
+    }
+
+def export_variant(base: NumpyDenseModel, float_path: str, precision: str, baseline: float,
+                   X_cal: np.ndarray, X_test: np.ndarray, y_test: np.ndarray, tolerance: float,
+                   pending: Dict[str, str]) -> Dict:
+    """Write one variant to a temporary path recorded in `pending` and return its metadata"""
+    path = os.path.splitext(variant_path(float_path, precision))[0] + ".tmp.npz"
+    if precision == "float16":
+        layers = [(kernel.astype(np.float16), bias, activation)
+                  for (kernel, bias, _), activation in zip(base.layers, base.activations)]
+        scales: Optional[list] = None
+        percentiles = None
+    elif precision == "int8":
+        calibrated = calibrate_int8_layers(base, X_cal)
+        layers = [(quantized, bias, activation)
+                  for (quantized, _, _), (_, bias, _), activation
+                  in zip(calibrated, base.layers, base.activations)]
+        scales = [scale for _, scale, _ in calibrated]
+        percentiles = [percentile for _, _, percentile in calibrated]
+    else:
+        raise ValueError(f"Unsupported precision: {precision}")
+
+    pending[precision] = path
+    save_numpy_model(path, layers, base.class_labels, scales=scales, precision=precision)
+    entry = describe(NumpyDenseModel.load(path), path, X_test, y_test)
+    entry['accuracy_drop'] = baseline - entry['accuracy']
+    if percentiles is not None:
+        entry['clip_percentiles'] = percentiles
+
+    if entry['accuracy_drop'] > tolerance:
+        raise ValueError(
+            f"{precision} export lost {entry['accuracy_drop']:.4f} accuracy "
+            f"({entry['accuracy']:.4f} vs {baseline:.4f}), above tolerance {tolerance}"
+        )
+
+    return entry
+
+def export_quantized_variants(float_path: str, X_cal: np.ndarray, X_test: np.ndarray, y_test: np.ndarray,
+                              tolerance: float = 0.01, precisions=PRECISIONS) -> Dict:
+    """Write float16/int8 variants next to the float32 .npz and return their metadata
+
+    Raises ValueError, leaving no variant behind, when any variant loses more than `tolerance`
+    held-out accuracy compared with the float32 model.
+    """
+    base = NumpyDenseModel.load(float_path)
+    metadata = {'float32': describe(base, float_path, X_test, y_test), 'tolerance': tolerance}
+    baseline = metadata['float32']['accuracy']
+
+    # Variants are written to temporary paths and only renamed once every precision passes
+    pending = {}
+    try:
+        for precision in precisions:
+            metadata[precision] = export_variant(base, float_path, precision, baseline, X_cal, X_test, y_test,
+                                                 tolerance, pending)
+    except BaseException:
+        for tmp_path in pending.values():
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+
+    for precision, tmp_path in pending.items():
+        entry = metadata[precision]
+        entry['path'] = variant_path(float_path, precision)
+        os.replace(tmp_path, entry['path'])
+        print(f"{precision} model exported to: {entry['path']} "
+              f"({entry['size_bytes'] / 1024:.1f} KiB, accuracy {entry['accuracy']:.4f}, "
+              f"{entry['latency_us']:.1f} µs/sample)")
+
+    return metadata
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Real-Time Pipeline
+Capture, detection/classification and rendering run as separate stages connected by bounded queues
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from metrics import Histogram
+from predict import NO_HAND
+
+WINDOW_NAME = 'SignSync Meet - Sign Language Recognition'
+
+class LatestFrameQueue:
+    """Bounded queue that drops the oldest item when full, so consumers always see fresh frames"""
+
+    def __init__(self, maxsize: int = 2):
+        self._items = deque(maxlen=maxsize)
+        self._condition = threading.Condition()
+        self._closed = False
+        self.dropped = 0
+
+    def put(self, item):
+        """Add an item, discarding the oldest one if the queue is full"""
+        with self._condition:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append(item)
+            self._condition.notify()
+
+    def get(self, timeout: Optional[float] = None):
+        """Return the oldest item, or None when closed or timed out"""
+        with self._condition:
+            if not self._items and not self._closed:
+                self._condition.wait(timeout)
+            if self._items:
+                return self._items.popleft()
+            return None
+
+    def close(self):
+        """Wake up any waiting consumer"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer has finished"""
+        return self._closed
+
+class StageTimer:
+    """Per-stage latency histograms plus a frame rate counter"""
+
+    def __init__(self, stages):
+        self.histograms = {stage: Histogram() for stage in stages}
+        self.frames = 0
+        self.window_start = time.perf_counter()
+
+    def record(self, stage: str, seconds: float):
+        """Record one stage duration in seconds"""
+        self.histograms[stage].observe(seconds * 1000.0)
+
+    def report(self) -> Tuple[str, float]:
+        """Return a one-line summary and start a new reporting window"""
+        now = time.perf_counter()
+        fps = self.frames / (now - self.window_start) if now > self.window_start else 0.0
+        parts = [f"FPS {fps:5.1f}"]
+        for stage, histogram in self.histograms.items():
+            snapshot = histogram.snapshot(reset=True)
+            parts.append(f"{stage} {snapshot['mean']:.1f}ms (p95 {snapshot['p95']:.1f})")
+
+        self.frames = 0
+        self.window_start = now
+        return " | ".join(parts), fps
+
+class RealtimePipeline:
+    """Capture thread -> detection/classification thread -> render loop on the main thread"""
+
+    def __init__(self, predictor, camera_index: int = 0, every_n: int = 1,
+                 target_fps: Optional[float] = None, report_interval: float = 2.0):
+        self.predictor = predictor
+        self.camera_index = camera_index
+        self.every_n = max(1, every_n)
+        self.target_fps = target_fps
+        self.report_interval = report_interval
+
+        self.frame_queue = LatestFrameQueue(maxsize=2)
+        self.result_queue = LatestFrameQueue(maxsize=2)
+        self.stop_event = threading.Event()
+        self.timer = StageTimer(("capture", "detect", "classify", "render"))
+        self.fps = 0.0
+
+    def capture_loop(self, cap):
+        """Read frames as fast as the camera delivers them"""
+        frame_id = 0
+        while not self.stop_event.is_set():
+            start = time.perf_counter()
+            ret, frame = cap.read()
+            if not ret:
+                print("Error: Could not read frame")
+                break
+            self.timer.record("capture", time.perf_counter() - start)
+
+            self.frame_queue.put((frame_id, frame))
+            frame_id += 1
+
+        self.frame_queue.close()
+
+    def process_loop(self):
+        """Detect and classify every Nth frame, reusing the last result in between"""
+        landmarks = None
+        hands = []
+        prediction, confidence = NO_HAND, 0.0
+        timings = {}
+        instrumentation = self.predictor.instrumentation
+
+        while not self.stop_event.is_set():
+            item = self.frame_queue.get(timeout=0.1)
+            if item is None:
+                if self.frame_queue.closed:
+                    break
+                continue
+
+            frame_id, frame = item
+            if frame_id % self.every_n == 0:
+                timings.clear()
+                prediction, confidence, landmarks = self.predictor.recognize(frame, timings)
+                hands = self.predictor.last_hands
+                for stage, seconds in timings.items():
+                    self.timer.record(stage, seconds)
+                if instrumentation is not None:
+                    instrumentation.maybe_export()
+
+            self.result_queue.put((frame, landmarks, prediction, confidence, hands))
+
+        self.result_queue.close()
+
+    def render(self, frame: np.ndarray, landmarks, prediction: str, confidence: float, hands=()) -> np.ndarray:
+        """Annotate a frame with landmarks, prediction and frame rate"""
+        if hands:
+            # Every tracked hand with its own label next to the wrist
+            height, width = frame.shape[:2]
+            for track, hand_prediction, hand_confidence, hand_landmarks in hands:
+                frame = self.predictor.draw_landmarks(frame, hand_landmarks)
+                wrist = (int(hand_landmarks[0] * width), int(hand_landmarks[1] * height) + 30)
+                cv2.putText(frame, f"#{track.id} {track.handedness}: {hand_prediction} ({hand_confidence:.2f})",
+                            wrist, cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        elif landmarks is not None:
+            frame = self.predictor.draw_landmarks(frame, landmarks)
+
+        # Add prediction text to frame
+        text = f"Prediction: {prediction} ({confidence:.2f})"
+        cv2.putText(frame, text, (10, 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+        cv2.putText(frame, f"FPS: {self.fps:.1f}", (10, 60),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+
+        # Add instructions
+        cv2.putText(frame, "Press 'q' to quit, 's' to save",
+                    (10, frame.shape[0] - 20),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        return frame
+
+    def run(self):
+        """Run until 'q' is pressed or the camera stops"""
+        cap = cv2.VideoCapture(self.camera_index)
+        if not cap.isOpened():
+            print("Error: Could not open camera")
+            return
+
+        # Pace rendering to the camera's frame rate unless told otherwise
+        target_fps = self.target_fps or cap.get(cv2.CAP_PROP_FPS) or 30.0
+        frame_interval = 1.0 / target_fps
+        print(f"Pacing display at {target_fps:.1f} FPS, processing every {self.every_n} frame(s)")
+
+        capture_thread = threading.Thread(target=self.capture_loop, args=(cap,), name="capture", daemon=True)
+        process_thread = threading.Thread(target=self.process_loop, name="process", daemon=True)
+        capture_thread.start()
+        process_thread.start()
+
+        next_frame = time.perf_counter()
+        last_report = time.perf_counter()
+        try:
+            while True:
+                item = self.result_queue.get(timeout=0.5)
+                if item is None:
+                    if self.result_queue.closed:
+                        break
+                    continue
+
+                start = time.perf_counter()
+                annotated_frame = self.render(*item)
+                cv2.imshow(WINDOW_NAME, annotated_frame)
+                self.timer.record("render", time.perf_counter() - start)
+                self.timer.frames += 1
+
+                # Wait out the rest of the frame interval inside waitKey instead of a fixed sleep
+                next_frame += frame_interval
+                now = time.perf_counter()
+                if next_frame < now:
+                    next_frame = now
+                key = cv2.waitKey(max(1, int((next_frame - now) * 1000))) & 0xFF
+
+                if key == ord('q'):
+                    break
+                elif key == ord('s'):
+                    # Save current frame
+                    timestamp = int(time.time())
+                    filename = f"captured_frame_{timestamp}.jpg"
+                    cv2.imwrite(filename, annotated_frame)
+                    print(f"Frame saved as: {filename}")
+
+                if now - last_report >= self.report_interval:
+                    line, self.fps = self.timer.report()
+                    print(f"{line} | dropped {self.frame_queue.dropped + self.result_queue.dropped}")
+                    last_report = now
+        finally:
+            self.stop_event.set()
+            capture_thread.join(timeout=1.0)
+            process_thread.join(timeout=1.0)
+            cap.release()
+            cv2.destroyAllWindows()
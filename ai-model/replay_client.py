@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Replay Client
+Synthetic meeting participants that replay image files against the recognition server
+"""
+
+import os
+import argparse
+import asyncio
+import time
+from typing import List
+
+import numpy as np
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+def collect_images(paths: List[str]) -> List[str]:
+    """Expand files and directories into a sorted list of image paths"""
+    images = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                images.extend(os.path.join(root, f) for f in files if f.lower().endswith(IMAGE_EXTENSIONS))
+        elif path.lower().endswith(IMAGE_EXTENSIONS):
+            images.append(path)
+    return sorted(images)
+
+def load_frames(image_paths: List[str]) -> List[bytes]:
+    """Read every image once as JPEG bytes"""
+    import cv2
+
+    frames = []
+    for path in image_paths:
+        if path.lower().endswith(('.jpg', '.jpeg')):
+            with open(path, 'rb') as f:
+                frames.append(f.read())
+            continue
+
+        image = cv2.imread(path)
+        if image is None:
+            print(f"Warning: Could not load image: {path}")
+            continue
+        ok, encoded = cv2.imencode('.jpg', image)
+        if ok:
+            frames.append(encoded.tobytes())
+    return frames
+
+async def run_participant(url: str, meeting_id: str, index: int, frames: List[bytes],
+                          fps: float, loops: int, stats: dict):
+    """Connect one participant, stream frames at the given rate and record latencies"""
+    import socketio
+
+    client = socketio.AsyncClient()
+    received = []
+    client.on("translation_result", lambda data: received.append(data))
+
+    await client.connect(url, transports=["websocket"])
+    await client.call("join_meeting", {"meetingId": meeting_id})
+
+    interval = 1.0 / fps if fps > 0 else 0.0
+    next_send = time.perf_counter()
+    frame_id = 0
+
+    try:
+        for _ in range(loops):
+            for frame in frames:
+                start = time.perf_counter()
+                result = await client.call("sign_frame", {"image": frame, "frameId": frame_id}, timeout=30)
+                latency = time.perf_counter() - start
+                frame_id += 1
+
+                if result.get("dropped"):
+                    stats["dropped"] += 1
+                elif "error" in result:
+                    stats["errors"] += 1
+                else:
+                    stats["latencies"].append(latency)
+                    if index == 0:
+                        print(f"frame {result['frameId']:>5}: {result['text']} ({result['confidence']:.2f})")
+
+                # Pace to the target frame rate
+                next_send += interval
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    next_send = time.perf_counter()
+    finally:
+        stats["broadcasts"] += len(received)
+        await client.disconnect()
+
+async def replay(url: str, image_paths: List[str], participants: int, fps: float, loops: int,
+                 meeting_id: str) -> dict:
+    """Replay the images from several concurrent participants and summarize latency"""
+    frames = load_frames(image_paths)
+    if not frames:
+        raise ValueError("No images to replay")
+
+    stats = {"latencies": [], "dropped": 0, "errors": 0, "broadcasts": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        run_participant(url, meeting_id, i, frames, fps, loops, stats)
+        for i in range(participants)
+    ])
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(stats["latencies"]) * 1000.0
+    summary = {
+        "participants": participants,
+        "frames": len(latencies),
+        "dropped": stats["dropped"],
+        "errors": stats["errors"],
+        "broadcasts_received": stats["broadcasts"],
+        "elapsed_s": elapsed,
+        "throughput_fps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+    }
+    if len(latencies):
+        summary.update({
+            "latency_p50_ms": float(np.percentile(latencies, 50)),
+            "latency_p95_ms": float(np.percentile(latencies, 95)),
+            "latency_max_ms": float(latencies.max()),
+        })
+    return summary
+
+def main(argv=None):
+    """Main function to run the replay client"""
+    parser = argparse.ArgumentParser(description="Replay image files against the recognition server")
+    parser.add_argument("images", nargs="+", help="Image files or directories")
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--participants", type=int, default=4)
+    parser.add_argument("--fps", type=float, default=15.0, help="Frames per second per participant (0 = unpaced)")
+    parser.add_argument("--loops", type=int, default=1, help="Times to replay the image list")
+    parser.add_argument("--meeting-id", default="replay-test")
+    args = parser.parse_args(argv)
+
+    image_paths = collect_images(args.images)
+    print(f"Replaying {len(image_paths)} images from {args.participants} participant(s) at {args.fps} FPS")
+
+    try:
+        summary = asyncio.run(replay(args.url, image_paths, args.participants, args.fps,
+                                     args.loops, args.meeting_id))
+    except Exception as e:
+        print(f"❌ Replay failed: {e}")
+        return 1
+
+    print("\n📊 Replay summary")
+    for key, value in summary.items():
+        print(f"  {key}: {value:.2f}" if isinstance(value, float) else f"  {key}: {value}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
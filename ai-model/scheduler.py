@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Micro-Batch Scheduler
+Gathers landmark vectors from concurrent callers and classifies them in one forward pass
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from metrics import Histogram, LATENCY_BUCKETS_MS, power_of_two_buckets
+
+# Sentinel placed on the queue to stop worker threads
+_STOP = object()
+
+class MicroBatchScheduler:
+    """Flushes a batch when max_batch_size items are queued or the oldest has waited max_wait_ms"""
+
+    def __init__(self, predict_batch: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]],
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0, max_queue_size: int = 1024,
+                 workers: int = 1):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.workers = workers
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._threads: List[threading.Thread] = []
+
+        # Tuning metrics
+        self.batch_size_histogram = Histogram(power_of_two_buckets(max_batch_size))
+        self.queue_depth_histogram = Histogram(power_of_two_buckets(max_queue_size))
+        self.wait_histogram = Histogram(LATENCY_BUCKETS_MS)
+        self.inference_histogram = Histogram(LATENCY_BUCKETS_MS)
+        self.batches = 0
+        self.items = 0
+        self.errors = 0
+
+    def start(self):
+        """Start the worker threads"""
+        if self._threads:
+            return
+
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"micro-batch-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the worker threads after the queued work is done"""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, landmarks: np.ndarray, block: bool = True, timeout: Optional[float] = None) -> Future:
+        """Queue one landmark vector; the future resolves to (label, confidence)
+
+        Raises queue.Full when the queue stays full for longer than timeout.
+        """
+        future = Future()
+        self._queue.put((np.asarray(landmarks, dtype=np.float32).reshape(-1), future, time.perf_counter()),
+                        block=block, timeout=timeout)
+        return future
+
+    def submit_many(self, landmarks: np.ndarray, block: bool = True, timeout: Optional[float] = None) -> List[Future]:
+        """Queue the rows of an (N, features) array back to back so they share one batch when possible"""
+        return [self.submit(row, block=block, timeout=timeout) for row in np.asarray(landmarks, dtype=np.float32)]
+
+    def predict(self, landmarks: np.ndarray, timeout: Optional[float] = None) -> Tuple[str, float]:
+        """Blocking helper that submits one vector and waits for its result"""
+        return self.submit(landmarks).result(timeout)
+
+    def _collect(self, first) -> list:
+        """Gather items until the batch is full or the oldest item's deadline passes"""
+        batch = [first]
+        deadline = first[2] + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get_nowait() if remaining <= 0 else self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+            if item is _STOP:
+                # Re-queue so the worker stops after flushing this batch
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+
+        return batch
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch = self._collect(first)
+            self.queue_depth_histogram.observe(self._queue.qsize())
+
+            # Drop requests whose callers already cancelled them
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            for _, _, enqueued in batch:
+                self.wait_histogram.observe((start - enqueued) * 1000.0)
+
+            try:
+                labels, confidences = self.predict_batch(np.stack([item[0] for item in batch]))
+            except Exception as e:
+                self.errors += 1
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            self.inference_histogram.observe((time.perf_counter() - start) * 1000.0)
+            self.batch_size_histogram.observe(len(batch))
+            self.batches += 1
+            self.items += len(batch)
+
+            for (_, future, _), label, confidence in zip(batch, labels, confidences):
+                future.set_result((str(label), float(confidence)))
+
+    def stats(self) -> Dict:
+        """Batch size, queue depth and wait/inference time histograms for tuning"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "batches": self.batches,
+            "items": self.items,
+            "errors": self.errors,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "queue_depth": self._queue.qsize(),
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "queue_depth_histogram": self.queue_depth_histogram.snapshot(),
+            "wait_ms": self.wait_histogram.snapshot(),
+            "inference_ms": self.inference_histogram.snapshot(),
+        }
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Sequence Model
+Dilated 1D convolution over a sliding window of landmarks for motion letters (J, Z) and dynamic signs,
+with a NumPy streaming runtime that costs O(1) work per new frame
+"""
+
+import os
+import json
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+from numpy_model import softmax
+
+# Frames averaged by the pooling layer (1 second at 30 FPS)
+WINDOW = 30
+KERNEL_SIZE = 3
+DILATIONS = (1, 2, 4)
+FILTERS = 64
+
+LATEST_SEQUENCE_MODEL = "latest_sequence_model.json"
+
+# Background class: held static letters and idle hands, i.e. "no motion sign"; never emitted
+NEGATIVE_CLASS = "none"
+
+def receptive_field(kernel_size: int = KERNEL_SIZE, dilations: Sequence[int] = DILATIONS) -> int:
+    """Frames that one output of the convolution stack depends on"""
+    return 1 + sum((kernel_size - 1) * d for d in dilations)
+
+def input_length(window: int = WINDOW, kernel_size: int = KERNEL_SIZE, dilations: Sequence[int] = DILATIONS) -> int:
+    """Frames per training sample: `window` pooled outputs plus the receptive field before the first"""
+    return window + receptive_field(kernel_size, dilations) - 1
+
+def pad_front(frames: np.ndarray, length: int) -> np.ndarray:
+    """Left-pad a (n, features) run to length frames by repeating its first frame, as a new stream does"""
+    missing = length - len(frames)
+    if missing <= 0:
+        return frames[-length:]
+    return np.concatenate([np.repeat(frames[:1], missing, axis=0), frames])
+
+def sliding_windows(frames: np.ndarray, length: int, stride: int = 2, min_frames: int = 10) -> List[np.ndarray]:
+    """Training windows ending every `stride` frames of a clip's (n, features) landmarks
+
+    NaN rows (no hand) split the clip into runs, like a stream reset; windows that start
+    before a run are front-padded exactly as a new SequenceStream primes itself.
+    """
+    missing = np.isnan(frames).any(axis=1)
+    breaks = np.flatnonzero(np.diff(np.concatenate([[True], missing, [True]]).astype(np.int8)))
+
+    windows = []
+    for start, stop in zip(breaks[0::2], breaks[1::2]):
+        run = frames[start:stop]
+        if len(run) < min_frames:
+            continue
+        ends = list(range(min_frames - 1, len(run), stride))
+        if ends[-1] != len(run) - 1:
+            ends.append(len(run) - 1)
+        windows.extend(pad_front(run[:end + 1], length) for end in ends)
+    return windows
+
+def build_sequence_model(num_features: int, num_classes: int, window: int = WINDOW, filters: int = FILTERS,
+                         kernel_size: int = KERNEL_SIZE, dilations: Sequence[int] = DILATIONS, dropout: float = 0.3):
+    """Keras model: 'valid' dilated Conv1D stack, average pooling over `window` outputs, softmax
+
+    Valid padding means every output sees only real frames, so streaming inference over an
+    unbounded stream computes exactly what the model saw in training.
+    """
+    import tensorflow as tf
+    from tensorflow.keras import layers, models
+
+    stack = [layers.Input(shape=(input_length(window, kernel_size, dilations), num_features))]
+    for dilation in dilations:
+        stack.append(layers.Conv1D(filters, kernel_size, dilation_rate=dilation, padding='valid', activation='relu'))
+    stack.append(layers.GlobalAveragePooling1D())
+    stack.append(layers.Dropout(dropout))
+    stack.append(layers.Dense(num_classes, activation='softmax'))
+
+    model = models.Sequential(stack)
+    model.compile(
+        optimizer=tf.keras.optimizers.Adam(learning_rate=1e-3),
+        loss='sparse_categorical_crossentropy',
+        metrics=['accuracy']
+    )
+    return model
+
+def export_sequence_model(model, class_labels, path: str, window: int = WINDOW) -> str:
+    """Export the Conv1D and Dense weights of a build_sequence_model model to .npz"""
+    arrays = {'classes': np.asarray(class_labels).astype(str), 'window': np.array(window)}
+    dilations = []
+    kernel_size = None
+
+    for layer in model.layers:
+        weights = layer.get_weights()
+        kind = layer.__class__.__name__
+        if kind == 'Conv1D':
+            config = layer.get_config()
+            if config['padding'] != 'valid' or config['activation'] != 'relu':
+                raise ValueError(f"Unsupported Conv1D configuration in {layer.name}")
+            kernel, bias = weights
+            index = len(dilations)
+            arrays[f'conv_kernel_{index}'] = kernel.astype(np.float32)
+            arrays[f'conv_bias_{index}'] = bias.astype(np.float32)
+            dilations.append(int(config['dilation_rate'][0]))
+            kernel_size = int(config['kernel_size'][0])
+        elif kind == 'Dense':
+            arrays['dense_kernel'], arrays['dense_bias'] = (w.astype(np.float32) for w in weights)
+        elif weights:
+            raise ValueError(f"Unsupported layer for NumPy export: {layer.name} ({kind})")
+
+    arrays['dilations'] = np.array(dilations)
+    arrays['kernel_size'] = np.array(kernel_size)
+    np.savez(path, **arrays)
+    return path
+
+class LandmarkWindow:
+    """Fixed-size ring buffer of the most recent per-frame vectors
+
+    Every row is written twice, so the last `size` rows are always one contiguous slice
+    (oldest first) without copying or np.roll.
+    """
+
+    def __init__(self, size: int, width: int):
+        self.size = size
+        self.data = np.zeros((2 * size, width), dtype=np.float32)
+        self.head = 0
+        self.count = 0
+
+    def push(self, row: np.ndarray):
+        """Append one vector, dropping the oldest"""
+        head = self.head
+        self.data[head] = row
+        self.data[head + self.size] = row
+        self.head = head + 1 if head + 1 < self.size else 0
+        self.count += 1
+
+    def fill(self, row: np.ndarray):
+        """Set every slot to row, as if it had been pushed `size` times"""
+        self.data[:] = row
+        self.head = 0
+        self.count = self.size
+
+    def view(self) -> np.ndarray:
+        """The last `size` vectors, oldest first (a view; valid until the next push)"""
+        return self.data[self.head:self.head + self.size]
+
+    def oldest(self) -> np.ndarray:
+        """The vector that the next push will drop"""
+        return self.data[self.head]
+
+class SequenceModel:
+    """NumPy runtime for an exported sequence model"""
+
+    def __init__(self, conv_layers: List[Tuple[np.ndarray, np.ndarray, int]], dense: Tuple[np.ndarray, np.ndarray],
+                 class_labels: np.ndarray, window: int):
+        self.conv_layers = conv_layers
+        self.dense_kernel, self.dense_bias = dense
+        self.class_labels = class_labels
+        self.window = window
+        self.kernel_size = conv_layers[0][0].shape[0]
+        self.dilations = tuple(d for _, _, d in conv_layers)
+        self.num_features = conv_layers[0][0].shape[1]
+        self.input_length = input_length(window, self.kernel_size, self.dilations)
+        self.label_index = {str(label): i for i, label in enumerate(class_labels)}
+        self.has_negative_class = NEGATIVE_CLASS in self.label_index
+
+        # (k, in, out) kernels flattened for one matmul per layer and frame
+        self.flat_kernels = [kernel.reshape(-1, kernel.shape[2]) for kernel, _, _ in conv_layers]
+
+    @classmethod
+    def load(cls, path: str) -> "SequenceModel":
+        """Load a model written by export_sequence_model"""
+        with np.load(path, allow_pickle=False) as data:
+            dilations = [int(d) for d in data['dilations']]
+            conv_layers = [(data[f'conv_kernel_{i}'], data[f'conv_bias_{i}'], d) for i, d in enumerate(dilations)]
+            return cls(conv_layers, (data['dense_kernel'], data['dense_bias']), data['classes'], int(data['window']))
+
+    def predict_proba(self, windows: np.ndarray) -> np.ndarray:
+        """Class probabilities for full windows of shape (N, input_length, features)"""
+        h = np.asarray(windows, dtype=np.float32)
+        for kernel, bias, dilation in self.conv_layers:
+            length = h.shape[1] - (self.kernel_size - 1) * dilation
+            out = np.broadcast_to(bias, (h.shape[0], length, bias.shape[0])).copy()
+            for tap in range(self.kernel_size):
+                out += h[:, tap * dilation:tap * dilation + length] @ kernel[tap]
+            h = np.maximum(out, 0.0, out=out)
+
+        logits = h.mean(axis=1) @ self.dense_kernel + self.dense_bias
+        return softmax(logits)
+
+    def stream(self) -> "SequenceStream":
+        """Fresh per-stream incremental state"""
+        return SequenceStream(self)
+
+class SequenceStream:
+    """Incremental inference for one stream
+
+    Each layer keeps only the inputs its dilated taps reach back to, and the pooled mean is a
+    running sum over a ring of the last `window` outputs, so update() does one small matmul
+    per layer regardless of the window length.
+    """
+
+    def __init__(self, model: SequenceModel):
+        self.model = model
+        k = model.kernel_size
+
+        # Landmarks of this stream; the first layer reads its taps from the tail
+        self.window = LandmarkWindow(model.input_length, model.num_features)
+
+        # Inputs of layers 2..n (outputs of the layer before), sized to each layer's span
+        self.spans = [(k - 1) * d + 1 for d in model.dilations]
+        self.hidden = [LandmarkWindow(span, kernel.shape[1])
+                       for span, (kernel, _, _) in zip(self.spans[1:], model.conv_layers[1:])]
+
+        # Last `window` outputs of the final layer and their running sum
+        filters = model.conv_layers[-1][0].shape[2]
+        self.pool = LandmarkWindow(model.window, filters)
+        self.pool_sum = np.zeros(filters, dtype=np.float64)
+        self.frames = 0
+
+    def reset(self):
+        """Forget the stream, e.g. when the hand leaves the frame"""
+        self.frames = 0
+
+    def _prime(self, landmarks: np.ndarray):
+        """Start the stream as if its first frame had been repeated for a whole window
+
+        Constant input gives constant activations, so every buffer is filled from one pass.
+        """
+        self.window.fill(landmarks)
+        h = landmarks.astype(np.float32)
+        for index, (kernel, bias, _) in enumerate(self.model.conv_layers):
+            h = np.maximum(h @ kernel.sum(axis=0) + bias, 0.0)
+            if index + 1 < len(self.model.conv_layers):
+                self.hidden[index].fill(h)
+
+        self.pool.fill(h)
+        self.pool_sum[:] = h * self.model.window
+
+    def update(self, landmarks: np.ndarray) -> np.ndarray:
+        """Add one frame's landmarks and return class probabilities for the window ending at it"""
+        model = self.model
+        if self.frames == 0:
+            self._prime(landmarks)
+        else:
+            self.window.push(landmarks)
+            source = self.window.view()[-self.spans[0]:]
+            for index, ((_, bias, dilation), flat_kernel) in enumerate(zip(model.conv_layers, model.flat_kernels)):
+                h = source[::dilation].reshape(-1) @ flat_kernel
+                h += bias
+                np.maximum(h, 0.0, out=h)
+
+                if index + 1 < len(model.conv_layers):
+                    buffer = self.hidden[index]
+                    buffer.push(h)
+                    source = buffer.view()
+                else:
+                    self.pool_sum += h
+                    self.pool_sum -= self.pool.oldest()
+                    self.pool.push(h)
+
+        self.frames += 1
+        mean = (self.pool_sum / model.window).astype(np.float32)
+        return softmax((mean @ model.dense_kernel + model.dense_bias)[None, :])[0]
+
+    def predict(self, landmarks: np.ndarray) -> Tuple[str, float]:
+        """Add one frame and return the (label, confidence) of the window ending at it"""
+        probabilities = self.update(landmarks)
+        index = int(probabilities.argmax())
+        return str(self.model.class_labels[index]), float(probabilities[index])
+
+def load_latest_sequence_model(model_dir: str = "./models") -> Optional[SequenceModel]:
+    """Load the NumPy export named in latest_sequence_model.json, or None when none was trained"""
+    path = os.path.join(model_dir, LATEST_SEQUENCE_MODEL)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r') as f:
+        info = json.load(f)
+
+    print(f"Loading sequence model from: {info['numpy']}")
+    return SequenceModel.load(info['numpy'])
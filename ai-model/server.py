@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Recognition Server
+Socket.IO server that recognizes sign language for many meeting participants at once
+"""
+
+import asyncio
+import base64
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from hand_tracking import HandTracker
+from landmarks import FEATURE_SIZE
+from predict import NO_HAND, SignLanguagePredictor, create_tracking_hands
+from sequence_model import SequenceStream
+from smoothing import VoteSmoother
+from scheduler import MicroBatchScheduler
+
+def decode_image(payload) -> Optional[np.ndarray]:
+    """Decode JPEG/PNG bytes, or a base64 (data URL) string, into a BGR frame"""
+    if isinstance(payload, str):
+        # Accept data URLs such as "data:image/jpeg;base64,..."
+        if payload.startswith("data:"):
+            payload = payload.split(",", 1)[1]
+        payload = base64.b64decode(payload)
+
+    buffer = np.frombuffer(payload, dtype=np.uint8)
+    return cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+
+class StreamSession:
+    """Per-participant state: a tracking Hands instance, smoothing history and motion-sign window
+
+    With a hand tracker (several hands per frame) every tracked hand keeps its own history instead.
+    """
+
+    def __init__(self, sid: str, smoother: Optional[VoteSmoother], sequence: Optional[SequenceStream] = None,
+                 tracker: Optional[HandTracker] = None, max_hands: int = 1):
+        self.sid = sid
+        self.meeting_id = None
+        self.hands = create_tracking_hands(max_hands)
+        self.smoother = smoother
+        self.sequence = sequence
+        self.tracker = tracker
+
+        # Only one frame per session is in flight; newer frames are dropped while busy
+        self.busy = False
+        self.frames = 0
+        self.dropped = 0
+
+    def close(self):
+        """Release the MediaPipe graph"""
+        self.hands.close()
+
+class RecognitionServer:
+    """Accepts frames over Socket.IO and micro-batches model inference across sessions"""
+
+    def __init__(self, predictor: SignLanguagePredictor, workers: int = 4,
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0, cors_allowed_origins="*"):
+        import socketio
+
+        self.predictor = predictor
+        self.sessions: Dict[str, StreamSession] = {}
+
+        # Shared pool for JPEG decoding and MediaPipe
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="recognition")
+
+        # Cross-session micro-batching in front of the model
+        self.scheduler = MicroBatchScheduler(
+            predictor.predict_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms
+        )
+
+        self.sio = socketio.AsyncServer(async_mode="aiohttp", cors_allowed_origins=cors_allowed_origins)
+        self.sio.on("connect", self.on_connect)
+        self.sio.on("disconnect", self.on_disconnect)
+        self.sio.on("join_meeting", self.on_join_meeting)
+        self.sio.on("sign_frame", self.on_sign_frame)
+        self.sio.on("add_example", self.on_add_example)
+
+    async def start(self):
+        """Start the cross-session inference scheduler"""
+        self.scheduler.start()
+
+    async def stop(self):
+        """Stop the scheduler and release every session"""
+        self.scheduler.stop(timeout=1.0)
+
+        for session in self.sessions.values():
+            session.close()
+        self.sessions.clear()
+        self.executor.shutdown(wait=False)
+
+    async def on_connect(self, sid, environ, auth=None):
+        """Create session state for a new participant"""
+        loop = asyncio.get_running_loop()
+        self.sessions[sid] = await loop.run_in_executor(
+            self.executor, StreamSession, sid, self.predictor.create_smoother(),
+            self.predictor.create_sequence_stream(),
+            self.predictor.create_hand_tracker() if self.predictor.max_hands > 1 else None,
+            self.predictor.max_hands
+        )
+        print(f"Session connected: {sid} ({len(self.sessions)} active)")
+
+    async def on_disconnect(self, sid, *args):
+        """Release session state"""
+        session = self.sessions.pop(sid, None)
+        if session is not None:
+            session.close()
+            print(f"Session disconnected: {sid} ({session.frames} frames, {session.dropped} dropped)")
+
+    async def on_join_meeting(self, sid, data):
+        """Join the meeting room so results reach every participant"""
+        session = self.sessions.get(sid)
+        meeting_id = (data or {}).get("meetingId")
+        if session is None or not meeting_id:
+            return {"ok": False}
+
+        session.meeting_id = meeting_id
+        await self.sio.enter_room(sid, meeting_id)
+        return {"ok": True}
+
+    async def on_sign_frame(self, sid, data):
+        """Recognize one frame: data holds 'image' (JPEG bytes/base64) or 'landmarks' (63 floats per hand)"""
+        session = self.sessions.get(sid)
+        if session is None or not isinstance(data, dict):
+            return {"error": "invalid request"}
+
+        if session.busy:
+            session.dropped += 1
+            return {"dropped": True, "frameId": data.get("frameId")}
+
+        session.busy = True
+        session.frames += 1
+        try:
+            result = await self.process_frame(session, data)
+        except Exception as e:
+            print(f"Error processing frame for {sid}: {e}")
+            result = {"error": str(e)}
+            if self.predictor.instrumentation is not None:
+                self.predictor.instrumentation.count("errors")
+        finally:
+            session.busy = False
+
+        result["frameId"] = data.get("frameId")
+
+        if result.get("text") not in (None, NO_HAND):
+            await self.sio.emit(
+                "translation_result",
+                {"text": result["text"], "confidence": result["confidence"], "participant": sid,
+                 "hands": result.get("hands")},
+                to=session.meeting_id or sid
+            )
+
+        return result
+
+    async def on_add_example(self, sid, data):
+        """Teach the nearest-neighbour index: data holds 'label' and an 'image' or 'landmarks', optional 'save'"""
+        session = self.sessions.get(sid)
+        if session is None or not isinstance(data, dict) or not data.get("label"):
+            return {"error": "invalid request"}
+        if self.predictor.knn_index is None:
+            return {"error": "nearest-neighbour index disabled"}
+
+        # Shares the session's Hands instance with frames, so it waits its turn like one
+        if session.busy:
+            return {"error": "busy"}
+
+        session.busy = True
+        loop = asyncio.get_running_loop()
+        try:
+            size = await loop.run_in_executor(self.executor, self.add_example, session, data)
+        except Exception as e:
+            return {"error": str(e)}
+        finally:
+            session.busy = False
+
+        if size is None:
+            return {"error": "no hand detected"}
+        return {"ok": True, "examples": size}
+
+    def add_example(self, session: StreamSession, data: dict) -> Optional[int]:
+        """Add one example to the predictor's index; returns its new size, or None without a hand"""
+        if "landmarks" in data:
+            landmarks = np.asarray(data["landmarks"], dtype=np.float32).reshape(-1)
+            if landmarks.size != FEATURE_SIZE:
+                raise ValueError(f"Expected {FEATURE_SIZE} landmark values, got {landmarks.size}")
+        else:
+            landmarks = self.detect(session, data.get("image"))
+            if landmarks is None:
+                return None
+
+        return self.predictor.add_example(landmarks, str(data["label"]), save=bool(data.get("save")))
+
+    async def process_frame(self, session: StreamSession, data: dict) -> dict:
+        """Detect landmarks on the shared pool, then classify through the batcher"""
+        start = time.perf_counter()
+        if session.tracker is not None:
+            return await self.process_hands(session, data, start)
+
+        if "landmarks" in data:
+            landmarks = np.asarray(data["landmarks"], dtype=np.float32).reshape(-1)
+            if landmarks.size != self.predictor.num_features:
+                raise ValueError(f"Expected {self.predictor.num_features} landmark values, got {landmarks.size}")
+        else:
+            loop = asyncio.get_running_loop()
+            landmarks = await loop.run_in_executor(self.executor, self.detect, session, data.get("image"))
+
+        instrumentation = self.predictor.instrumentation
+        if instrumentation is not None:
+            instrumentation.count("frames")
+            instrumentation.count("no_hand" if landmarks is None else "hands")
+
+        if landmarks is None:
+            if session.sequence is not None:
+                session.sequence.reset()
+            return {"text": NO_HAND, "confidence": 0.0}
+
+        prediction, confidence = await self.classify(landmarks)
+        if session.sequence is not None:
+            # O(1) per frame, so it runs inline rather than through the batcher
+            motion = self.predictor.predict_motion(landmarks, session.sequence)
+            if motion is not None:
+                prediction, confidence = motion
+        # Start a fresh history when a hot swap changed the label table; there is no smoother
+        # without a dense model (the k-NN index serving alone)
+        session.smoother = self.predictor.current_smoother(session.smoother)
+        if session.smoother is not None:
+            prediction, confidence = session.smoother.update_label(prediction, confidence)
+        elapsed = time.perf_counter() - start
+
+        if instrumentation is not None:
+            instrumentation.observe("total", elapsed)
+            instrumentation.maybe_export()
+
+        return {
+            "text": prediction,
+            "confidence": confidence,
+            "latencyMs": elapsed * 1000.0,
+        }
+
+    async def process_hands(self, session: StreamSession, data: dict, start: float) -> dict:
+        """Classify every hand of a frame in the shared micro-batch and smooth each tracked hand"""
+        num_features = self.predictor.num_features
+        if "landmarks" in data:
+            landmarks = np.asarray(data["landmarks"], dtype=np.float32).reshape(-1)
+            if landmarks.size % num_features:
+                raise ValueError(f"Expected a multiple of {num_features} landmark values, got {landmarks.size}")
+            landmarks = landmarks.reshape(-1, num_features)
+            handedness = list(data.get("handedness") or ["Right"] * len(landmarks))
+            if len(handedness) != len(landmarks):
+                raise ValueError(f"Expected {len(landmarks)} handedness labels, got {len(handedness)}")
+        else:
+            loop = asyncio.get_running_loop()
+            landmarks, handedness = await loop.run_in_executor(
+                self.executor, self.detect_all, session, data.get("image")
+            )
+
+        instrumentation = self.predictor.instrumentation
+        if instrumentation is not None:
+            instrumentation.count("frames")
+            if len(landmarks):
+                instrumentation.count("hands", len(landmarks))
+            else:
+                instrumentation.count("no_hand")
+
+        tracks = session.tracker.update(landmarks, handedness)
+        if not tracks:
+            return {"text": NO_HAND, "confidence": 0.0, "hands": []}
+
+        # Rows are queued back to back, so a frame's hands share a batch with other sessions' frames
+        features = self.predictor.hand_features(landmarks, handedness)
+        futures = self.scheduler.submit_many(features, block=False)
+        results = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+
+        hands = []
+        for track, row, (prediction, confidence) in zip(tracks, features, results):
+            if track.sequence is not None:
+                motion = self.predictor.predict_motion(row, track.sequence)
+                if motion is not None:
+                    prediction, confidence = motion
+            track.smoother = self.predictor.current_smoother(track.smoother)
+            if track.smoother is not None:
+                prediction, confidence = track.smoother.update_label(prediction, confidence)
+            hands.append((track, prediction, confidence))
+
+        # Longest-tracked hand first, as in SignLanguagePredictor.recognize_hands
+        hands.sort(key=lambda hand: (-hand[0].age, hand[0].id))
+        elapsed = time.perf_counter() - start
+
+        if instrumentation is not None:
+            instrumentation.observe("total", elapsed)
+            instrumentation.maybe_export()
+
+        return {
+            "text": hands[0][1],
+            "confidence": hands[0][2],
+            "hands": [
+                {"id": track.id, "handedness": track.handedness, "text": prediction, "confidence": confidence}
+                for track, prediction, confidence in hands
+            ],
+            "latencyMs": elapsed * 1000.0,
+        }
+
+    def detect(self, session: StreamSession, image_payload) -> Optional[np.ndarray]:
+        """Decode a frame and extract landmarks with the session's own Hands instance"""
+        if image_payload is None:
+            return None
+
+        frame = decode_image(image_payload)
+        if frame is None:
+            raise ValueError("Could not decode image")
+
+        return self.predictor.extract_hand_landmarks(frame, hands=session.hands)
+
+    def detect_all(self, session: StreamSession, image_payload) -> Tuple[np.ndarray, List[str]]:
+        """Decode a frame and extract every hand with the session's own Hands instance"""
+        if image_payload is None:
+            return np.empty((0, self.predictor.num_features), dtype=np.float32), []
+
+        frame = decode_image(image_payload)
+        if frame is None:
+            raise ValueError("Could not decode image")
+
+        return self.predictor.extract_all_hands(frame, hands=session.hands)
+
+    async def classify(self, landmarks: np.ndarray) -> Tuple[str, float]:
+        """Queue landmarks for the next inference micro-batch"""
+        return await asyncio.wrap_future(self.scheduler.submit(landmarks, block=False))
+
+    def stats(self) -> dict:
+        """Session and scheduler metrics"""
+        return {
+            "sessions": len(self.sessions),
+            "frames": sum(session.frames for session in self.sessions.values()),
+            "dropped": sum(session.dropped for session in self.sessions.values()),
+            "scheduler": self.scheduler.stats(),
+            "models": self.predictor.registry.stats(),
+            "stages": self.predictor.instrumentation.snapshot() if self.predictor.instrumentation else None,
+        }
+
+async def serve(predictor: SignLanguagePredictor, host: str = "0.0.0.0", port: int = 5000,
+                workers: int = 4, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+    """Serve until cancelled"""
+    from aiohttp import web
+
+    server = RecognitionServer(predictor, workers=workers, max_batch_size=max_batch_size,
+                               max_wait_ms=max_wait_ms)
+
+    app = web.Application()
+    server.sio.attach(app)
+
+    async def health(request):
+        return web.json_response({"status": "ok", "sessions": len(server.sessions)})
+
+    async def metrics(request):
+        return web.json_response(server.stats())
+
+    app.router.add_get("/api/health", health)
+    app.router.add_get("/api/metrics", metrics)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    await server.start()
+    print(f"🚀 Recognition server listening on http://{host}:{port}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        await runner.cleanup()
+
+def run_server(predictor: SignLanguagePredictor, host: str = "0.0.0.0", port: int = 5000,
+               workers: int = 4, max_batch_size: int = 32, max_wait_ms: float = 5.0) -> int:
+    """Run the recognition server (requires python-socketio and aiohttp)"""
+    try:
+        import socketio
+        import aiohttp
+    except ImportError:
+        print("❌ The server needs python-socketio and aiohttp: pip install python-socketio aiohttp")
+        return 1
+    
+    try:
+        asyncio.run(serve(predictor, host, port, workers, max_batch_size, max_wait_ms))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+    return 0
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Prediction Smoothing
+Fixed-size ring buffer vote tracker that smooths per-frame predictions in O(1) per update
+"""
+
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+
+class VoteSmoother:
+    """Sliding-window majority (or confidence-weighted) vote with incremental per-class tallies
+
+    Keep one instance per stream; instances built from the same predictor share its label table.
+    """
+
+    def __init__(self, labels: Sequence[str], window: int = 5, min_history: int = 3,
+                 weighted: bool = False, label_index: Optional[Dict[str, int]] = None):
+        self.labels = labels
+        self.label_index = label_index if label_index is not None else {label: i for i, label in enumerate(labels)}
+        self.window = window
+        self.min_history = min(min_history, window)
+        self.weighted = weighted
+
+        num_classes = len(labels)
+
+        # Ring buffer of the last `window` predictions
+        self._classes = np.zeros(window, dtype=np.intp)
+        self._confidences = np.zeros(window, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+
+        # Running per-class vote counts and confidence sums over the window
+        self._counts = np.zeros(num_classes, dtype=np.int64)
+        self._confidence_sums = np.zeros(num_classes, dtype=np.float64)
+
+    def update(self, class_idx: int, confidence: float) -> Tuple[int, float]:
+        """Add a prediction by class index and return the smoothed (class index, confidence)"""
+        head = self._head
+
+        # Evict the oldest prediction once the window is full
+        if self._size == self.window:
+            old = self._classes[head]
+            self._counts[old] -= 1
+            if self._counts[old] == 0:
+                # Avoid floating point drift in empty tallies
+                self._confidence_sums[old] = 0.0
+            else:
+                self._confidence_sums[old] -= self._confidences[head]
+        else:
+            self._size += 1
+
+        self._classes[head] = class_idx
+        self._confidences[head] = confidence
+        self._head = head + 1 if head + 1 < self.window else 0
+
+        self._counts[class_idx] += 1
+        self._confidence_sums[class_idx] += confidence
+
+        # Return current prediction if not enough history
+        if self._size < self.min_history:
+            return class_idx, confidence
+
+        scores = self._confidence_sums if self.weighted else self._counts
+        best = int(scores.argmax())
+
+        # Prefer the newest prediction when it ties with the leader
+        if scores[class_idx] == scores[best]:
+            best = class_idx
+
+        return best, float(self._confidence_sums[best] / self._counts[best])
+
+    def update_label(self, prediction: str, confidence: float) -> Tuple[str, float]:
+        """Add a prediction by label; labels outside the model's classes pass through unchanged"""
+        class_idx = self.label_index.get(prediction)
+        if class_idx is None:
+            return prediction, confidence
+
+        best, smoothed_confidence = self.update(class_idx, confidence)
+        return str(self.labels[best]), smoothed_confidence
+
+    def reset(self):
+        """Forget all history"""
+        self._head = 0
+        self._size = 0
+        self._counts.fill(0)
+        self._confidence_sums.fill(0.0)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Hyperparameter Sweep
+Trains model variants in parallel over landmarks extracted once and shared through memory-mapped arrays
+"""
+
+import os
+import json
+import time
+import argparse
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List
+
+import numpy as np
+
+# Dataset memory-mapped by each trial worker process
+_worker_data = None
+
+def prepare_shared_dataset(data_path: str, sweep_dir: str, num_workers: int = 1, use_cache: bool = True) -> Dict:
+    """Extract (or read cached) landmarks once and write the train/validation split as .npy files"""
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import LabelEncoder
+    from train_model import SignLanguageTrainer
+
+    trainer = SignLanguageTrainer(data_path=data_path, model_path=os.path.join(sweep_dir, "trials"))
+    X, y = trainer.load_dataset(num_workers=num_workers, use_cache=use_cache)
+
+    # Same encoding and stratified split as SignLanguageTrainer.train_model
+    label_encoder = LabelEncoder()
+    y_encoded = label_encoder.fit_transform(y)
+    X_train, X_val, y_train, y_val = train_test_split(
+        X, y_encoded, test_size=0.2, random_state=42, stratify=y_encoded
+    )
+
+    data_dir = os.path.join(sweep_dir, "data")
+    os.makedirs(data_dir, exist_ok=True)
+    for name, array in (('X_train', X_train), ('y_train', y_train), ('X_val', X_val), ('y_val', y_val)):
+        np.save(os.path.join(data_dir, f"{name}.npy"), np.ascontiguousarray(array))
+
+    with open(os.path.join(data_dir, "classes.json"), 'w') as f:
+        json.dump([str(c) for c in label_encoder.classes_], f)
+
+    print(f"Shared dataset: {len(X_train)} training / {len(X_val)} validation samples in {data_dir}")
+    return {'data_dir': data_dir, 'classes': [str(c) for c in label_encoder.classes_]}
+
+def load_shared_dataset(data_dir: str) -> Dict:
+    """Memory-map the arrays written by prepare_shared_dataset; pages are shared by every worker"""
+    data = {name: np.load(os.path.join(data_dir, f"{name}.npy"), mmap_mode='r')
+            for name in ('X_train', 'y_train', 'X_val', 'y_val')}
+    with open(os.path.join(data_dir, "classes.json"), 'r') as f:
+        data['classes'] = json.load(f)
+    return data
+
+def parse_units(text: str) -> tuple:
+    """'256,128,64' -> (256, 128, 64)"""
+    return tuple(int(units) for units in text.split(',') if units)
+
+def build_trials(hidden_units: List[str], dropout: List[float], learning_rate: List[float],
+                 batch_size: List[int], epochs: int, max_trials=None, seed: int = 42) -> List[Dict]:
+    """Grid of trial configurations, randomly subsampled to max_trials"""
+    grid = [
+        {
+            'hidden_units': parse_units(units),
+            'dropout': rate,
+            'learning_rate': lr,
+            'batch_size': size,
+            'epochs': epochs,
+        }
+        for units, rate, lr, size in itertools.product(hidden_units, dropout, learning_rate, batch_size)
+    ]
+
+    if max_trials is not None and max_trials < len(grid):
+        order = np.random.default_rng(seed).permutation(len(grid))[:max_trials]
+        grid = [grid[i] for i in sorted(order)]
+
+    for trial_id, trial in enumerate(grid):
+        trial['trial'] = trial_id
+    return grid
+
+def trial_thread_environment(threads: int) -> Dict[str, str]:
+    """Thread caps for one trial's BLAS/OpenMP and TensorFlow pools"""
+    environment = {variable: str(threads) for variable in
+                   ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "TF_NUM_INTRAOP_THREADS")}
+    environment["TF_NUM_INTEROP_THREADS"] = "1"
+    return environment
+
+def _init_trial_worker(data_dir: str, threads: int):
+    """Cap TensorFlow's thread pools in this worker, then map the shared dataset
+
+    BLAS reads its caps when NumPy is imported, which a spawned worker does while unpickling
+    this module, before the initializer runs; run_sweep sets them in the inherited environment.
+    """
+    global _worker_data
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+    _worker_data = load_shared_dataset(data_dir)
+
+def _training_batches(X: np.ndarray, y: np.ndarray, batch_size: int, seed: int):
+    """Endless shuffled batches gathered from the memory-mapped arrays, so no worker copies the whole set"""
+    rng = np.random.default_rng(seed)
+    while True:
+        order = rng.permutation(len(X))
+        for start in range(0, len(X), batch_size):
+            batch = np.sort(order[start:start + batch_size])
+            yield X[batch], y[batch]
+
+def run_trial(trial: Dict, trials_dir: str) -> Dict:
+    """Train one configuration and measure validation accuracy, NumPy export size and latency"""
+    from augment import batches_per_epoch
+    from numpy_model import NumpyDenseModel, export_numpy_model
+    from quantize import measure_latency
+    from train_model import build_model, create_callbacks
+
+    data = _worker_data
+    X_val = np.asarray(data['X_val'])
+    y_val = np.asarray(data['y_val'])
+    hidden_units = trial['hidden_units']
+
+    start = time.perf_counter()
+    model = build_model(
+        (data['X_train'].shape[1],), len(data['classes']),
+        hidden_units=hidden_units,
+        dropout=(trial['dropout'],) * len(hidden_units),
+        learning_rate=trial['learning_rate']
+    )
+    history = model.fit(
+        _training_batches(data['X_train'], data['y_train'], trial['batch_size'], seed=trial['trial']),
+        steps_per_epoch=batches_per_epoch(len(data['X_train']), trial['batch_size']),
+        validation_data=(X_val, y_val),
+        epochs=trial['epochs'],
+        callbacks=create_callbacks(),
+        verbose=0
+    )
+    train_seconds = time.perf_counter() - start
+    val_loss, val_accuracy = model.evaluate(X_val, y_val, verbose=0)
+
+    # Size and latency are measured on the NumPy export that the predictor serves
+    numpy_path = os.path.join(trials_dir, f"trial_{trial['trial']:03d}.npz")
+    export_numpy_model(model, data['classes'], numpy_path)
+    exported = NumpyDenseModel.load(numpy_path)
+
+    return {
+        **trial,
+        'accuracy': float(val_accuracy),
+        'loss': float(val_loss),
+        'epochs_run': len(history.history['loss']),
+        'parameters': int(model.count_params()),
+        'size_bytes': os.path.getsize(numpy_path),
+        'latency_us': measure_latency(exported, exported.input_shape[-1]),
+        'train_seconds': train_seconds,
+        'model': numpy_path,
+    }
+
+def _run_trial_in_worker(args) -> Dict:
+    """Run a trial inside a worker process, reporting failures instead of raising"""
+    trial, trials_dir = args
+    try:
+        return run_trial(trial, trials_dir)
+    except Exception as e:
+        return {**trial, 'error': str(e)}
+
+def run_sweep(trials: List[Dict], data_dir: str, sweep_dir: str, parallel: int = 2, threads_per_trial=None) -> List[Dict]:
+    """Run trials `parallel` at a time and write the leaderboard"""
+    trials_dir = os.path.join(sweep_dir, "trials")
+    os.makedirs(trials_dir, exist_ok=True)
+    parallel = max(1, min(parallel, len(trials)))
+    threads = threads_per_trial or max(1, (os.cpu_count() or 1) // parallel)
+    print(f"Running {len(trials)} trial(s), {parallel} at a time with {threads} thread(s) each")
+
+    # TensorFlow is not fork-safe, so workers are started fresh; they inherit the thread caps
+    # from this process's environment, restored once the pool is done
+    context = multiprocessing.get_context("spawn")
+    thread_environment = trial_thread_environment(threads)
+    saved_environment = {variable: os.environ.get(variable) for variable in thread_environment}
+    os.environ.update(thread_environment)
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=parallel, mp_context=context,
+                                 initializer=_init_trial_worker, initargs=(data_dir, threads)) as executor:
+            futures = [executor.submit(_run_trial_in_worker, (trial, trials_dir)) for trial in trials]
+            for i, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results.append(result)
+                if 'error' in result:
+                    print(f"[{i}/{len(trials)}] ❌ trial {result['trial']}: {result['error']}")
+                else:
+                    print(f"[{i}/{len(trials)}] trial {result['trial']}: accuracy {result['accuracy']:.4f} "
+                          f"in {result['train_seconds']:.0f}s")
+    finally:
+        for variable, value in saved_environment.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+
+    return write_leaderboard(results, sweep_dir)
+
+def write_leaderboard(results: List[Dict], sweep_dir: str) -> List[Dict]:
+    """Rank trials by accuracy, then latency, and save them as leaderboard.json"""
+    finished = sorted((r for r in results if 'error' not in r),
+                      key=lambda r: (-r['accuracy'], r['latency_us']))
+    failed = [r for r in results if 'error' in r]
+    leaderboard = finished + failed
+
+    path = os.path.join(sweep_dir, "leaderboard.json")
+    with open(path, 'w') as f:
+        json.dump(leaderboard, f, indent=2)
+
+    print(f"\n{'rank':>4}  {'trial':>5}  {'hidden units':<16} {'dropout':>7} {'lr':>8} {'batch':>5}  "
+          f"{'accuracy':>8} {'size KiB':>9} {'latency us':>10}")
+    for rank, r in enumerate(finished, 1):
+        units = ",".join(str(u) for u in r['hidden_units'])
+        print(f"{rank:>4}  {r['trial']:>5}  {units:<16} {r['dropout']:>7.2f} {r['learning_rate']:>8.0e} "
+              f"{r['batch_size']:>5}  {r['accuracy']:>8.4f} {r['size_bytes'] / 1024:>9.1f} {r['latency_us']:>10.1f}")
+    print(f"\nLeaderboard saved to: {path}")
+    return leaderboard
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Hyperparameter sweep for the SignSync Meet ASL model")
+    parser.add_argument("--data-path", default="./data", help="Directory of images organized by letter")
+    parser.add_argument("--sweep-dir", default="./sweeps/latest", help="Shared data, trial models and leaderboard")
+    parser.add_argument("--hidden-units", nargs="+", default=["256,128,64", "128,64", "512,256,128"],
+                        help="Comma-separated hidden layer widths, one architecture per argument")
+    parser.add_argument("--dropout", nargs="+", type=float, default=[0.2, 0.3])
+    parser.add_argument("--learning-rate", nargs="+", type=float, default=[1e-3, 3e-4])
+    parser.add_argument("--batch-size", nargs="+", type=int, default=[32])
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument("--max-trials", type=int, default=None, help="Randomly sample this many grid points")
+    parser.add_argument("--parallel", type=int, default=2, help="Trials trained concurrently")
+    parser.add_argument("--threads-per-trial", type=int, default=None,
+                        help="TensorFlow/BLAS threads per trial (default: cpu count / parallel)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes used for landmark extraction (1 = serial)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the landmark cache")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function to run a sweep"""
+    args = parse_args(argv)
+
+    try:
+        shared = prepare_shared_dataset(args.data_path, args.sweep_dir, args.workers, not args.no_cache)
+        trials = build_trials(args.hidden_units, args.dropout, args.learning_rate, args.batch_size,
+                              args.epochs, args.max_trials)
+        leaderboard = run_sweep(trials, shared['data_dir'], args.sweep_dir, args.parallel, args.threads_per_trial)
+    except Exception as e:
+        print(f"\n❌ Sweep failed: {e}")
+        return 1
+
+    return 0 if leaderboard and 'error' not in leaderboard[0] else 1
+
+if __name__ == "__main__":
+    exit(main())
@@ -5,6 +5,7 @@ Trains a CNN model for American Sign Language (ASL) recognition using MediaPipe
 """
 
 import os
+import argparse
 import cv2
 import numpy as np
 import mediapipe as mp
@@ -14,18 +15,113 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 import pickle
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from augment import LandmarkAugmenter, augmented_batches, batches_per_epoch
+from knn_index import build_index
+from landmark_cache import LandmarkCache
+from landmark_dataset import make_dataset, read_manifest, read_split, write_shards
+from landmarks import allocate_features, landmarks_from_results
+from numpy_model import export_numpy_model
+from quantize import PRECISIONS, export_quantized_variants
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Default architecture: hidden layer widths and the dropout after each
+HIDDEN_UNITS = (256, 128, 64)
+DROPOUT = (0.3, 0.3, 0.2)
+
+# Training samples used to calibrate int8 clipping ranges
+CALIBRATION_SIZE = 512
+
+# MediaPipe Hands instance owned by each extraction worker process
+_worker_hands = None
+
+def create_static_hands():
+    """Create a MediaPipe Hands instance configured for still images"""
+    return mp.solutions.hands.Hands(
+        static_image_mode=True,
+        max_num_hands=1,
+        min_detection_confidence=0.5
+    )
+
+def extract_features_with(hands, image_path, out=None):
+    """Extract hand landmarks from an image file using the given Hands instance (optionally into out)"""
+    try:
+        image = cv2.imread(image_path)
+        if image is None:
+            return None
+        
+        # Convert BGR to RGB
+        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        
+        # Process image with MediaPipe
+        results = hands.process(image_rgb)
+        
+        # Get the 21 (x, y, z) landmarks of the first detected hand
+        return landmarks_from_results(results, out)
+            
+    except Exception as e:
+        print(f"Error processing {image_path}: {e}")
+        return None
+
+def build_model(input_shape, num_classes, hidden_units=HIDDEN_UNITS, dropout=DROPOUT, learning_rate=None):
+    """Dense landmark classifier with one Dropout after every hidden layer"""
+    # Input layer
+    stack = [layers.Input(shape=input_shape)]
+    
+    # Dense layers for landmark processing
+    for units, rate in zip(hidden_units, dropout):
+        stack.append(layers.Dense(units, activation='relu'))
+        stack.append(layers.Dropout(rate))
+    
+    # Output layer
+    stack.append(layers.Dense(num_classes, activation='softmax'))
+    model = models.Sequential(stack)
+    
+    # Compile model
+    optimizer = 'adam' if learning_rate is None else tf.keras.optimizers.Adam(learning_rate=learning_rate)
+    model.compile(
+        optimizer=optimizer,
+        loss='sparse_categorical_crossentropy',
+        metrics=['accuracy']
+    )
+    
+    return model
+
+def create_callbacks():
+    """Early stopping and learning rate decay on validation loss"""
+    return [
+        tf.keras.callbacks.EarlyStopping(
+            monitor='val_loss', 
+            patience=10, 
+            restore_best_weights=True
+        ),
+        tf.keras.callbacks.ReduceLROnPlateau(
+            monitor='val_loss', 
+            factor=0.5, 
+            patience=5, 
+            min_lr=1e-7
+        )
+    ]
+
+def _init_extraction_worker():
+    """Give each worker process its own MediaPipe Hands instance"""
+    global _worker_hands
+    _worker_hands = create_static_hands()
+
+def _extract_in_worker(image_path):
+    """Extract landmarks inside a worker process"""
+    return extract_features_with(_worker_hands, image_path)
+
 class SignLanguageTrainer:
-    def __init__(self, data_path="./data", model_path="./models"):
+    def __init__(self, data_path="./data", model_path="./models", cache_path=None):
         self.data_path = data_path
         self.model_path = model_path
+        self.cache_path = cache_path or os.path.join(data_path, ".landmark_cache")
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=True,
-            max_num_hands=1,
-            min_detection_confidence=0.5
-        )
+        self.hands = create_static_hands()
         
         # Create directories if they don't exist
         os.makedirs(self.data_path, exist_ok=True)
@@ -37,42 +133,13 @@ class SignLanguageTrainer:
         
         print(f"Training model for {self.num_classes} ASL letters: {self.asl_letters}")
     
-    def extract_hand_features(self, image_path):
+    def extract_hand_features(self, image_path, out=None):
         """Extract hand landmarks using MediaPipe"""
-        try:
-            image = cv2.imread(image_path)
-            if image is None:
-                return None
-            
-            # Convert BGR to RGB
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Process image with MediaPipe
-            results = self.hands.process(image_rgb)
-            
-            if results.multi_hand_landmarks:
-                # Get landmarks for the first detected hand
-                hand_landmarks = results.multi_hand_landmarks[0]
-                
-                # Extract 21 landmark points (x, y, z coordinates)
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    landmarks.extend([landmark.x, landmark.y, landmark.z])
-                
-                return np.array(landmarks)
-            else:
-                return None
-                
-        except Exception as e:
-            print(f"Error processing {image_path}: {e}")
-            return None
+        return extract_features_with(self.hands, image_path, out)
     
-    def load_dataset(self):
-        """Load and preprocess the dataset"""
-        print("Loading dataset...")
-        
-        features = []
-        labels = []
+    def list_images(self):
+        """List (image_path, letter) pairs for every image in the dataset"""
+        images = []
         
         for letter in self.asl_letters:
             letter_path = os.path.join(self.data_path, letter)
@@ -80,59 +147,100 @@ class SignLanguageTrainer:
                 print(f"Warning: No data found for letter {letter}")
                 continue
             
-            print(f"Processing letter {letter}...")
+            for filename in sorted(os.listdir(letter_path)):
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    images.append((os.path.join(letter_path, filename), letter))
+        
+        return images
+    
+    def extract_many(self, image_paths, num_workers=1):
+        """Extract landmarks for many images, optionally across a process pool"""
+        if num_workers <= 1 or len(image_paths) < 2:
+            # Write straight into rows of one preallocated batch
+            batch = allocate_features(len(image_paths))
+            return [self.extract_hand_features(path, batch[i]) for i, path in enumerate(image_paths)]
+        
+        chunksize = max(1, min(64, len(image_paths) // (num_workers * 4)))
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 initializer=_init_extraction_worker) as executor:
+            return list(executor.map(_extract_in_worker, image_paths, chunksize=chunksize))
+    
+    def gather_landmarks(self, num_workers=1, use_cache=True):
+        """Return (landmark rows, letters) for every image with a detected hand
+        
+        Cached rows are memory-mapped views, so nothing is stacked in memory here, unless new
+        extractions rewrite the cache: then they are copied first, as the mapped file is replaced.
+        """
+        print("Loading dataset...")
+        
+        images = self.list_images()
+        cache = LandmarkCache(self.cache_path) if use_cache else None
+        
+        # Look up every image in the cache and collect the ones that need extraction
+        keys = []
+        extracted = [None] * len(images)
+        pending = []
+        for i, (image_path, _) in enumerate(images):
+            key = LandmarkCache.file_key(image_path)
+            keys.append(key)
             
-            # Process each image in the letter directory
-            for filename in os.listdir(letter_path):
-                if filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    image_path = os.path.join(letter_path, filename)
-                    landmarks = self.extract_hand_features(image_path)
-                    
-                    if landmarks is not None:
-                        features.append(landmarks)
-                        labels.append(letter)
+            if cache is not None:
+                hit, landmarks = cache.lookup(image_path, key)
+                if hit:
+                    extracted[i] = landmarks
+                    continue
+            pending.append(i)
+        
+        print(f"Found {len(images)} images, {len(images) - len(pending)} cached, "
+              f"{len(pending)} to process with {num_workers} worker(s)")
+        
+        results = self.extract_many([images[i][0] for i in pending], num_workers)
+        for i, landmarks in zip(pending, results):
+            extracted[i] = landmarks
+        
+        # Views into the old cache file would keep it mapped, and Windows cannot replace a mapped file
+        if cache is not None and pending:
+            extracted = [None if landmarks is None else np.array(landmarks) for landmarks in extracted]
+        
+        features = []
+        labels = []
+        for (_, letter), landmarks in zip(images, extracted):
+            if landmarks is not None:
+                features.append(landmarks)
+                labels.append(letter)
         
         if not features:
             raise ValueError("No valid data found. Please ensure your data directory contains images.")
         
+        if cache is not None and pending:
+            cache.save([(path, key, landmarks) for (path, _), key, landmarks
+                        in zip(images, keys, extracted)])
+            print(f"Landmark cache updated: {cache.array_path}")
+        
+        return features, np.array(labels)
+    
+    def load_dataset(self, num_workers=1, use_cache=True):
+        """Load and preprocess the dataset"""
+        features, y = self.gather_landmarks(num_workers=num_workers, use_cache=use_cache)
+        
         # Convert to numpy arrays
-        X = np.array(features)
-        y = np.array(labels)
+        X = np.stack(features)
         
         print(f"Dataset loaded: {len(X)} samples, {len(np.unique(y))} classes")
         print(f"Feature shape: {X.shape}")
         
         return X, y
     
-    def create_model(self, input_shape):
+    def create_model(self, input_shape, hidden_units=HIDDEN_UNITS, dropout=DROPOUT, learning_rate=None):
         """Create CNN model architecture"""
-        model = models.Sequential([
-            # Input layer
-            layers.Input(shape=input_shape),
-            
-            # Dense layers for landmark processing
-            layers.Dense(256, activation='relu'),
-            layers.Dropout(0.3),
-            layers.Dense(128, activation='relu'),
-            layers.Dropout(0.3),
-            layers.Dense(64, activation='relu'),
-            layers.Dropout(0.2),
-            
-            # Output layer
-            layers.Dense(self.num_classes, activation='softmax')
-        ])
-        
-        # Compile model
-        model.compile(
-            optimizer='adam',
-            loss='sparse_categorical_crossentropy',
-            metrics=['accuracy']
-        )
-        
-        return model
+        return build_model(input_shape, self.num_classes, hidden_units, dropout, learning_rate)
+    
+    def create_callbacks(self):
+        """Training callbacks"""
+        return create_callbacks()
     
-    def train_model(self, X, y, epochs=100, batch_size=32):
-        """Train the model"""
+    def train_model(self, X, y, epochs=100, batch_size=32, augmenter=None):
+        """Train the model, optionally augmenting the training landmarks on the fly"""
         print("Creating and training model...")
         
         # Encode labels
@@ -144,46 +252,100 @@ class SignLanguageTrainer:
             X, y_encoded, test_size=0.2, random_state=42, stratify=y_encoded
         )
         
+        # Kept for quantized export: held-out accuracy gate and int8 calibration slice
+        self.eval_data = (X_test, y_test)
+        self.calibration_data = X_train[:CALIBRATION_SIZE]
+        
         # Create model
         model = self.create_model(X_train.shape[1:])
         
         # Print model summary
         model.summary()
         
-        # Training callbacks
-        callbacks = [
-            tf.keras.callbacks.EarlyStopping(
-                monitor='val_loss', 
-                patience=10, 
-                restore_best_weights=True
-            ),
-            tf.keras.callbacks.ReduceLROnPlateau(
-                monitor='val_loss', 
-                factor=0.5, 
-                patience=5, 
-                min_lr=1e-7
+        # Train model
+        if augmenter is not None:
+            # Every epoch sees freshly augmented landmarks; validation data stays untouched
+            history = model.fit(
+                augmented_batches(X_train, y_train, batch_size, augmenter),
+                steps_per_epoch=batches_per_epoch(len(X_train), batch_size),
+                validation_data=(X_test, y_test),
+                epochs=epochs,
+                callbacks=self.create_callbacks(),
+                verbose=1
+            )
+        else:
+            history = model.fit(
+                X_train, y_train,
+                validation_data=(X_test, y_test),
+                epochs=epochs,
+                batch_size=batch_size,
+                callbacks=self.create_callbacks(),
+                verbose=1
             )
-        ]
+        
+        # Evaluate model
+        test_loss, test_accuracy = model.evaluate(X_test, y_test, verbose=0)
+        print(f"\nTest accuracy: {test_accuracy:.4f}")
+        print(f"Test loss: {test_loss:.4f}")
+        
+        return model, label_encoder, history
+    
+    def prepare_shards(self, shard_dir, num_workers=1, use_cache=True, shard_size=65536):
+        """Write the stratified train/validation split as on-disk landmark shards"""
+        features, y = self.gather_landmarks(num_workers=num_workers, use_cache=use_cache)
+        
+        label_encoder = LabelEncoder()
+        y_encoded = label_encoder.fit_transform(y)
+        manifest = write_shards(shard_dir, features, y_encoded, label_encoder.classes_,
+                                test_size=0.2, shard_size=shard_size, seed=42)
+        
+        splits = manifest['splits']
+        print(f"Wrote {splits['train']['records']} training and {splits['validation']['records']} "
+              f"validation samples to {len(splits['train']['shards']) + len(splits['validation']['shards'])} "
+              f"shard(s) in {shard_dir}")
+        return manifest
+    
+    def train_model_streaming(self, shard_dir, epochs=100, batch_size=32, shuffle_buffer=16384,
+                              cache_in_memory=False, augmenter=None):
+        """Train the model from on-disk shards through a tf.data pipeline"""
+        print("Creating and training model from landmark shards...")
+        
+        manifest = read_manifest(shard_dir)
+        label_encoder = LabelEncoder()
+        label_encoder.fit(manifest['classes'])
+        
+        train_data = make_dataset(shard_dir, 'train', batch_size, training=True,
+                                  shuffle_buffer=shuffle_buffer, cache=cache_in_memory,
+                                  augmenter=augmenter)
+        validation_data = make_dataset(shard_dir, 'validation', batch_size, training=False,
+                                       cache=cache_in_memory)
+        
+        # Create model
+        model = self.create_model((manifest['num_features'],))
+        model.summary()
         
         # Train model
         history = model.fit(
-            X_train, y_train,
-            validation_data=(X_test, y_test),
+            train_data,
+            validation_data=validation_data,
             epochs=epochs,
-            batch_size=batch_size,
-            callbacks=callbacks,
+            callbacks=self.create_callbacks(),
             verbose=1
         )
         
         # Evaluate model
-        test_loss, test_accuracy = model.evaluate(X_test, y_test, verbose=0)
+        test_loss, test_accuracy = model.evaluate(validation_data, verbose=0)
         print(f"\nTest accuracy: {test_accuracy:.4f}")
         print(f"Test loss: {test_loss:.4f}")
         
+        # Kept for quantized export: held-out accuracy gate and int8 calibration slice
+        self.eval_data = read_split(shard_dir, 'validation')
+        self.calibration_data = read_split(shard_dir, 'train', limit=CALIBRATION_SIZE)[0]
+        
         return model, label_encoder, history
     
     def save_model(self, model, label_encoder, history):
-        """Save the trained model and metadata"""
+        """Save the trained model and metadata; publish_model makes it the latest"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Save model
@@ -191,6 +353,11 @@ class SignLanguageTrainer:
         model.save(model_path)
         print(f"Model saved to: {model_path}")
         
+        # Export weights and classes for the TensorFlow-free NumPy backend
+        numpy_path = os.path.join(self.model_path, f"sign_language_model_{timestamp}.npz")
+        export_numpy_model(model, label_encoder.classes_, numpy_path)
+        print(f"NumPy model exported to: {numpy_path}")
+        
         # Save label encoder
         encoder_path = os.path.join(self.model_path, f"label_encoder_{timestamp}.pkl")
         with open(encoder_path, 'wb') as f:
@@ -207,31 +374,91 @@ class SignLanguageTrainer:
         latest_paths = {
             'model': model_path,
             'encoder': encoder_path,
+            'numpy': numpy_path,
             'history': history_path,
             'timestamp': timestamp
         }
         
+        return latest_paths
+    
+    def publish_model(self, latest_paths):
+        """Point latest_model.json, which predictors poll, at the saved model"""
         latest_paths_file = os.path.join(self.model_path, "latest_model.json")
-        with open(latest_paths_file, 'w') as f:
+        tmp_path = latest_paths_file + ".tmp"
+        with open(tmp_path, 'w') as f:
             json.dump(latest_paths, f, indent=2)
+        os.replace(tmp_path, latest_paths_file)
+    
+    def export_quantized(self, latest_paths, tolerance=0.01, precisions=PRECISIONS):
+        """Export float16/int8 variants of the NumPy model and record them in latest_paths"""
+        X_test, y_test = self.eval_data
+        quantized = export_quantized_variants(
+            latest_paths['numpy'], self.calibration_data, X_test, y_test,
+            tolerance=tolerance, precisions=precisions
+        )
+        
+        latest_paths['quantized'] = quantized
         
         return latest_paths
     
-    def run_training(self, epochs=100, batch_size=32):
+    def export_knn_index(self, latest_paths, X, y):
+        """Index the training landmarks for nearest-neighbour prediction and record it in latest_paths"""
+        index_path = os.path.join(self.model_path, "knn_index")
+        index = build_index(X, y)
+        index.save(index_path)
+        print(f"Nearest-neighbour index saved to: {index_path} ({len(index)} examples)")
+        
+        latest_paths['knn'] = index_path
+        
+        return latest_paths
+    
+    def run_training(self, epochs=100, batch_size=32, num_workers=1, use_cache=True,
+                     quantize=False, quantization_tolerance=0.01, streaming=False, shard_dir=None,
+                     shard_size=65536, shuffle_buffer=16384, cache_in_memory=False, augment=False,
+                     knn_index=False):
         """Run the complete training pipeline"""
         try:
             print("Starting SignSync Meet AI Model Training...")
             print("=" * 50)
             
-            # Load dataset
-            X, y = self.load_dataset()
+            augmenter = LandmarkAugmenter(seed=42) if augment else None
             
-            # Train model
-            model, label_encoder, history = self.train_model(X, y, epochs, batch_size)
+            if streaming:
+                # Stream shards from disk instead of holding the dataset in memory
+                shard_dir = shard_dir or os.path.join(self.data_path, ".landmark_shards")
+                self.prepare_shards(shard_dir, num_workers=num_workers, use_cache=use_cache,
+                                    shard_size=shard_size)
+                model, label_encoder, history = self.train_model_streaming(
+                    shard_dir, epochs, batch_size,
+                    shuffle_buffer=shuffle_buffer,
+                    cache_in_memory=cache_in_memory,
+                    augmenter=augmenter
+                )
+            else:
+                # Load dataset
+                X, y = self.load_dataset(num_workers=num_workers, use_cache=use_cache)
+                
+                # Train model
+                model, label_encoder, history = self.train_model(X, y, epochs, batch_size, augmenter)
             
             # Save model
             latest_paths = self.save_model(model, label_encoder, history)
             
+            # Export quantized variants, failing before anything is published if they lose
+            # too much accuracy
+            if quantize:
+                latest_paths = self.export_quantized(latest_paths, tolerance=quantization_tolerance)
+            
+            # Index every training landmark for the predictor's nearest-neighbour fallback
+            if knn_index:
+                if streaming:
+                    features, y = self.gather_landmarks(num_workers=num_workers, use_cache=use_cache)
+                    X = np.stack(features)
+                latest_paths = self.export_knn_index(latest_paths, X, y)
+            
+            # Only now do running predictors see the new model
+            self.publish_model(latest_paths)
+            
             print("\nTraining completed successfully!")
             print("=" * 50)
             print(f"Model saved to: {latest_paths['model']}")
@@ -243,14 +470,56 @@ class SignLanguageTrainer:
             print(f"Training failed: {e}")
             raise
 
-def main():
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Train the SignSync Meet ASL model")
+    parser.add_argument("--data-path", default="./data", help="Directory of images organized by letter")
+    parser.add_argument("--model-path", default="./models", help="Directory to save trained models")
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes used for landmark extraction (1 = serial)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the landmark cache")
+    parser.add_argument("--quantize", action="store_true", help="Also export float16 and int8 NumPy models")
+    parser.add_argument("--quantization-tolerance", type=float, default=0.01,
+                        help="Maximum held-out accuracy drop allowed for a quantized model")
+    parser.add_argument("--augment", action="store_true",
+                        help="Randomly rotate, scale, shift, mirror and jitter training landmarks every epoch")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Train from on-disk landmark shards through tf.data instead of in-memory arrays")
+    parser.add_argument("--shard-dir", default=None, help="Shard directory (default: <data-path>/.landmark_shards)")
+    parser.add_argument("--shard-size", type=int, default=65536, help="Samples per shard file")
+    parser.add_argument("--shuffle-buffer", type=int, default=16384, help="tf.data shuffle buffer size")
+    parser.add_argument("--cache-in-memory", action="store_true",
+                        help="Keep streamed records in memory after the first epoch")
+    parser.add_argument("--knn-index", action="store_true",
+                        help="Also index the training landmarks for nearest-neighbour prediction")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main function to run training"""
+    args = parse_args(argv)
+    
     # Initialize trainer
-    trainer = SignLanguageTrainer()
+    trainer = SignLanguageTrainer(data_path=args.data_path, model_path=args.model_path)
     
     # Run training
     try:
-        latest_paths = trainer.run_training(epochs=100, batch_size=32)
+        latest_paths = trainer.run_training(
+            epochs=args.epochs,
+            batch_size=args.batch_size,
+            num_workers=args.workers,
+            use_cache=not args.no_cache,
+            quantize=args.quantize,
+            quantization_tolerance=args.quantization_tolerance,
+            streaming=args.streaming,
+            shard_dir=args.shard_dir,
+            shard_size=args.shard_size,
+            shuffle_buffer=args.shuffle_buffer,
+            cache_in_memory=args.cache_in_memory,
+            augment=args.augment,
+            knn_index=args.knn_index
+        )
         print("\n🎉 Training completed successfully!")
         print(f"📁 Model files saved in: {trainer.model_path}")
         
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Sequence Model Training Script
+Trains the temporal model for motion letters (J, Z) and dynamic signs from short video clips
+"""
+
+import os
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from landmark_dataset import stratified_split
+from landmarks import FEATURE_SIZE
+from sequence_model import (DILATIONS, FILTERS, KERNEL_SIZE, LATEST_SEQUENCE_MODEL, NEGATIVE_CLASS, WINDOW,
+                            SequenceModel, build_sequence_model, export_sequence_model, input_length,
+                            sliding_windows)
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm')
+
+def extract_clip_landmarks(video_path: str) -> np.ndarray:
+    """Per-frame landmarks of a clip as (frames, 63) float32, NaN rows where no hand was found"""
+    import cv2
+    from predict import create_tracking_hands
+    from landmarks import landmarks_from_results
+    from transcribe import iter_video_frames
+
+    rows = []
+    hands = create_tracking_hands()
+    try:
+        for _, _, frame in iter_video_frames(video_path):
+            row = np.full(FEATURE_SIZE, np.nan, dtype=np.float32)
+            results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            landmarks_from_results(results, row)
+            rows.append(row)
+    finally:
+        hands.close()
+
+    return np.array(rows, dtype=np.float32).reshape(-1, FEATURE_SIZE)
+
+class SequenceTrainer:
+    def __init__(self, data_path="./data/sequences", model_path="./models", cache_path=None, window=WINDOW,
+                 filters=FILTERS, kernel_size=KERNEL_SIZE, dilations=DILATIONS, export_tolerance=1e-4):
+        self.data_path = data_path
+        self.model_path = model_path
+        self.cache_path = cache_path or os.path.join(data_path, ".landmark_cache")
+        self.window = window
+        self.filters = filters
+        self.kernel_size = kernel_size
+        self.dilations = tuple(dilations)
+        self.input_length = input_length(window, kernel_size, dilations)
+        self.export_tolerance = export_tolerance
+
+        os.makedirs(self.model_path, exist_ok=True)
+
+    def list_clips(self):
+        """List (path, label) pairs: one directory per sign holding videos or (frames, 63) .npy sequences
+
+        A `none` directory of static letters and idle hands is required, so that the model
+        has a "no motion" answer instead of forcing every window into a motion sign.
+        """
+        if not os.path.isdir(self.data_path):
+            raise ValueError(f"No sequence data found in {self.data_path}")
+
+        clips = []
+        for label in sorted(os.listdir(self.data_path)):
+            label_path = os.path.join(self.data_path, label)
+            if label.startswith('.') or not os.path.isdir(label_path):
+                continue
+            for filename in sorted(os.listdir(label_path)):
+                if filename.lower().endswith(VIDEO_EXTENSIONS + ('.npy',)):
+                    clips.append((os.path.join(label_path, filename), label))
+
+        if not any(label == NEGATIVE_CLASS for _, label in clips):
+            raise ValueError(f"No clips in {os.path.join(self.data_path, NEGATIVE_CLASS)}. Record held static "
+                             "letters and idle hands there as the 'no motion' class.")
+        return clips
+
+    def cached_path(self, clip_path):
+        """Landmark cache file for a video clip"""
+        relative = os.path.relpath(clip_path, self.data_path)
+        return os.path.join(self.cache_path, relative + ".npy")
+
+    def load_clips(self, num_workers=1, use_cache=True):
+        """Return ([(frames, 63) landmark arrays], labels), extracting videos not in the cache"""
+        clips = self.list_clips()
+        if not clips:
+            raise ValueError("No valid clips found. Add one directory of videos per sign.")
+
+        sequences = [None] * len(clips)
+        pending = []
+        for i, (path, _) in enumerate(clips):
+            if path.endswith('.npy'):
+                sequences[i] = np.load(path).astype(np.float32).reshape(-1, FEATURE_SIZE)
+                continue
+            cached = self.cached_path(path)
+            if use_cache and os.path.exists(cached) and os.path.getmtime(cached) >= os.path.getmtime(path):
+                sequences[i] = np.load(cached)
+                continue
+            pending.append(i)
+
+        print(f"Found {len(clips)} clips, {len(pending)} to extract with {num_workers} worker(s)")
+        paths = [clips[i][0] for i in pending]
+        if num_workers <= 1 or len(paths) < 2:
+            extracted = [extract_clip_landmarks(path) for path in paths]
+        else:
+            # Each worker creates its own tracking Hands per clip
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                extracted = list(executor.map(extract_clip_landmarks, paths))
+
+        for i, frames in zip(pending, extracted):
+            sequences[i] = frames
+            if use_cache:
+                cached = self.cached_path(clips[i][0])
+                os.makedirs(os.path.dirname(cached), exist_ok=True)
+                np.save(cached, frames)
+
+        return sequences, np.array([label for _, label in clips])
+
+    def make_windows(self, sequences, labels, clip_indices, stride=2, min_frames=10):
+        """Stack the sliding windows of the given clips into (N, input_length, 63) samples"""
+        windows, window_labels = [], []
+        for i in clip_indices:
+            clip_windows = sliding_windows(sequences[i], self.input_length, stride, min_frames)
+            windows.extend(clip_windows)
+            window_labels.extend([labels[i]] * len(clip_windows))
+
+        if not windows:
+            return np.empty((0, self.input_length, FEATURE_SIZE), dtype=np.float32), np.empty(0, dtype=labels.dtype)
+        return np.stack(windows), np.array(window_labels)
+
+    def train_model(self, sequences, labels, epochs=100, batch_size=32, stride=2, min_frames=10):
+        """Split by clip (windows of one clip are near-duplicates), then train on sliding windows"""
+        from sklearn.preprocessing import LabelEncoder
+        from train_model import create_callbacks
+
+        print("Creating and training sequence model...")
+        label_encoder = LabelEncoder()
+        y_encoded = label_encoder.fit_transform(labels)
+
+        train_clips, val_clips = stratified_split(y_encoded, test_size=0.2, seed=42)
+        X_train, y_train = self.make_windows(sequences, y_encoded, train_clips, stride, min_frames)
+        X_val, y_val = self.make_windows(sequences, y_encoded, val_clips, stride, min_frames)
+        print(f"Windows: {len(X_train)} training from {len(train_clips)} clips, "
+              f"{len(X_val)} validation from {len(val_clips)} clips, {self.input_length} frames each")
+
+        model = build_sequence_model(FEATURE_SIZE, len(label_encoder.classes_), self.window, self.filters,
+                                     self.kernel_size, self.dilations)
+        model.summary()
+
+        validation = (X_val, y_val) if len(X_val) else None
+        history = model.fit(
+            X_train, y_train,
+            validation_data=validation,
+            epochs=epochs,
+            batch_size=batch_size,
+            callbacks=create_callbacks() if validation else None,
+            verbose=1
+        )
+
+        if validation:
+            test_loss, test_accuracy = model.evaluate(X_val, y_val, verbose=0)
+            print(f"\nTest accuracy: {test_accuracy:.4f}")
+            print(f"Test loss: {test_loss:.4f}")
+
+        self.eval_windows = X_val if len(X_val) else X_train
+        return model, label_encoder, history
+
+    def save_model(self, model, label_encoder, history):
+        """Save the Keras model, its NumPy streaming export and latest_sequence_model.json"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        model_path = os.path.join(self.model_path, f"sequence_model_{timestamp}.h5")
+        model.save(model_path)
+        print(f"Model saved to: {model_path}")
+
+        numpy_path = os.path.join(self.model_path, f"sequence_model_{timestamp}.npz")
+        export_sequence_model(model, label_encoder.classes_, numpy_path, self.window)
+        print(f"NumPy model exported to: {numpy_path}")
+
+        # The streaming runtime must reproduce Keras on whole windows
+        sample = self.eval_windows[:64]
+        exported = SequenceModel.load(numpy_path)
+        difference = np.abs(exported.predict_proba(sample) - model.predict(sample, verbose=0)).max()
+        print(f"NumPy export max probability difference: {difference:.2e}")
+        if not difference <= self.export_tolerance:
+            os.remove(numpy_path)
+            raise ValueError(f"NumPy export differs from Keras by more than {self.export_tolerance:.0e}; "
+                             f"{LATEST_SEQUENCE_MODEL} not updated")
+
+        history_path = os.path.join(self.model_path, f"sequence_history_{timestamp}.json")
+        with open(history_path, 'w') as f:
+            json.dump(history.history, f, indent=2)
+
+        latest_paths = {
+            'model': model_path,
+            'numpy': numpy_path,
+            'history': history_path,
+            'classes': [str(c) for c in label_encoder.classes_],
+            'window': self.window,
+            'input_length': self.input_length,
+            'timestamp': timestamp
+        }
+        with open(os.path.join(self.model_path, LATEST_SEQUENCE_MODEL), 'w') as f:
+            json.dump(latest_paths, f, indent=2)
+
+        return latest_paths
+
+    def run_training(self, epochs=100, batch_size=32, num_workers=1, use_cache=True, stride=2, min_frames=10):
+        """Run the complete sequence training pipeline"""
+        print("Starting SignSync Meet Sequence Model Training...")
+        print("=" * 50)
+
+        sequences, labels = self.load_clips(num_workers=num_workers, use_cache=use_cache)
+        print(f"Dataset loaded: {len(sequences)} clips, {len(np.unique(labels))} classes: {sorted(set(labels))}")
+
+        model, label_encoder, history = self.train_model(sequences, labels, epochs, batch_size, stride, min_frames)
+        latest_paths = self.save_model(model, label_encoder, history)
+
+        print("\nTraining completed successfully!")
+        print("=" * 50)
+        return latest_paths
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Train the SignSync Meet sequence model for motion signs")
+    parser.add_argument("--data-path", default="./data/sequences",
+                        help="Directory with one folder of clips per sign (e.g. J/, Z/)")
+    parser.add_argument("--model-path", default="./models", help="Directory to save trained models")
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--window", type=int, default=WINDOW, help="Frames averaged per prediction")
+    parser.add_argument("--filters", type=int, default=FILTERS)
+    parser.add_argument("--dilations", default=",".join(str(d) for d in DILATIONS),
+                        help="Comma-separated dilation of each Conv1D layer")
+    parser.add_argument("--stride", type=int, default=2, help="Frames between consecutive training windows")
+    parser.add_argument("--min-frames", type=int, default=10,
+                        help="Shortest hand run (in frames) that yields training windows")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes used for landmark extraction (1 = serial)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the landmark cache")
+    parser.add_argument("--tolerance", type=float, default=1e-4,
+                        help="Largest probability difference vs Keras allowed before the export is rejected")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function to run sequence training"""
+    args = parse_args(argv)
+
+    trainer = SequenceTrainer(
+        data_path=args.data_path,
+        model_path=args.model_path,
+        window=args.window,
+        filters=args.filters,
+        dilations=[int(d) for d in args.dilations.split(',') if d],
+        export_tolerance=args.tolerance
+    )
+
+    try:
+        trainer.run_training(
+            epochs=args.epochs,
+            batch_size=args.batch_size,
+            num_workers=args.workers,
+            use_cache=not args.no_cache,
+            stride=args.stride,
+            min_frames=args.min_frames
+        )
+        print("\n🎉 Training completed successfully!")
+        print(f"📁 Model files saved in: {trainer.model_path}")
+
+    except Exception as e:
+        print(f"\n❌ Training failed: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+SignSync Meet Video Transcription
+Turns recorded meetings and gesture clips into timestamped letter transcripts
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from hand_tracking import HandTracker
+from landmarks import FEATURE_SIZE
+from predict import SignLanguagePredictor, create_tracking_hands
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm')
+
+# Predictor owned by each worker process
+_worker_predictor = None
+
+def collect_videos(paths: List[str]) -> List[str]:
+    """Expand files and directories into a sorted list of video paths"""
+    videos = []
+    for path in paths:
+        if os.path.isdir(path):
+            videos.extend(
+                os.path.join(path, f) for f in os.listdir(path) if f.lower().endswith(VIDEO_EXTENSIONS)
+            )
+        else:
+            videos.append(path)
+    return sorted(videos)
+
+def iter_video_frames(video_path: str, stride: int = 1) -> Iterator[Tuple[int, float, np.ndarray]]:
+    """Yield (frame_index, timestamp_seconds, frame) for every stride-th frame without buffering the video"""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video: {video_path}")
+
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    frame_index = 0
+    try:
+        while True:
+            # grab() skips decoding of frames we do not need
+            if not cap.grab():
+                break
+            if frame_index % stride == 0:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                yield frame_index, frame_index / fps, frame
+            frame_index += 1
+    finally:
+        cap.release()
+
+class LetterCollapser:
+    """Incrementally collapses per-frame predictions into letters held for at least min_frames frames"""
+
+    def __init__(self, min_confidence: float = 0.7, min_frames: int = 3):
+        self.min_confidence = min_confidence
+        self.min_frames = min_frames
+        self.letters = []
+        self.current = None
+        self.run = 0
+
+    def add(self, prediction: Optional[str], confidence: float):
+        """Feed the next frame's prediction"""
+        if confidence < self.min_confidence:
+            prediction = None
+
+        if prediction == self.current:
+            self.run += 1
+        else:
+            self.current, self.run = prediction, 1
+
+        if self.current is not None and self.run == self.min_frames:
+            self.letters.append(self.current)
+
+    @property
+    def text(self) -> str:
+        """Letters recognized so far"""
+        return "".join(self.letters)
+
+class TranscriptWriter:
+    """Writes JSONL records in frame order while landmark batches are classified
+
+    Hands from many frames share one forward pass. With several hands per frame each record
+    lists every tracked hand, and every track gets its own transcript.
+    """
+
+    def __init__(self, predictor: SignLanguagePredictor, output, batch_size: int, max_hands: int = 1):
+        self.predictor = predictor
+        self.output = output
+        self.max_hands = max_hands
+        self.batch_size = max(batch_size, max_hands)
+        self.batch = np.empty((self.batch_size, predictor.num_features or FEATURE_SIZE), dtype=np.float32)
+        self.handedness: List[str] = []
+        self.rows = 0
+
+        # (frame_index, timestamp, first batch row, hand count, (track id, handedness) per hand) in frame order
+        self.pending: List[Tuple[int, float, int, int, Optional[list]]] = []
+        self.collapser = LetterCollapser()
+        self.hand_collapsers: Dict[int, LetterCollapser] = {}
+
+    def next_row(self) -> np.ndarray:
+        """Batch row that the next frame's landmarks are extracted into"""
+        return self.batch[self.rows]
+
+    def next_rows(self) -> np.ndarray:
+        """Batch rows that the next frame's hands (up to max_hands) are extracted into"""
+        return self.batch[self.rows:self.rows + self.max_hands]
+
+    def add(self, frame_index: int, timestamp: float, detected: bool):
+        """Queue one frame whose landmarks (if detected) were written to next_row()"""
+        self._queue(frame_index, timestamp, 1 if detected else 0, None)
+
+    def add_hands(self, frame_index: int, timestamp: float, handedness: List[str], tracks):
+        """Queue one frame whose hands were written to next_rows(), with the track of each"""
+        self.handedness.extend(handedness)
+        # Longest-tracked hand first, as in SignLanguagePredictor.recognize_hands
+        order = sorted(range(len(tracks)), key=lambda i: (-tracks[i].age, tracks[i].id))
+        hands = [(i, tracks[i].id, tracks[i].handedness) for i in order]
+        self._queue(frame_index, timestamp, len(tracks), hands)
+
+    def _queue(self, frame_index: int, timestamp: float, count: int, hands: Optional[list]):
+        self.pending.append((frame_index, timestamp, self.rows, count, hands))
+        self.rows += count
+
+        # Bound memory during long stretches without a hand as well
+        if self.rows + self.max_hands > self.batch_size or len(self.pending) >= 4 * self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Classify the queued landmarks in one forward pass and write the records"""
+        if self.rows:
+            if self.handedness:
+                features = self.predictor.hand_features(self.batch[:self.rows], self.handedness)
+                labels, confidences = self.predictor.classify_hands(features)
+            else:
+                labels, confidences = self.predictor.predict_batch(self.batch[:self.rows])
+
+        for frame_index, timestamp, first, count, hands in self.pending:
+            record = {
+                "frame": frame_index,
+                "time": round(timestamp, 3),
+                "prediction": None,
+                "confidence": 0.0,
+            }
+            if hands is None:
+                if count:
+                    record["prediction"] = str(labels[first])
+                    record["confidence"] = round(float(confidences[first]), 4)
+            else:
+                record["hands"] = []
+                for offset, track_id, handedness in hands:
+                    prediction = str(labels[first + offset])
+                    confidence = round(float(confidences[first + offset]), 4)
+                    record["hands"].append({"id": track_id, "handedness": handedness,
+                                            "prediction": prediction, "confidence": confidence})
+                    self.hand_collapsers.setdefault(track_id, LetterCollapser()).add(prediction, confidence)
+                if hands:
+                    record["prediction"] = record["hands"][0]["prediction"]
+                    record["confidence"] = record["hands"][0]["confidence"]
+
+            self.output.write(json.dumps(record) + "\n")
+            self.collapser.add(record["prediction"], record["confidence"])
+
+        self.pending.clear()
+        self.handedness.clear()
+        self.rows = 0
+
+def transcribe_video(predictor: SignLanguagePredictor, video_path: str, output_path: str,
+                     batch_size: int = 64, stride: int = 1) -> dict:
+    """Transcribe one video into a JSONL file of timestamped predictions"""
+    start = time.perf_counter()
+    frames = 0
+    max_hands = predictor.max_hands
+    hands = create_tracking_hands(max_hands)
+    tracker = HandTracker()
+
+    try:
+        with open(output_path, 'w') as output:
+            writer = TranscriptWriter(predictor, output, batch_size, max_hands)
+            for frame_index, timestamp, frame in iter_video_frames(video_path, stride):
+                if max_hands > 1:
+                    landmarks, handedness = predictor.extract_all_hands(frame, hands=hands, out=writer.next_rows())
+                    writer.add_hands(frame_index, timestamp, handedness, tracker.update(landmarks, handedness))
+                else:
+                    landmarks = predictor.extract_hand_landmarks(frame, hands=hands, out=writer.next_row())
+                    writer.add(frame_index, timestamp, landmarks is not None)
+                frames += 1
+            writer.flush()
+    finally:
+        hands.close()
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "video": video_path,
+        "output": output_path,
+        "frames": frames,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "transcript": writer.collapser.text,
+    }
+    if max_hands > 1:
+        summary["hands"] = {track_id: collapser.text for track_id, collapser in writer.hand_collapsers.items()}
+    return summary
+
+def _init_worker(model_dir: str, backend: str, precision: str = "float32", max_hands: int = 1,
+                 mirror_left: bool = False):
+    """Load one predictor per worker process"""
+    global _worker_predictor
+    _worker_predictor = SignLanguagePredictor(model_dir=model_dir, backend=backend, precision=precision,
+                                              max_hands=max_hands, mirror_left=mirror_left)
+
+    # Each video creates its own Hands instance, so only the model is warmed up here
+    _worker_predictor.warmup(detector=False)
+
+def _transcribe_in_worker(args) -> dict:
+    """Transcribe a video inside a worker process"""
+    video_path, output_path, batch_size, stride = args
+    try:
+        return transcribe_video(_worker_predictor, video_path, output_path, batch_size, stride)
+    except Exception as e:
+        return {"video": video_path, "error": str(e)}
+
+def transcribe_files(video_paths: List[str], output_dir: str, model_dir: str = "./models",
+                     backend: str = "auto", workers: int = 1, batch_size: int = 64,
+                     stride: int = 1, precision: str = "float32", max_hands: int = 1,
+                     mirror_left: bool = False) -> List[dict]:
+    """Transcribe several videos, fanning them out across a process pool"""
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [
+        (path, os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ".jsonl"), batch_size, stride)
+        for path in video_paths
+    ]
+
+    if workers <= 1 or len(jobs) < 2:
+        _init_worker(model_dir, backend, precision, max_hands, mirror_left)
+        iterator = map(_transcribe_in_worker, jobs)
+        return report(iterator, len(jobs))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(model_dir, backend, precision, max_hands, mirror_left)) as executor:
+        return report(executor.map(_transcribe_in_worker, jobs), len(jobs))
+
+def report(results, total: int) -> List[dict]:
+    """Print progress for each finished video and overall throughput"""
+    start = time.perf_counter()
+    summaries = []
+    for i, summary in enumerate(results, 1):
+        summaries.append(summary)
+        if "error" in summary:
+            print(f"[{i}/{total}] ❌ {summary['video']}: {summary['error']}")
+        else:
+            print(f"[{i}/{total}] {summary['video']}: {summary['frames']} frames at "
+                  f"{summary['fps']:.1f} frames/sec -> {summary['output']} ({summary['transcript']!r})")
+
+    elapsed = time.perf_counter() - start
+    frames = sum(s.get("frames", 0) for s in summaries)
+    print(f"\n📊 Transcribed {frames} frames from {total} video(s) in {elapsed:.1f}s "
+          f"({frames / elapsed if elapsed > 0 else 0.0:.1f} frames/sec overall)")
+    return summaries